@@ -4,11 +4,13 @@ import base64
 import json
 import os
 import re
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
-from .engine_db import COMPLAINT_TYPES, STATUS_VALUES, URGENCY_VALUES
+from .engine_db import COMPLAINT_TYPE_SET, COMPLAINT_TYPES, STATUS_VALUES, URGENCY_VALUES
 
 TYPE_KEYWORDS: List[Tuple[str, Tuple[str, ...]]] = [
     ("승강기", ("엘리베이터", "승강기", "갇힘", "멈춤")),
@@ -30,25 +32,44 @@ STATUS_KEYWORDS = {
     "처리중": ("처리중", "진행중", "출동", "확인중"),
     "이월": ("이월", "내일", "다음날"),
 }
+TYPE_KEYWORD_PATTERNS = [
+    (complaint_type, re.compile("|".join(map(re.escape, keywords)))) for complaint_type, keywords in TYPE_KEYWORDS
+]
+URGENT_KEYWORD_RE = re.compile("|".join(map(re.escape, URGENT_KEYWORDS)))
+SAME_DAY_KEYWORD_RE = re.compile("|".join(map(re.escape, SAME_DAY_KEYWORDS)))
+QUESTION_KEYWORD_RE = re.compile("|".join(map(re.escape, QUESTION_KEYWORDS)))
+STATUS_KEYWORD_PATTERNS = [
+    (status, re.compile("|".join(map(re.escape, keywords)))) for status, keywords in STATUS_KEYWORDS.items()
+]
+ISSUE_KEYWORDS = (*(keyword for _, keywords in TYPE_KEYWORDS for keyword in keywords), *URGENT_KEYWORDS, "민원", "고장", "불편")
+ISSUE_KEYWORD_RE = re.compile("|".join(map(re.escape, ISSUE_KEYWORDS)))
 MAX_CHAT_DIGEST_IMAGES = 30
+WHITESPACE_RE = re.compile(r"\s+")
+BUILDING_RE = re.compile(r"(\d{2,4})\s*동")
+UNIT_RE = re.compile(r"(\d{2,4})\s*호")
+BUILDING_UNIT_PAIR_RE = re.compile(r"(\d{2,4})[-/](\d{2,4})")
+CHAT_KOREAN_STAMP_RE = re.compile(r"^\d{4}년\s*\d{1,2}월\s*\d{1,2}일\s*(오전|오후)?\s*\d{1,2}:\d{2},?\s*")
+CHAT_NUMERIC_STAMP_RE = re.compile(r"^\d{4}[./-]\d{1,2}[./-]\d{1,2}\s+\d{1,2}:\d{2}\s*")
+CHAT_SENDER_PREFIX_RE = re.compile(r"^[^:]{1,20}\s*:\s*")
+OPEN_STATUS_VALUES = frozenset(("접수", "처리중", "이월"))
 
 
 def _collapse_space(value: Any) -> str:
-    return re.sub(r"\s+", " ", str(value or "").replace("\u0000", " ")).strip()
+    return WHITESPACE_RE.sub(" ", str(value or "").replace("\u0000", " ")).strip()
 
 
 def _extract_building_unit(text: str) -> Tuple[str, str]:
     normalized = _collapse_space(text)
     building = ""
     unit = ""
-    m = re.search(r"(\d{2,4})\s*동", normalized)
+    m = BUILDING_RE.search(normalized)
     if m:
         building = m.group(1)
-    m = re.search(r"(\d{2,4})\s*호", normalized)
+    m = UNIT_RE.search(normalized)
     if m:
         unit = m.group(1)
     if not unit:
-        m = re.search(r"(\d{2,4})[-/](\d{2,4})", normalized)
+        m = BUILDING_UNIT_PAIR_RE.search(normalized)
         if m:
             building = building or m.group(1)
             unit = m.group(2)
@@ -57,21 +78,19 @@ def _extract_building_unit(text: str) -> Tuple[str, str]:
 
 def _infer_type(text: str) -> str:
     lowered = _collapse_space(text)
-    for complaint_type, keywords in TYPE_KEYWORDS:
-        if any(keyword in lowered for keyword in keywords):
+    for complaint_type, pattern in TYPE_KEYWORD_PATTERNS:
+        if pattern.search(lowered):
             return complaint_type
     return "기타"
 
 
 def _infer_urgency(text: str, complaint_type: str) -> str:
     lowered = _collapse_space(text)
-    if complaint_type in {"승강기", "누수", "전기"} and any(keyword in lowered for keyword in URGENT_KEYWORDS):
+    if URGENT_KEYWORD_RE.search(lowered):
         return "긴급"
-    if any(keyword in lowered for keyword in URGENT_KEYWORDS):
-        return "긴급"
-    if any(keyword in lowered for keyword in QUESTION_KEYWORDS):
+    if QUESTION_KEYWORD_RE.search(lowered):
         return "단순문의"
-    if any(keyword in lowered for keyword in SAME_DAY_KEYWORDS):
+    if SAME_DAY_KEYWORD_RE.search(lowered):
         return "당일"
     return "일반"
 
@@ -121,15 +140,15 @@ def _openai_client(default_model: str = "gpt-5") -> Tuple[Any | None, str]:
     except Exception:
         return None, ""
     model = str(os.getenv("OPENAI_MODEL") or default_model).strip() or default_model
-    return OpenAI(api_key=api_key), model
+    return _shared_openai_client(OpenAI, api_key), model
 
 
-def _openai_classify(text: str) -> Dict[str, str] | None:
-    client, model = _openai_client()
-    if not client:
-        return None
-    prompt = f"""
-너는 아파트 관리사무소 민원 분류 시스템이다.
+@lru_cache(maxsize=4)
+def _shared_openai_client(client_class: Any, api_key: str) -> Any:
+    return client_class(api_key=api_key)
+
+
+OPENAI_CLASSIFY_PROMPT_PREFIX = f"""너는 아파트 관리사무소 민원 분류 시스템이다.
 반드시 JSON으로만 답하라.
 
 유형: {", ".join(COMPLAINT_TYPES)}
@@ -139,8 +158,14 @@ def _openai_classify(text: str) -> Dict[str, str] | None:
 {{"type":"","urgency":"","summary":""}}
 
 민원:
-{text}
-""".strip()
+"""
+
+
+def _openai_classify(text: str) -> Dict[str, str] | None:
+    client, model = _openai_client()
+    if not client:
+        return None
+    prompt = OPENAI_CLASSIFY_PROMPT_PREFIX + text.rstrip()
     try:
         response = client.responses.create(model=model, input=prompt)
         raw = str(getattr(response, "output_text", "") or "").strip()
@@ -150,7 +175,7 @@ def _openai_classify(text: str) -> Dict[str, str] | None:
         complaint_type = str(data.get("type") or "").strip()
         urgency = str(data.get("urgency") or "").strip()
         summary = _collapse_space(data.get("summary") or "")
-        if complaint_type not in COMPLAINT_TYPES or urgency not in URGENCY_VALUES:
+        if complaint_type not in COMPLAINT_TYPE_SET or urgency not in URGENCY_VALUES:
             return None
         return {
             "type": complaint_type,
@@ -183,8 +208,8 @@ def classify_complaint_text(text: str) -> Dict[str, str]:
 
 def _infer_status(text: str) -> str:
     normalized = _collapse_space(text)
-    for status, keywords in STATUS_KEYWORDS.items():
-        if any(keyword in normalized for keyword in keywords):
+    for status, pattern in STATUS_KEYWORD_PATTERNS:
+        if pattern.search(normalized):
             return status
     return "접수"
 
@@ -208,9 +233,9 @@ def _summary_for_report(row: Dict[str, Any]) -> str:
 
 def _normalize_chat_line(line: str) -> str:
     text = _collapse_space(line)
-    text = re.sub(r"^\d{4}년\s*\d{1,2}월\s*\d{1,2}일\s*(오전|오후)?\s*\d{1,2}:\d{2},?\s*", "", text)
-    text = re.sub(r"^\d{4}[./-]\d{1,2}[./-]\d{1,2}\s+\d{1,2}:\d{2}\s*", "", text)
-    text = re.sub(r"^[^:]{1,20}\s*:\s*", "", text)
+    text = CHAT_KOREAN_STAMP_RE.sub("", text)
+    text = CHAT_NUMERIC_STAMP_RE.sub("", text)
+    text = CHAT_SENDER_PREFIX_RE.sub("", text)
     return _collapse_space(text)
 
 
@@ -220,11 +245,7 @@ def _looks_like_issue(text: str) -> bool:
     building, unit = _extract_building_unit(text)
     if building and unit:
         return True
-    if any(keyword in text for _, keywords in TYPE_KEYWORDS for keyword in keywords):
-        return True
-    if any(keyword in text for keyword in URGENT_KEYWORDS):
-        return True
-    return "민원" in text or "고장" in text or "불편" in text
+    return ISSUE_KEYWORD_RE.search(text) is not None
 
 
 def _image_data_url(image_item: Dict[str, Any]) -> str:
@@ -236,12 +257,7 @@ def _image_data_url(image_item: Dict[str, Any]) -> str:
     return f"data:{mime};base64,{encoded}"
 
 
-def _openai_image_digest(text: str, image_inputs: List[Dict[str, Any]]) -> Tuple[List[str], List[str], str]:
-    client, model = _openai_client()
-    if not client or not image_inputs:
-        return [], [], ""
-
-    prompt = """
+CHAT_DIGEST_IMAGE_PROMPT = """
 너는 아파트 관리사무소 카카오톡 대화 정리 도우미다.
 입력으로 텍스트 대화와 카카오톡 캡처, 현장 사진이 함께 들어온다.
 
@@ -260,6 +276,14 @@ def _openai_image_digest(text: str, image_inputs: List[Dict[str, Any]]) -> Tuple
 - 불명확한 경우 추정이라고 쓰지 말고 image_notes에만 적는다.
 - 민원이 아니면 image_lines에는 넣지 않는다.
 """.strip()
+
+
+def _openai_image_digest(text: str, image_inputs: List[Dict[str, Any]]) -> Tuple[List[str], List[str], str]:
+    client, model = _openai_client()
+    if not client or not image_inputs:
+        return [], [], ""
+
+    prompt = CHAT_DIGEST_IMAGE_PROMPT
     content: List[Dict[str, Any]] = [{"type": "input_text", "text": prompt}]
     if _collapse_space(text):
         content.append({"type": "input_text", "text": f"기존 텍스트 대화:\n{text}"})
@@ -375,8 +399,9 @@ def analyze_chat_digest(text: str, image_inputs: List[Dict[str, Any]] | None = N
         rows.append(row)
 
     total = len(rows)
-    done = sum(1 for row in rows if row["status"] == "완료")
-    carry = sum(1 for row in rows if row["status"] == "이월")
+    status_counts = Counter(row["status"] for row in rows)
+    done = status_counts["완료"]
+    carry = status_counts["이월"]
     pending = total - done - carry
     urgent_rows = [row for row in rows if row["urgency"] == "긴급" and row["status"] != "완료"]
     major_rows = sorted(
@@ -388,7 +413,7 @@ def analyze_chat_digest(text: str, image_inputs: List[Dict[str, Any]] | None = N
             row["summary"],
         ),
     )[:10]
-    tomorrow_rows = [row for row in rows if row["status"] in {"접수", "처리중", "이월"}][:10]
+    tomorrow_rows = [row for row in rows if row["status"] in OPEN_STATUS_VALUES][:10]
 
     lines = [
         "📊 일일 요약",
@@ -4,6 +4,7 @@ import html
 import json
 import os
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
@@ -49,6 +50,7 @@ def _read_git_head_commit() -> str:
     return ""
 
 
+@lru_cache(maxsize=1)
 def _git_commit() -> str:
     for name in ("RENDER_GIT_COMMIT", "GIT_COMMIT", "COMMIT_SHA", "RENDER_GIT_COMMIT_SHA"):
         value = _collapse(os.getenv(name) or "")
@@ -85,6 +87,12 @@ def build_info_payload() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
+def build_info_json() -> bytes:
+    return json.dumps(build_info_payload(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+@lru_cache(maxsize=1)
 def build_info_html() -> str:
     payload = build_info_payload()
     pretty_json = json.dumps(payload, ensure_ascii=False, indent=2)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import base64
+import copy
 import hashlib
 import hmac
 import json
@@ -9,6 +10,7 @@ import re
 import secrets
 import shutil
 import sqlite3
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -19,11 +21,24 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 STORAGE_ROOT = Path(os.getenv("KA_STORAGE_ROOT") or BASE_DIR).resolve()
 DATA_DIR = STORAGE_ROOT / "data"
 DB_PATH = DATA_DIR / "ka.db"
+CONNECTION_PRAGMAS = (
+    "PRAGMA busy_timeout=30000;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA mmap_size=268435456;",
+)
+_SCHEMA_READY: set[str] = set()
+_STORAGE_READY: set[str] = set()
+TENANT_CACHE_TTL_SEC = 30.0
+_TENANT_CACHE: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+SESSION_CLEANUP_INTERVAL_SEC = 60.0
+_SESSION_CLEANUP_DUE: Dict[str, float] = {}
 
 _TENANT_ID_RE = re.compile(r"^[a-z0-9][a-z0-9_-]{1,31}$")
 _LOGIN_ID_RE = re.compile(r"^[a-z0-9._-]{2,32}$")
 _DOC_NUMBERING_DATE_MODES = {"none", "yyyymm", "yyyymmdd"}
 _DOC_NUMBERING_CATEGORY_DEFAULT_CODES = dict(DOCUMENT_CATEGORY_CODES)
+_DOC_NUMBERING_CODE_STRIP_RE = re.compile(r"[^A-Z0-9]")
 _DOC_NUMBERING_DEFAULTS = {
     "separator": "-",
     "date_mode": "yyyymmdd",
@@ -33,10 +48,18 @@ _DOC_NUMBERING_DEFAULTS = {
 
 
 def now_iso() -> str:
-    return datetime.now().replace(microsecond=0).isoformat(sep=" ")
+    return time.strftime("%Y-%m-%d %H:%M:%S")
 
 
 def _prepare_storage_root() -> None:
+    storage_key = str(DB_PATH)
+    if storage_key in _STORAGE_READY:
+        return
+    _migrate_storage_root()
+    _STORAGE_READY.add(storage_key)
+
+
+def _migrate_storage_root() -> None:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     Path(DB_PATH).parent.mkdir(parents=True, exist_ok=True)
     if STORAGE_ROOT == BASE_DIR:
@@ -56,18 +79,23 @@ def _prepare_storage_root() -> None:
         shutil.copytree(legacy_uploads, target_uploads, dirs_exist_ok=True)
 
 
-def _connect() -> sqlite3.Connection:
-    _prepare_storage_root()
-    con = sqlite3.connect(str(DB_PATH), timeout=30.0)
+def _open_connection(path: Path) -> sqlite3.Connection:
+    con = sqlite3.connect(str(path), timeout=30.0)
     con.row_factory = sqlite3.Row
     con.execute("PRAGMA foreign_keys=ON;")
     try:
-        con.execute("PRAGMA busy_timeout=30000;")
+        for pragma in CONNECTION_PRAGMAS:
+            con.execute(pragma)
     except Exception:
         pass
     return con
 
 
+def _connect() -> sqlite3.Connection:
+    _prepare_storage_root()
+    return _open_connection(DB_PATH)
+
+
 def _b64u_encode(value: bytes) -> str:
     return base64.urlsafe_b64encode(value).decode("ascii").rstrip("=")
 
@@ -119,7 +147,7 @@ def _clean_text(value: Any, max_len: int) -> str | None:
 
 
 def default_document_numbering_config() -> Dict[str, Any]:
-    return json.loads(json.dumps(_DOC_NUMBERING_DEFAULTS, ensure_ascii=False))
+    return {**_DOC_NUMBERING_DEFAULTS, "category_codes": dict(_DOC_NUMBERING_CATEGORY_DEFAULT_CODES)}
 
 
 def normalize_document_numbering_config(value: Any) -> Dict[str, Any]:
@@ -133,6 +161,8 @@ def normalize_document_numbering_config(value: Any) -> Dict[str, Any]:
         raw = dict(value)
     else:
         raw = {}
+    if not raw:
+        return default_document_numbering_config()
 
     separator = str(raw.get("separator") or _DOC_NUMBERING_DEFAULTS["separator"]).strip()
     if len(separator) > 2 or any(ch.isalnum() for ch in separator):
@@ -149,11 +179,11 @@ def normalize_document_numbering_config(value: Any) -> Dict[str, Any]:
     sequence_digits = max(2, min(6, sequence_digits))
 
     raw_codes = raw.get("category_codes") or raw.get("codes") or {}
-    codes: Dict[str, str] = {}
-    for category, default_code in _DOC_NUMBERING_CATEGORY_DEFAULT_CODES.items():
-        candidate = str((raw_codes or {}).get(category) or default_code).strip().upper()
-        candidate = re.sub(r"[^A-Z0-9]", "", candidate)[:8] or default_code
-        codes[category] = candidate
+    codes = {
+        category: _DOC_NUMBERING_CODE_STRIP_RE.sub("", str(raw_codes.get(category) or default_code).strip().upper())[:8]
+        or default_code
+        for category, default_code in _DOC_NUMBERING_CATEGORY_DEFAULT_CODES.items()
+    }
 
     return {
         "separator": separator,
@@ -163,14 +193,68 @@ def normalize_document_numbering_config(value: Any) -> Dict[str, Any]:
     }
 
 
-def _ensure_column(con: sqlite3.Connection, table: str, column: str, ddl: str) -> None:
+def _table_columns(con: sqlite3.Connection, table: str) -> set[str]:
     rows = con.execute(f"PRAGMA table_info({table})").fetchall()
-    names = {str(row["name"]) for row in rows}
-    if column not in names:
-        con.execute(f"ALTER TABLE {table} ADD COLUMN {ddl}")
+    return {str(row["name"]) for row in rows}
+
+
+def _ensure_columns(con: sqlite3.Connection, table: str, columns: Dict[str, str]) -> None:
+    names = _table_columns(con, table)
+    for column, ddl in columns.items():
+        if column not in names:
+            con.execute(f"ALTER TABLE {table} ADD COLUMN {ddl}")
+            names.add(column)
+
+
+def _ensure_column(con: sqlite3.Connection, table: str, column: str, ddl: str) -> None:
+    _ensure_columns(con, table, {column: ddl})
+
+
+def _escape_like(value: str) -> str:
+    return str(value or "").replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _ensure_trigram_index(con: sqlite3.Connection, table: str, columns: Tuple[str, ...]) -> bool:
+    fts_table = f"{table}_fts"
+    objects = (fts_table, f"trg_{fts_table}_insert", f"trg_{fts_table}_delete", f"trg_{fts_table}_update")
+    placeholders = ",".join("?" for _ in objects)
+    existing = con.execute(f"SELECT COUNT(*) FROM sqlite_master WHERE name IN ({placeholders})", objects).fetchone()
+    if int(existing[0] or 0) == len(objects):
+        return True
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    try:
+        con.executescript(
+            f"""
+            BEGIN;
+            CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table}
+            USING fts5({column_list}, content='{table}', content_rowid='id', tokenize='trigram');
+            CREATE TRIGGER IF NOT EXISTS trg_{fts_table}_insert AFTER INSERT ON {table} BEGIN
+              INSERT INTO {fts_table}(rowid, {column_list}) VALUES (new.id, {new_values});
+            END;
+            CREATE TRIGGER IF NOT EXISTS trg_{fts_table}_delete AFTER DELETE ON {table} BEGIN
+              INSERT INTO {fts_table}({fts_table}, rowid, {column_list}) VALUES ('delete', old.id, {old_values});
+            END;
+            CREATE TRIGGER IF NOT EXISTS trg_{fts_table}_update AFTER UPDATE OF {column_list} ON {table} BEGIN
+              INSERT INTO {fts_table}({fts_table}, rowid, {column_list}) VALUES ('delete', old.id, {old_values});
+              INSERT INTO {fts_table}(rowid, {column_list}) VALUES (new.id, {new_values});
+            END;
+            INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild');
+            COMMIT;
+            """
+        )
+    except sqlite3.OperationalError:
+        if con.in_transaction:
+            con.rollback()
+        return False
+    return True
 
 
 def _ensure_schema(con: sqlite3.Connection) -> None:
+    schema_key = str(DB_PATH)
+    if schema_key in _SCHEMA_READY:
+        return
     con.executescript(
         """
         CREATE TABLE IF NOT EXISTS sites (
@@ -279,17 +363,24 @@ def _ensure_schema(con: sqlite3.Connection) -> None:
         CREATE INDEX IF NOT EXISTS idx_auth_sessions_token ON auth_sessions(token_hash);
         CREATE INDEX IF NOT EXISTS idx_usage_logs_tenant_date ON usage_logs(tenant_id, created_at DESC);
         CREATE INDEX IF NOT EXISTS idx_audit_logs_tenant_date ON audit_logs(tenant_id, created_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_usage_logs_tenant_id ON usage_logs(tenant_id, id DESC);
+        CREATE INDEX IF NOT EXISTS idx_audit_logs_tenant_id ON audit_logs(tenant_id, id DESC);
         CREATE INDEX IF NOT EXISTS idx_work_report_feedback_tenant_date ON work_report_image_feedback(tenant_id, created_at DESC);
         CREATE INDEX IF NOT EXISTS idx_work_report_feedback_tenant_target ON work_report_image_feedback(tenant_id, to_item_title, created_at DESC);
         """
     )
     _ensure_column(con, "staff_users", "tenant_id", "tenant_id TEXT REFERENCES tenants(id) ON DELETE SET NULL")
     _ensure_column(con, "tenants", "ops_document_numbering_json", "ops_document_numbering_json TEXT")
+    _SCHEMA_READY.add(schema_key)
 
 
 def init_db() -> None:
     con = _connect()
     try:
+        try:
+            con.execute("PRAGMA journal_mode=WAL;")
+        except Exception:
+            pass
         _ensure_schema(con)
         con.commit()
     finally:
@@ -382,6 +473,10 @@ def _tenant_row(con: sqlite3.Connection, tenant_id: str) -> Optional[sqlite3.Row
     ).fetchone()
 
 
+def _forget_cached_tenant(tenant_id: str) -> None:
+    _TENANT_CACHE.pop((str(DB_PATH), str(tenant_id or "").strip().lower()), None)
+
+
 def create_tenant(
     *,
     tenant_id: str,
@@ -420,6 +515,7 @@ def create_tenant(
         if clean_site_code or clean_site_name:
             _ensure_site(con, site_code=clean_site_code, site_name=clean_site_name)
         con.commit()
+        _forget_cached_tenant(clean_tenant_id)
         row = _tenant_row(con, clean_tenant_id)
         out = dict(row) if row else {"id": clean_tenant_id, "name": clean_name}
         out["ops_document_numbering"] = normalize_document_numbering_config(out.pop("ops_document_numbering_json", None))
@@ -563,6 +659,7 @@ def ensure_bootstrap_tenant(
         if clean_site_code or clean_site_name:
             _ensure_site(con, site_code=clean_site_code, site_name=clean_site_name)
         con.commit()
+        _forget_cached_tenant(clean_tenant_id)
         fresh = _tenant_row(con, clean_tenant_id)
         out = dict(fresh) if fresh else {"id": clean_tenant_id, "name": clean_name}
         out["ops_document_numbering"] = normalize_document_numbering_config(out.pop("ops_document_numbering_json", None))
@@ -755,6 +852,10 @@ def list_tenants(*, active_only: bool = False) -> List[Dict[str, Any]]:
 
 
 def get_tenant(tenant_id: str) -> Optional[Dict[str, Any]]:
+    cache_key = (str(DB_PATH), _clean_tenant_id(tenant_id))
+    cached = _TENANT_CACHE.get(cache_key)
+    if cached and cached[0] > time.monotonic():
+        return copy.deepcopy(cached[1])
     con = _connect()
     try:
         _ensure_schema(con)
@@ -763,7 +864,8 @@ def get_tenant(tenant_id: str) -> Optional[Dict[str, Any]]:
             return None
         item = dict(row)
         item["ops_document_numbering"] = normalize_document_numbering_config(item.pop("ops_document_numbering_json", None))
-        return item
+        _TENANT_CACHE[cache_key] = (time.monotonic() + TENANT_CACHE_TTL_SEC, item)
+        return copy.deepcopy(item)
     finally:
         con.close()
 
@@ -781,6 +883,7 @@ def rotate_tenant_api_key(tenant_id: str) -> Dict[str, Any]:
         if cur.rowcount <= 0:
             raise ValueError("tenant not found")
         con.commit()
+        _forget_cached_tenant(clean_tenant_id)
         row = _tenant_row(con, clean_tenant_id)
         out = dict(row) if row else {"id": clean_tenant_id}
         out["ops_document_numbering"] = normalize_document_numbering_config(out.pop("ops_document_numbering_json", None))
@@ -803,6 +906,7 @@ def set_tenant_status(tenant_id: str, status: str) -> bool:
             (clean_status, now_iso(), clean_tenant_id),
         )
         con.commit()
+        _forget_cached_tenant(clean_tenant_id)
         return cur.rowcount > 0
     finally:
         con.close()
@@ -860,24 +964,59 @@ def update_tenant_document_numbering_config(tenant_id: str, config: Dict[str, An
         if cur.rowcount <= 0:
             raise ValueError("tenant not found")
         con.commit()
+        _forget_cached_tenant(clean_tenant_id)
         return normalized
     finally:
         con.close()
 
 
 def mark_tenant_used(tenant_id: str) -> None:
+    clean_tenant_id = _clean_tenant_id(tenant_id)
     con = _connect()
     try:
         _ensure_schema(con)
         con.execute(
             "UPDATE tenants SET last_used_at=?, updated_at=? WHERE id=?",
-            (now_iso(), now_iso(), _clean_tenant_id(tenant_id)),
+            (now_iso(), now_iso(), clean_tenant_id),
         )
         con.commit()
     finally:
         con.close()
 
 
+def _insert_usage_log(con: sqlite3.Connection, tenant_id: str, api_name: str, count: int, ts: str) -> None:
+    con.execute(
+        """
+        INSERT INTO usage_logs(tenant_id, api_name, count, created_at)
+        VALUES(?,?,?,?)
+        """,
+        (_clean_tenant_id(tenant_id), api_name[:120], max(1, int(count)), ts),
+    )
+
+
+def _insert_audit_log(
+    con: sqlite3.Connection,
+    tenant_id: Optional[str],
+    action: str,
+    actor: str,
+    data: Optional[Dict[str, Any]],
+    ts: str,
+) -> None:
+    con.execute(
+        """
+        INSERT INTO audit_logs(tenant_id, action, actor, data_json, created_at)
+        VALUES(?,?,?,?,?)
+        """,
+        (
+            _clean_tenant_id(tenant_id) if tenant_id else None,
+            action[:120],
+            str(actor or "").strip()[:120] or None,
+            json.dumps(data or {}, ensure_ascii=False, separators=(",", ":")),
+            ts,
+        ),
+    )
+
+
 def log_usage(tenant_id: str, api_name: str, *, count: int = 1) -> None:
     clean_api_name = str(api_name or "").strip()
     if not clean_api_name:
@@ -885,13 +1024,7 @@ def log_usage(tenant_id: str, api_name: str, *, count: int = 1) -> None:
     con = _connect()
     try:
         _ensure_schema(con)
-        con.execute(
-            """
-            INSERT INTO usage_logs(tenant_id, api_name, count, created_at)
-            VALUES(?,?,?,?)
-            """,
-            (_clean_tenant_id(tenant_id), clean_api_name[:120], max(1, int(count)), now_iso()),
-        )
+        _insert_usage_log(con, tenant_id, clean_api_name, count, now_iso())
         con.commit()
     finally:
         con.close()
@@ -901,23 +1034,28 @@ def append_audit_log(tenant_id: Optional[str], action: str, actor: str, data: Op
     clean_action = str(action or "").strip()
     if not clean_action:
         return
-    payload = json.dumps(data or {}, ensure_ascii=False, separators=(",", ":"))
     con = _connect()
     try:
         _ensure_schema(con)
-        con.execute(
-            """
-            INSERT INTO audit_logs(tenant_id, action, actor, data_json, created_at)
-            VALUES(?,?,?,?,?)
-            """,
-            (
-                _clean_tenant_id(tenant_id) if tenant_id else None,
-                clean_action[:120],
-                str(actor or "").strip()[:120] or None,
-                payload,
-                now_iso(),
-            ),
-        )
+        _insert_audit_log(con, tenant_id, clean_action, actor, data, now_iso())
+        con.commit()
+    finally:
+        con.close()
+
+
+def log_activity(tenant_id: str, api_name: str, action: str, actor: str, data: Optional[Dict[str, Any]] = None) -> None:
+    clean_api_name = str(api_name or "").strip()
+    clean_action = str(action or "").strip()
+    if not clean_api_name and not clean_action:
+        return
+    con = _connect()
+    try:
+        _ensure_schema(con)
+        ts = now_iso()
+        if clean_api_name:
+            _insert_usage_log(con, tenant_id, clean_api_name, 1, ts)
+        if clean_action:
+            _insert_audit_log(con, tenant_id, clean_action, actor, data, ts)
         con.commit()
     finally:
         con.close()
@@ -1018,8 +1156,7 @@ def list_usage_logs(*, tenant_id: str = "", limit: int = 100) -> List[Dict[str,
             params.append(_clean_tenant_id(clean_tenant_id))
         sql += " ORDER BY id DESC LIMIT ?"
         params.append(lim)
-        rows = con.execute(sql, tuple(params)).fetchall()
-        return [dict(row) for row in rows]
+        return [dict(row) for row in con.execute(sql, tuple(params))]
     finally:
         con.close()
 
@@ -1040,24 +1177,27 @@ def list_audit_logs(*, tenant_id: str = "", limit: int = 100) -> List[Dict[str,
             params.append(_clean_tenant_id(clean_tenant_id))
         sql += " ORDER BY id DESC LIMIT ?"
         params.append(lim)
-        rows = con.execute(sql, tuple(params)).fetchall()
-        return [dict(row) for row in rows]
+        return [dict(row) for row in con.execute(sql, tuple(params))]
     finally:
         con.close()
 
 
+_WORK_REPORT_FEEDBACK_COLUMNS = """
+  id, tenant_id, job_id, actor, feedback_type, image_index, filename,
+  from_item_index, from_item_title, to_item_index, to_item_title,
+  from_stage, to_stage, review_reason, review_confidence, candidate_items_json,
+  report_title, period_label, analysis_model, analysis_reason, created_at
+"""
+
+
 def list_work_report_image_feedback(*, tenant_id: str, limit: int = 100) -> List[Dict[str, Any]]:
     con = _connect()
     try:
         _ensure_schema(con)
         lim = max(1, min(1000, int(limit)))
         rows = con.execute(
-            """
-            SELECT
-              id, tenant_id, job_id, actor, feedback_type, image_index, filename,
-              from_item_index, from_item_title, to_item_index, to_item_title,
-              from_stage, to_stage, review_reason, review_confidence, candidate_items_json,
-              report_title, period_label, analysis_model, analysis_reason, created_at
+            f"""
+            SELECT {_WORK_REPORT_FEEDBACK_COLUMNS}
             FROM work_report_image_feedback
             WHERE tenant_id=?
             ORDER BY id DESC
@@ -1070,6 +1210,36 @@ def list_work_report_image_feedback(*, tenant_id: str, limit: int = 100) -> List
         con.close()
 
 
+def list_work_report_image_feedback_by_tenant(*, tenant_ids: List[str], limit: int = 100) -> Dict[str, List[Dict[str, Any]]]:
+    clean_tenant_ids = list(dict.fromkeys(_clean_tenant_id(tenant_id) for tenant_id in tenant_ids))
+    grouped: Dict[str, List[Dict[str, Any]]] = {tenant_id: [] for tenant_id in clean_tenant_ids}
+    if not clean_tenant_ids:
+        return grouped
+    con = _connect()
+    try:
+        _ensure_schema(con)
+        lim = max(1, min(1000, int(limit)))
+        placeholders = ",".join("?" for _ in clean_tenant_ids)
+        rows = con.execute(
+            f"""
+            SELECT {_WORK_REPORT_FEEDBACK_COLUMNS}
+            FROM (
+              SELECT {_WORK_REPORT_FEEDBACK_COLUMNS}, ROW_NUMBER() OVER (PARTITION BY tenant_id ORDER BY id DESC) AS rank_no
+              FROM work_report_image_feedback
+              WHERE tenant_id IN ({placeholders})
+            )
+            WHERE rank_no<=?
+            ORDER BY tenant_id ASC, id DESC
+            """,
+            (*clean_tenant_ids, lim),
+        )
+        for row in rows:
+            grouped[row["tenant_id"]].append(dict(row))
+        return grouped
+    finally:
+        con.close()
+
+
 def list_work_report_image_feedback_stats(*, tenant_id: str = "") -> List[Dict[str, Any]]:
     con = _connect()
     try:
@@ -1084,8 +1254,7 @@ def list_work_report_image_feedback_stats(*, tenant_id: str = "") -> List[Dict[s
             sql += " WHERE tenant_id=?"
             params.append(_clean_tenant_id(clean_tenant_id))
         sql += " GROUP BY tenant_id ORDER BY tenant_id ASC"
-        rows = con.execute(sql, tuple(params)).fetchall()
-        return [dict(row) for row in rows]
+        return [dict(row) for row in con.execute(sql, tuple(params))]
     finally:
         con.close()
 
@@ -1261,8 +1430,7 @@ def list_staff_users(*, active_only: bool = False, tenant_id: str = "") -> List[
             sql += " AND tenant_id=?"
             params.append(_clean_tenant_id(clean_tenant_id))
         sql += " ORDER BY is_admin DESC, is_site_admin DESC, name ASC, id ASC"
-        rows = con.execute(sql, tuple(params)).fetchall()
-        return [dict(row) for row in rows]
+        return [dict(row) for row in con.execute(sql, tuple(params))]
     finally:
         con.close()
 
@@ -1607,6 +1775,10 @@ def get_auth_user_by_token(token: str) -> Optional[Dict[str, Any]]:
 
 
 def cleanup_expired_sessions() -> int:
+    cleanup_key = str(DB_PATH)
+    if _SESSION_CLEANUP_DUE.get(cleanup_key, 0.0) > time.monotonic():
+        return 0
+    _SESSION_CLEANUP_DUE[cleanup_key] = time.monotonic() + SESSION_CLEANUP_INTERVAL_SEC
     con = _connect()
     try:
         _ensure_schema(con)
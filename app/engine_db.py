@@ -1,27 +1,25 @@
 from __future__ import annotations
 
 import sqlite3
-from datetime import date
+from datetime import date, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
-from .db import DB_PATH, now_iso
+from .db import DB_PATH, _ensure_columns, _ensure_trigram_index, _escape_like, _open_connection, now_iso
 
 COMPLAINT_TYPES = ("주차", "소음", "승강기", "전기", "수도", "누수", "시설", "미화", "경비", "관리비", "기타")
+COMPLAINT_TYPE_SET = frozenset(COMPLAINT_TYPES)
 URGENCY_VALUES = ("긴급", "당일", "일반", "단순문의")
 STATUS_VALUES = ("접수", "처리중", "완료", "이월")
 CHANNEL_VALUES = ("전화", "카톡", "방문", "앱", "기타")
 MAX_ATTACHMENTS_PER_COMPLAINT = 6
+COMPLAINT_SEARCH_COLUMNS = ("building", "unit", "content", "summary", "manager")
+COMPLAINT_SEARCH_MIN_FTS_LENGTH = 3
+_SCHEMA_READY: set[str] = set()
+_COMPLAINT_SEARCH_READY: set[str] = set()
 
 
 def _connect() -> sqlite3.Connection:
-    con = sqlite3.connect(str(DB_PATH), timeout=30.0)
-    con.row_factory = sqlite3.Row
-    con.execute("PRAGMA foreign_keys=ON;")
-    try:
-        con.execute("PRAGMA busy_timeout=30000;")
-    except Exception:
-        pass
-    return con
+    return _open_connection(DB_PATH)
 
 
 def _clean_text(value: Any, *, field: str, required: bool, max_len: int) -> str:
@@ -42,14 +40,10 @@ def _clean_choice(value: Any, allowed: Tuple[str, ...], *, field: str, default:
     return text
 
 
-def _ensure_column(con: sqlite3.Connection, table: str, column: str, ddl: str) -> None:
-    rows = con.execute(f"PRAGMA table_info({table})").fetchall()
-    names = {str(row["name"]) for row in rows}
-    if column not in names:
-        con.execute(f"ALTER TABLE {table} ADD COLUMN {ddl}")
-
-
 def _ensure_schema(con: sqlite3.Connection) -> None:
+    schema_key = str(DB_PATH)
+    if schema_key in _SCHEMA_READY:
+        return
     con.executescript(
         """
         CREATE TABLE IF NOT EXISTS complaints (
@@ -103,13 +97,22 @@ def _ensure_schema(con: sqlite3.Connection) -> None:
           ON complaints(tenant_id, status, created_at DESC);
         CREATE INDEX IF NOT EXISTS idx_engine_complaints_tenant_type
           ON complaints(tenant_id, type, created_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_engine_complaints_tenant_location
+          ON complaints(tenant_id, building, unit, type);
         CREATE INDEX IF NOT EXISTS idx_engine_history_complaint
           ON complaint_history(complaint_id, id ASC);
         CREATE INDEX IF NOT EXISTS idx_engine_attachments_complaint
           ON complaint_attachments(complaint_id, id ASC);
         """
     )
-    _ensure_column(con, "complaints", "complainant_phone", "complainant_phone TEXT")
+    _ensure_columns(con, "complaints", {"complainant_phone": "complainant_phone TEXT"})
+    if _ensure_trigram_index(con, "complaints", COMPLAINT_SEARCH_COLUMNS):
+        _COMPLAINT_SEARCH_READY.add(schema_key)
+    _SCHEMA_READY.add(schema_key)
+
+
+def _complaint_search_ready() -> bool:
+    return str(DB_PATH) in _COMPLAINT_SEARCH_READY
 
 
 def init_engine_db() -> None:
@@ -164,6 +167,21 @@ def _detail(con: sqlite3.Connection, complaint_id: int, tenant_id: str) -> Dict[
     return item
 
 
+def _complaint_state(con: sqlite3.Connection, complaint_id: int, tenant_id: str) -> sqlite3.Row:
+    row = con.execute(
+        """
+        SELECT id, summary, type, urgency, status, manager
+        FROM complaints
+        WHERE id=? AND tenant_id=?
+        LIMIT 1
+        """,
+        (int(complaint_id), str(tenant_id or "").strip().lower()),
+    ).fetchone()
+    if not row:
+        raise ValueError("complaint not found")
+    return row
+
+
 def _insert_history(
     con: sqlite3.Connection,
     *,
@@ -197,22 +215,15 @@ def _repeat_count(
     unit: str,
     complaint_type: str,
 ) -> int:
-    row = con.execute(
-        """
-        SELECT COUNT(*) AS c
-        FROM complaints
-        WHERE tenant_id=?
-          AND COALESCE(building,'')=?
-          AND COALESCE(unit,'')=?
-          AND type=?
-        """,
-        (
-            str(tenant_id or "").strip().lower(),
-            str(building or "").strip(),
-            str(unit or "").strip(),
-            str(complaint_type or "").strip(),
-        ),
-    ).fetchone()
+    sql = "SELECT COUNT(*) AS c FROM complaints WHERE tenant_id=? AND type=?"
+    params: List[Any] = [str(tenant_id or "").strip().lower(), str(complaint_type or "").strip()]
+    for column, value in (("building", str(building or "").strip()), ("unit", str(unit or "").strip())):
+        if value:
+            sql += f" AND {column}=?"
+            params.append(value)
+        else:
+            sql += f" AND ({column} IS NULL OR {column}='')"
+    row = con.execute(sql, tuple(params)).fetchone()
     return int(row["c"] if row else 0)
 
 
@@ -342,8 +353,12 @@ def add_attachment(
     con = _connect()
     try:
         _ensure_schema(con)
-        detail = _detail(con, int(complaint_id), clean_tenant_id)
-        if len(detail.get("attachments") or []) >= MAX_ATTACHMENTS_PER_COMPLAINT:
+        _complaint_state(con, int(complaint_id), clean_tenant_id)
+        attachment_count = con.execute(
+            "SELECT COUNT(*) AS c FROM complaint_attachments WHERE complaint_id=?",
+            (int(complaint_id),),
+        ).fetchone()["c"]
+        if int(attachment_count or 0) >= MAX_ATTACHMENTS_PER_COMPLAINT:
             raise ValueError(f"attachments limit exceeded: max {MAX_ATTACHMENTS_PER_COMPLAINT}")
         ts = now_iso()
         cur = con.execute(
@@ -387,7 +402,7 @@ def delete_attachments(
     con = _connect()
     try:
         _ensure_schema(con)
-        _detail(con, int(complaint_id), clean_tenant_id)
+        _complaint_state(con, int(complaint_id), clean_tenant_id)
         rows = _attachment_rows(con, int(complaint_id))
         if delete_all:
             target_rows = rows
@@ -396,11 +411,13 @@ def delete_attachments(
             target_rows = [row for row in rows if int(row.get("id") or 0) in wanted]
         if not target_rows:
             raise ValueError("attachment not found")
-        con.executemany(
-            "DELETE FROM complaint_attachments WHERE id=? AND complaint_id=?",
-            [(int(row["id"]), int(complaint_id)) for row in target_rows],
+        target_ids = {int(row["id"]) for row in target_rows}
+        placeholders = ",".join("?" for _ in target_ids)
+        con.execute(
+            f"DELETE FROM complaint_attachments WHERE complaint_id=? AND id IN ({placeholders})",
+            (int(complaint_id), *target_ids),
         )
-        remaining = _attachment_rows(con, int(complaint_id))
+        remaining = [row for row in rows if int(row["id"]) not in target_ids]
         primary_image = str(remaining[0]["file_url"]) if remaining else None
         con.execute(
             """
@@ -443,12 +460,14 @@ def list_complaints(
     building: str = "",
     unit: str = "",
     complaint_type: str = "",
+    query: str = "",
     limit: int = 100,
     offset: int = 0,
 ) -> List[Dict[str, Any]]:
     clean_tenant_id = str(tenant_id or "").strip().lower()
     if not clean_tenant_id:
         raise ValueError("tenant_id is required")
+    clean_query = _clean_text(query, field="query", required=False, max_len=160)
     con = _connect()
     try:
         _ensure_schema(con)
@@ -467,21 +486,27 @@ def list_complaints(
             params.append(clean_status)
         clean_building = str(building or "").strip()
         if clean_building:
-            sql += " AND COALESCE(building,'')=?"
+            sql += " AND building=?"
             params.append(clean_building)
         clean_unit = str(unit or "").strip()
         if clean_unit:
-            sql += " AND COALESCE(unit,'')=?"
+            sql += " AND unit=?"
             params.append(clean_unit)
         clean_type = str(complaint_type or "").strip()
         if clean_type:
             clean_type = _clean_choice(clean_type, COMPLAINT_TYPES, field="type")
             sql += " AND type=?"
             params.append(clean_type)
+        if clean_query and len(clean_query) >= COMPLAINT_SEARCH_MIN_FTS_LENGTH and _complaint_search_ready():
+            sql += " AND id IN (SELECT rowid FROM complaints_fts WHERE complaints_fts MATCH ?)"
+            params.append('"' + clean_query.replace('"', '""') + '"')
+        elif clean_query:
+            escaped_query = f"%{_escape_like(clean_query)}%"
+            sql += " AND (" + " OR ".join(f"{column} LIKE ? ESCAPE '\\'" for column in COMPLAINT_SEARCH_COLUMNS) + ")"
+            params.extend([escaped_query] * len(COMPLAINT_SEARCH_COLUMNS))
         sql += " ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?"
         params.extend([max(1, min(500, int(limit))), max(0, int(offset))])
-        rows = con.execute(sql, tuple(params)).fetchall()
-        return [dict(row) for row in rows]
+        return [dict(row) for row in con.execute(sql, tuple(params))]
     finally:
         con.close()
 
@@ -522,11 +547,11 @@ def update_complaint(
     con = _connect()
     try:
         _ensure_schema(con)
-        current = _detail(con, int(complaint_id), clean_tenant_id)
-        next_manager = clean_manager if clean_manager is not None else current.get("manager")
-        next_summary = clean_summary if clean_summary is not None else current.get("summary")
-        next_type = clean_type or str(current.get("type") or "")
-        next_urgency = clean_urgency or str(current.get("urgency") or "")
+        current = _complaint_state(con, int(complaint_id), clean_tenant_id)
+        next_manager = clean_manager if clean_manager is not None else current["manager"]
+        next_summary = clean_summary if clean_summary is not None else current["summary"]
+        next_type = clean_type or str(current["type"] or "")
+        next_urgency = clean_urgency or str(current["urgency"] or "")
         closed_at = now_iso() if clean_status == "완료" else None
         con.execute(
             """
@@ -549,7 +574,7 @@ def update_complaint(
         _insert_history(
             con,
             complaint_id=int(complaint_id),
-            from_status=str(current.get("status") or ""),
+            from_status=str(current["status"] or ""),
             to_status=clean_status,
             actor_label=clean_actor,
             note=clean_note or "",
@@ -566,40 +591,24 @@ def dashboard_summary(*, tenant_id: str, target_day: str = "") -> Dict[str, Any]
         raise ValueError("tenant_id is required")
     target = date.fromisoformat(target_day) if str(target_day or "").strip() else date.today()
     day_text = target.isoformat()
+    next_day_text = (target + timedelta(days=1)).isoformat()
     con = _connect()
     try:
         _ensure_schema(con)
-        total_row = con.execute(
-            """
-            SELECT COUNT(*) AS c
-            FROM complaints
-            WHERE tenant_id=? AND date(created_at)=?
-            """,
-            (clean_tenant_id, day_text),
-        ).fetchone()
-        done_row = con.execute(
-            """
-            SELECT COUNT(*) AS c
-            FROM complaints
-            WHERE tenant_id=? AND date(created_at)=? AND status='완료'
-            """,
-            (clean_tenant_id, day_text),
-        ).fetchone()
-        pending_row = con.execute(
-            """
-            SELECT COUNT(*) AS c
-            FROM complaints
-            WHERE tenant_id=? AND status IN ('접수','처리중','이월')
-            """,
-            (clean_tenant_id,),
-        ).fetchone()
-        carry_row = con.execute(
+        counts = con.execute(
             """
-            SELECT COUNT(*) AS c
+            SELECT
+              COALESCE(SUM(CASE WHEN created_at>=? AND created_at<? THEN 1 ELSE 0 END), 0) AS today_total,
+              COALESCE(SUM(CASE WHEN created_at>=? AND created_at<? AND status='완료' THEN 1 ELSE 0 END), 0) AS today_done,
+              COALESCE(SUM(CASE WHEN status IN ('접수','처리중','이월') THEN 1 ELSE 0 END), 0) AS pending_total,
+              COALESCE(
+                SUM(CASE WHEN created_at<? AND status IN ('접수','처리중','이월') THEN 1 ELSE 0 END),
+                0
+              ) AS carry_total
             FROM complaints
-            WHERE tenant_id=? AND date(created_at)<? AND status IN ('접수','처리중','이월')
+            WHERE tenant_id=?
             """,
-            (clean_tenant_id, day_text),
+            (day_text, next_day_text, day_text, next_day_text, day_text, clean_tenant_id),
         ).fetchone()
         urgent_items = [
             dict(r)
@@ -620,11 +629,11 @@ def dashboard_summary(*, tenant_id: str, target_day: str = "") -> Dict[str, Any]
                 """
                 SELECT type, COUNT(*) AS count
                 FROM complaints
-                WHERE tenant_id=? AND date(created_at)=?
+                WHERE tenant_id=? AND created_at>=? AND created_at<?
                 GROUP BY type
                 ORDER BY count DESC, type ASC
                 """,
-                (clean_tenant_id, day_text),
+                (clean_tenant_id, day_text, next_day_text),
             ).fetchall()
         ]
         pending_top = [
@@ -671,10 +680,10 @@ def dashboard_summary(*, tenant_id: str, target_day: str = "") -> Dict[str, Any]
         ]
         return {
             "target_day": day_text,
-            "today_total": int(total_row["c"] if total_row else 0),
-            "today_done": int(done_row["c"] if done_row else 0),
-            "pending_total": int(pending_row["c"] if pending_row else 0),
-            "carry_total": int(carry_row["c"] if carry_row else 0),
+            "today_total": int(counts["today_total"] if counts else 0),
+            "today_done": int(counts["today_done"] if counts else 0),
+            "pending_total": int(counts["pending_total"] if counts else 0),
+            "carry_total": int(counts["carry_total"] if counts else 0),
             "urgent_items": urgent_items,
             "type_counts": type_counts,
             "pending_top5": pending_top,
@@ -691,6 +700,7 @@ def generate_daily_report(*, tenant_id: str, target_day: str = "") -> Dict[str,
         raise ValueError("tenant_id is required")
     target = date.fromisoformat(target_day) if str(target_day or "").strip() else date.today()
     day_text = target.isoformat()
+    next_day_text = (target + timedelta(days=1)).isoformat()
     con = _connect()
     try:
         _ensure_schema(con)
@@ -702,10 +712,10 @@ def generate_daily_report(*, tenant_id: str, target_day: str = "") -> Dict[str,
                   id, building, unit, complainant_phone, channel, content, summary, type, urgency, status,
                   manager, image_url, repeat_count, created_at, updated_at
                 FROM complaints
-                WHERE tenant_id=? AND date(created_at)=?
+                WHERE tenant_id=? AND created_at>=? AND created_at<?
                 ORDER BY created_at DESC, id DESC
                 """,
-                (clean_tenant_id, day_text),
+                (clean_tenant_id, day_text, next_day_text),
             ).fetchall()
         ]
         total = len(rows)
@@ -714,7 +724,7 @@ def generate_daily_report(*, tenant_id: str, target_day: str = "") -> Dict[str,
             """
             SELECT COUNT(*) AS c
             FROM complaints
-            WHERE tenant_id=? AND date(created_at)<? AND status IN ('접수','처리중','이월')
+            WHERE tenant_id=? AND created_at<? AND status IN ('접수','처리중','이월')
             """,
             (clean_tenant_id, day_text),
         ).fetchone()
@@ -5,7 +5,7 @@ import sqlite3
 from datetime import date, datetime, timedelta
 from typing import Any, Dict, List, Optional, Sequence
 
-from .db import DB_PATH, now_iso
+from .db import DB_PATH, _ensure_columns, _ensure_trigram_index, _escape_like, _open_connection, now_iso
 
 ASSET_CATEGORY_VALUES = ("승강기", "전기", "기계", "소방", "건축", "미화", "보안", "공용부", "기타")
 ASSET_LIFECYCLE_VALUES = ("운영중", "점검중", "중지", "폐기")
@@ -15,17 +15,14 @@ WORK_ORDER_CATEGORY_VALUES = ("점검후속", "고장수리", "예방정비", "
 WORK_ORDER_PRIORITY_VALUES = ("낮음", "보통", "높음", "긴급")
 WORK_ORDER_STATUS_VALUES = ("접수", "진행중", "완료", "보류")
 MAX_ASSET_IMAGE_COUNT = 3
+ASSET_SEARCH_COLUMNS = ("asset_code", "asset_name", "location_name", "vendor_name", "qr_id", "checklist_key", "note")
+ASSET_SEARCH_MIN_FTS_LENGTH = 3
+_SCHEMA_READY: set[str] = set()
+_ASSET_SEARCH_READY: set[str] = set()
 
 
 def _connect() -> sqlite3.Connection:
-    con = sqlite3.connect(str(DB_PATH), timeout=30.0)
-    con.row_factory = sqlite3.Row
-    con.execute("PRAGMA foreign_keys=ON;")
-    try:
-        con.execute("PRAGMA busy_timeout=30000;")
-    except Exception:
-        pass
-    return con
+    return _open_connection(DB_PATH)
 
 
 def _clean_text(value: Any, *, field: str, required: bool = False, max_len: int = 4000) -> str:
@@ -57,10 +54,6 @@ def _clean_int(value: Any, *, field: str, default: int, minimum: int = 1, maximu
     return parsed
 
 
-def _escape_like(value: str) -> str:
-    return str(value or "").replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-
-
 def _clean_date(value: Any, *, field: str, required: bool = False) -> str:
     raw = str(value or "").strip()
     if not raw:
@@ -127,13 +120,6 @@ def _normalize_items(value: Any) -> List[str]:
     return items
 
 
-def _ensure_column(con: sqlite3.Connection, table: str, column: str, ddl: str) -> None:
-    rows = con.execute(f"PRAGMA table_info({table})").fetchall()
-    names = {str(row["name"]) for row in rows}
-    if column not in names:
-        con.execute(f"ALTER TABLE {table} ADD COLUMN {ddl}")
-
-
 def _calc_next_inspection_date(inspected_at: str, cycle_days: int) -> str:
     raw = str(inspected_at or "").strip()
     if not raw:
@@ -193,6 +179,9 @@ def _sync_asset_after_inspection(
 
 
 def _ensure_schema(con: sqlite3.Connection) -> None:
+    schema_key = str(DB_PATH)
+    if schema_key in _SCHEMA_READY:
+        return
     con.executescript(
         """
         CREATE TABLE IF NOT EXISTS facility_assets (
@@ -310,89 +299,164 @@ def _ensure_schema(con: sqlite3.Connection) -> None:
 
         CREATE INDEX IF NOT EXISTS idx_facility_assets_tenant
           ON facility_assets(tenant_id, category, lifecycle_state, asset_name ASC, id DESC);
+        CREATE INDEX IF NOT EXISTS idx_facility_assets_tenant_next_due
+          ON facility_assets(tenant_id, next_inspection_date ASC, id DESC);
         CREATE INDEX IF NOT EXISTS idx_facility_checklists_tenant
           ON facility_checklists(tenant_id, lifecycle_state, task_type, title ASC, id DESC);
+        CREATE INDEX IF NOT EXISTS idx_facility_checklists_tenant_updated
+          ON facility_checklists(tenant_id, updated_at DESC, id DESC);
         CREATE INDEX IF NOT EXISTS idx_facility_qr_assets_tenant
           ON facility_qr_assets(tenant_id, lifecycle_state, qr_id, id DESC);
         CREATE INDEX IF NOT EXISTS idx_facility_inspections_tenant
           ON facility_inspections(tenant_id, inspected_at DESC, id DESC);
+        CREATE INDEX IF NOT EXISTS idx_facility_inspections_tenant_status
+          ON facility_inspections(tenant_id, result_status, inspected_at DESC, id DESC);
         CREATE INDEX IF NOT EXISTS idx_facility_work_orders_tenant
           ON facility_work_orders(tenant_id, status, priority, due_date ASC, id DESC);
+        CREATE INDEX IF NOT EXISTS idx_facility_work_orders_inspection
+          ON facility_work_orders(tenant_id, inspection_id, id DESC);
         CREATE INDEX IF NOT EXISTS idx_facility_asset_images_asset
           ON facility_asset_images(tenant_id, asset_id, is_primary DESC, sort_order ASC, id ASC);
         """
     )
-    _ensure_column(con, "facility_assets", "vendor_name", "vendor_name TEXT")
-    _ensure_column(con, "facility_assets", "installed_on", "installed_on TEXT")
-    _ensure_column(con, "facility_assets", "inspection_cycle_days", "inspection_cycle_days INTEGER NOT NULL DEFAULT 30")
-    _ensure_column(con, "facility_assets", "last_result_status", "last_result_status TEXT")
-    _ensure_column(con, "facility_assets", "image_url", "image_url TEXT")
-    _ensure_column(con, "facility_assets", "image_mime_type", "image_mime_type TEXT")
-    _ensure_column(con, "facility_assets", "image_size_bytes", "image_size_bytes INTEGER NOT NULL DEFAULT 0")
-    _ensure_column(con, "facility_work_orders", "complaint_id", "complaint_id INTEGER")
+    _ensure_columns(
+        con,
+        "facility_assets",
+        {
+            "vendor_name": "vendor_name TEXT",
+            "installed_on": "installed_on TEXT",
+            "inspection_cycle_days": "inspection_cycle_days INTEGER NOT NULL DEFAULT 30",
+            "last_result_status": "last_result_status TEXT",
+            "image_url": "image_url TEXT",
+            "image_mime_type": "image_mime_type TEXT",
+            "image_size_bytes": "image_size_bytes INTEGER NOT NULL DEFAULT 0",
+        },
+    )
+    _ensure_columns(con, "facility_work_orders", {"complaint_id": "complaint_id INTEGER"})
     con.execute(
         """
         CREATE INDEX IF NOT EXISTS idx_facility_work_orders_complaint
           ON facility_work_orders(tenant_id, complaint_id, id DESC)
         """
     )
+    asset_search_ready = _ensure_trigram_index(con, "facility_assets", ASSET_SEARCH_COLUMNS)
     _migrate_legacy_asset_images(con)
+    con.commit()
+    if asset_search_ready:
+        _ASSET_SEARCH_READY.add(schema_key)
+    _SCHEMA_READY.add(schema_key)
+
+
+def _asset_search_ready() -> bool:
+    return str(DB_PATH) in _ASSET_SEARCH_READY
+
+
+def _rank_asset_images(
+    con: sqlite3.Connection,
+    *,
+    asset_filter: str,
+    params: Sequence[Any],
+    updated_at: str,
+    primary_image_id: Optional[int] = None,
+) -> None:
+    con.execute(
+        f"""
+        WITH ranked AS (
+          SELECT
+            id,
+            ROW_NUMBER() OVER (
+              PARTITION BY tenant_id, asset_id
+              ORDER BY
+                CASE id WHEN ? THEN 0 ELSE 1 END,
+                CASE is_primary WHEN 1 THEN 0 ELSE 1 END,
+                sort_order ASC,
+                id ASC
+            ) - 1 AS position
+          FROM facility_asset_images
+          WHERE {asset_filter}
+        )
+        UPDATE facility_asset_images
+        SET is_primary=CASE ranked.position WHEN 0 THEN 1 ELSE 0 END,
+            sort_order=ranked.position,
+            updated_at=?
+        FROM ranked
+        WHERE facility_asset_images.id=ranked.id
+        """,
+        (int(primary_image_id or 0), *params, updated_at),
+    )
 
 
 def _migrate_legacy_asset_images(con: sqlite3.Connection) -> None:
-    legacy_rows = con.execute(
-        """
-        SELECT id, tenant_id, image_url, image_mime_type, image_size_bytes, created_at, updated_at
-        FROM facility_assets
-        WHERE COALESCE(image_url, '') <> ''
-        """
-    ).fetchall()
-    touched_assets = set()
-    for row in legacy_rows:
-        tenant_id = str(row["tenant_id"] or "").strip().lower()
-        asset_id = int(row["id"])
-        image_url = str(row["image_url"] or "").strip()
-        if not tenant_id or not image_url:
-            continue
-        exists = con.execute(
-            """
-            SELECT id
-            FROM facility_asset_images
-            WHERE tenant_id=? AND asset_id=? AND file_url=?
-            LIMIT 1
-            """,
-            (tenant_id, asset_id, image_url),
-        ).fetchone()
-        if exists:
-            continue
-        touched_assets.add((tenant_id, asset_id))
-        ts = str(row["updated_at"] or row["created_at"] or now_iso())
-        con.execute(
-            """
-            INSERT INTO facility_asset_images(
-              tenant_id, asset_id, file_url, mime_type, size_bytes, is_primary, sort_order, created_at, updated_at
-            )
-            VALUES(?,?,?,?,?,?,?,?,?)
-            """,
-            (
-                tenant_id,
-                asset_id,
-                image_url,
-                str(row["image_mime_type"] or "").strip(),
-                max(0, int(row["image_size_bytes"] or 0)),
-                1,
-                0,
-                str(row["created_at"] or ts),
-                ts,
-            ),
+    pending_filter = """
+        FROM facility_assets a
+        WHERE a.image_url <> ''
+          AND a.tenant_id <> ''
+          AND NOT EXISTS (
+            SELECT 1
+            FROM facility_asset_images i
+            WHERE i.tenant_id=a.tenant_id AND i.asset_id=a.id AND i.file_url=a.image_url
+          )
+    """
+    touched_assets = con.execute(f"SELECT a.tenant_id, a.id {pending_filter}").fetchall()
+    if not touched_assets:
+        return
+    ts = now_iso()
+    con.execute(
+        f"""
+        INSERT INTO facility_asset_images(
+          tenant_id, asset_id, file_url, mime_type, size_bytes, is_primary, sort_order, created_at, updated_at
         )
-    for tenant_id, asset_id in touched_assets:
-        _normalize_asset_images(con, tenant_id=tenant_id, asset_id=asset_id)
+        SELECT
+          a.tenant_id,
+          a.id,
+          a.image_url,
+          COALESCE(a.image_mime_type, ''),
+          MAX(0, COALESCE(a.image_size_bytes, 0)),
+          1,
+          0,
+          COALESCE(NULLIF(a.created_at, ''), NULLIF(a.updated_at, ''), ?),
+          COALESCE(NULLIF(a.updated_at, ''), NULLIF(a.created_at, ''), ?)
+        {pending_filter}
+        """,
+        (ts, ts),
+    )
+    touched_ids = json.dumps([int(row["id"]) for row in touched_assets])
+    _rank_asset_images(
+        con,
+        asset_filter="asset_id IN (SELECT value FROM json_each(?))",
+        params=(touched_ids,),
+        updated_at=ts,
+    )
+    con.execute(
+        """
+        UPDATE facility_assets
+        SET image_url=i.file_url,
+            image_mime_type=COALESCE(i.mime_type, ''),
+            image_size_bytes=MAX(0, i.size_bytes),
+            updated_at=?
+        FROM facility_asset_images i
+        WHERE i.asset_id=facility_assets.id
+          AND i.tenant_id=facility_assets.tenant_id
+          AND i.is_primary=1
+          AND facility_assets.id IN (SELECT value FROM json_each(?))
+        """,
+        (ts, touched_ids),
+    )
 
 
-def _asset_images(con: sqlite3.Connection, *, tenant_id: str, asset_id: int) -> List[Dict[str, Any]]:
+def _asset_images_by_asset(
+    con: sqlite3.Connection,
+    *,
+    tenant_id: str,
+    asset_ids: Sequence[int],
+) -> Dict[int, List[Dict[str, Any]]]:
+    clean_asset_ids = sorted({int(asset_id) for asset_id in asset_ids if asset_id})
+    grouped: Dict[int, List[Dict[str, Any]]] = {asset_id: [] for asset_id in clean_asset_ids}
+    if not clean_asset_ids:
+        return grouped
+    placeholders = ",".join("?" for _ in clean_asset_ids)
     rows = con.execute(
-        """
+        f"""
         SELECT
           id, tenant_id, asset_id,
           file_url,
@@ -406,15 +470,22 @@ def _asset_images(con: sqlite3.Connection, *, tenant_id: str, asset_id: int) ->
           created_at,
           updated_at
         FROM facility_asset_images
-        WHERE tenant_id=? AND asset_id=?
+        WHERE tenant_id=? AND asset_id IN ({placeholders})
         ORDER BY
+          asset_id ASC,
           CASE is_primary WHEN 1 THEN 0 ELSE 1 END,
           sort_order ASC,
           id ASC
         """,
-        (str(tenant_id or "").strip().lower(), int(asset_id)),
-    ).fetchall()
-    return [dict(row) for row in rows]
+        (str(tenant_id or "").strip().lower(), *clean_asset_ids),
+    )
+    for row in rows:
+        grouped[int(row["asset_id"])].append(dict(row))
+    return grouped
+
+
+def _asset_images(con: sqlite3.Connection, *, tenant_id: str, asset_id: int) -> List[Dict[str, Any]]:
+    return _asset_images_by_asset(con, tenant_id=tenant_id, asset_ids=[int(asset_id)]).get(int(asset_id), [])
 
 
 def _primary_asset_image(images: Sequence[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
@@ -457,50 +528,29 @@ def _normalize_asset_images(
     primary_image_id: Optional[int] = None,
 ) -> None:
     clean_tenant_id = str(tenant_id or "").strip().lower()
-    rows = con.execute(
+    ts = now_iso()
+    _rank_asset_images(
+        con,
+        asset_filter="tenant_id=? AND asset_id=?",
+        params=(clean_tenant_id, int(asset_id)),
+        updated_at=ts,
+        primary_image_id=primary_image_id,
+    )
+    primary_row = con.execute(
         """
-        SELECT id, is_primary, sort_order
+        SELECT file_url AS image_url, mime_type AS image_mime_type, size_bytes AS image_size_bytes
         FROM facility_asset_images
-        WHERE tenant_id=? AND asset_id=?
-        ORDER BY
-          CASE is_primary WHEN 1 THEN 0 ELSE 1 END,
-          sort_order ASC,
-          id ASC
+        WHERE tenant_id=? AND asset_id=? AND is_primary=1
+        ORDER BY sort_order ASC, id ASC
+        LIMIT 1
         """,
         (clean_tenant_id, int(asset_id)),
-    ).fetchall()
-    ts = now_iso()
-    if not rows:
-        _sync_asset_primary_columns(con, tenant_id=clean_tenant_id, asset_id=int(asset_id), primary_image=None, updated_at=ts)
-        return
-    requested_primary_id = int(primary_image_id) if primary_image_id else 0
-    primary_id = requested_primary_id if requested_primary_id and any(int(row["id"]) == requested_primary_id for row in rows) else next(
-        (int(row["id"]) for row in rows if int(row["is_primary"] or 0) == 1),
-        int(rows[0]["id"]),
-    )
-    ordered_ids = [primary_id, *[int(row["id"]) for row in rows if int(row["id"]) != primary_id]]
-    for sort_order, image_id in enumerate(ordered_ids):
-        con.execute(
-            """
-            UPDATE facility_asset_images
-            SET is_primary=?, sort_order=?, updated_at=?
-            WHERE id=? AND tenant_id=? AND asset_id=?
-            """,
-            (
-                1 if image_id == primary_id else 0,
-                sort_order,
-                ts,
-                image_id,
-                clean_tenant_id,
-                int(asset_id),
-            ),
-        )
-    images = _asset_images(con, tenant_id=clean_tenant_id, asset_id=int(asset_id))
+    ).fetchone()
     _sync_asset_primary_columns(
         con,
         tenant_id=clean_tenant_id,
         asset_id=int(asset_id),
-        primary_image=_primary_asset_image(images),
+        primary_image=dict(primary_row) if primary_row else None,
         updated_at=ts,
     )
 
@@ -509,6 +559,10 @@ def _attach_asset_images(con: sqlite3.Connection, item: Dict[str, Any]) -> Dict[
     clean_tenant_id = str(item.get("tenant_id") or "").strip().lower()
     asset_id = int(item.get("id") or 0)
     images = _asset_images(con, tenant_id=clean_tenant_id, asset_id=asset_id) if asset_id else []
+    return _apply_asset_images(item, images)
+
+
+def _apply_asset_images(item: Dict[str, Any], images: List[Dict[str, Any]]) -> Dict[str, Any]:
     primary_image = _primary_asset_image(images)
     item["images"] = images
     item["image_url"] = str((primary_image or {}).get("image_url") or "")
@@ -740,24 +794,19 @@ def list_assets(
         clauses.append("lifecycle_state=?")
         params.append(_clean_choice(lifecycle_state, ASSET_LIFECYCLE_VALUES, field="lifecycle_state", default="운영중"))
     clean_query = _clean_text(query, field="query", max_len=160)
-    if clean_query:
-        escaped_query = f"%{_escape_like(clean_query)}%"
-        clauses.append(
-            """(
-              COALESCE(asset_code, '') LIKE ? ESCAPE '\\'
-              OR COALESCE(asset_name, '') LIKE ? ESCAPE '\\'
-              OR COALESCE(location_name, '') LIKE ? ESCAPE '\\'
-              OR COALESCE(vendor_name, '') LIKE ? ESCAPE '\\'
-              OR COALESCE(qr_id, '') LIKE ? ESCAPE '\\'
-              OR COALESCE(checklist_key, '') LIKE ? ESCAPE '\\'
-              OR COALESCE(note, '') LIKE ? ESCAPE '\\'
-            )"""
-        )
-        params.extend([escaped_query] * 7)
-    params.append(max(1, min(int(limit), 500)))
     con = _connect()
     try:
         _ensure_schema(con)
+        if clean_query and len(clean_query) >= ASSET_SEARCH_MIN_FTS_LENGTH and _asset_search_ready():
+            clauses.append("id IN (SELECT rowid FROM facility_assets_fts WHERE facility_assets_fts MATCH ?)")
+            params.append('"' + clean_query.replace('"', '""') + '"')
+        elif clean_query:
+            escaped_query = f"%{_escape_like(clean_query)}%"
+            clauses.append(
+                "(" + " OR ".join(f"{column} LIKE ? ESCAPE '\\'" for column in ASSET_SEARCH_COLUMNS) + ")"
+            )
+            params.extend([escaped_query] * len(ASSET_SEARCH_COLUMNS))
+        params.append(max(1, min(int(limit), 500)))
         rows = con.execute(
             f"""
             SELECT
@@ -778,7 +827,13 @@ def list_assets(
             """,
             tuple(params),
         ).fetchall()
-        return [_attach_asset_images(con, dict(row)) for row in rows]
+        items = [dict(row) for row in rows]
+        images_by_asset = _asset_images_by_asset(
+            con,
+            tenant_id=clean_tenant_id,
+            asset_ids=[int(item["id"]) for item in items],
+        )
+        return [_apply_asset_images(item, images_by_asset.get(int(item["id"]), [])) for item in items]
     finally:
         con.close()
 
@@ -872,8 +927,7 @@ def set_asset_image(
     con = _connect()
     try:
         _ensure_schema(con)
-        _asset_detail(con, int(asset_id), clean_tenant_id)
-        images = _asset_images(con, tenant_id=clean_tenant_id, asset_id=int(asset_id))
+        images = _asset_detail(con, int(asset_id), clean_tenant_id)["images"]
         primary_image = _primary_asset_image(images)
         if primary_image:
             con.execute(
@@ -928,8 +982,7 @@ def add_asset_image(
     con = _connect()
     try:
         _ensure_schema(con)
-        _asset_detail(con, int(asset_id), clean_tenant_id)
-        images = _asset_images(con, tenant_id=clean_tenant_id, asset_id=int(asset_id))
+        images = _asset_detail(con, int(asset_id), clean_tenant_id)["images"]
         if len(images) >= MAX_ASSET_IMAGE_COUNT:
             raise ValueError(f"자산 이미지는 대표 이미지를 포함해 최대 {MAX_ASSET_IMAGE_COUNT}장까지 등록할 수 있습니다.")
         ts = now_iso()
@@ -964,7 +1017,7 @@ def add_asset_image(
                 con,
                 tenant_id=clean_tenant_id,
                 asset_id=int(asset_id),
-                primary_image=_primary_asset_image(_asset_images(con, tenant_id=clean_tenant_id, asset_id=int(asset_id))),
+                primary_image=_primary_asset_image(images),
                 updated_at=ts,
             )
         con.commit()
@@ -1015,8 +1068,7 @@ def clear_asset_image(*, tenant_id: str, asset_id: int) -> Dict[str, Any]:
     con = _connect()
     try:
         _ensure_schema(con)
-        _asset_detail(con, int(asset_id), clean_tenant_id)
-        primary_image = _primary_asset_image(_asset_images(con, tenant_id=clean_tenant_id, asset_id=int(asset_id)))
+        primary_image = _primary_asset_image(_asset_detail(con, int(asset_id), clean_tenant_id)["images"])
         if primary_image:
             con.execute(
                 "DELETE FROM facility_asset_images WHERE id=? AND tenant_id=? AND asset_id=?",
@@ -1067,21 +1119,12 @@ def delete_asset_image(*, tenant_id: str, asset_id: int, image_id: int) -> Dict[
     try:
         _ensure_schema(con)
         _asset_detail(con, int(asset_id), clean_tenant_id)
-        row = con.execute(
-            """
-            SELECT id
-            FROM facility_asset_images
-            WHERE tenant_id=? AND asset_id=? AND id=?
-            LIMIT 1
-            """,
-            (clean_tenant_id, int(asset_id), int(image_id)),
-        ).fetchone()
-        if not row:
-            raise ValueError("asset image not found")
-        con.execute(
+        cur = con.execute(
             "DELETE FROM facility_asset_images WHERE tenant_id=? AND asset_id=? AND id=?",
             (clean_tenant_id, int(asset_id), int(image_id)),
         )
+        if cur.rowcount < 1:
+            raise ValueError("asset image not found")
         _normalize_asset_images(con, tenant_id=clean_tenant_id, asset_id=int(asset_id))
         con.commit()
         return _asset_detail(con, int(asset_id), clean_tenant_id)
@@ -1549,14 +1592,19 @@ def update_inspection(
                 clean_tenant_id,
             ),
         )
-        _sync_asset_after_inspection(
-            con,
-            tenant_id=clean_tenant_id,
-            asset_id=next_asset_id,
-            inspected_at=next_inspected_at,
-            result_status=next_result_status,
-            updated_at=ts,
-        )
+        if (next_asset_id, next_inspected_at, next_result_status) != (
+            current["asset_id"],
+            current["inspected_at"],
+            current["result_status"],
+        ):
+            _sync_asset_after_inspection(
+                con,
+                tenant_id=clean_tenant_id,
+                asset_id=next_asset_id,
+                inspected_at=next_inspected_at,
+                result_status=next_result_status,
+                updated_at=ts,
+            )
         con.commit()
         return _inspection_detail(con, int(inspection_id), clean_tenant_id)
     finally:
@@ -1822,7 +1870,9 @@ def facility_dashboard_summary(*, tenant_id: str) -> Dict[str, Any]:
     clean_tenant_id = _clean_text(tenant_id, field="tenant_id", required=True, max_len=32).lower()
     today = date.today().isoformat()
     next_month = (date.today() + timedelta(days=30)).isoformat()
-    month_prefix = date.today().strftime("%Y-%m")
+    first_day = date.today().replace(day=1)
+    month_prefix = first_day.strftime("%Y-%m")
+    next_month_prefix = (first_day + timedelta(days=32)).strftime("%Y-%m")
     con = _connect()
     try:
         _ensure_schema(con)
@@ -1839,8 +1889,8 @@ def facility_dashboard_summary(*, tenant_id: str) -> Dict[str, Any]:
             (clean_tenant_id,),
         ).fetchone()
         month_inspections = con.execute(
-            "SELECT COUNT(*) AS c FROM facility_inspections WHERE tenant_id=? AND substr(inspected_at,1,7)=?",
-            (clean_tenant_id, month_prefix),
+            "SELECT COUNT(*) AS c FROM facility_inspections WHERE tenant_id=? AND inspected_at>=? AND inspected_at<?",
+            (clean_tenant_id, month_prefix, next_month_prefix),
         ).fetchone()
         due_assets = [
             dict(row)
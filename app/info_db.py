@@ -3,7 +3,7 @@ from __future__ import annotations
 import sqlite3
 from typing import Any, Dict, List, Optional
 
-from .db import DB_PATH, list_staff_users, now_iso
+from .db import DB_PATH, _open_connection, list_staff_users, now_iso
 from .facility_db import list_assets
 from .ops_db import list_vendors
 
@@ -11,17 +11,11 @@ BUILDING_USAGE_VALUES = ("아파트동", "상가동", "관리동", "부속동",
 BUILDING_STATUS_VALUES = ("운영중", "휴관", "폐쇄")
 REGISTRATION_TYPE_VALUES = ("사업자등록", "보험", "면허", "법정등록", "계약등록", "기타")
 REGISTRATION_STATUS_VALUES = ("유효", "만료예정", "만료", "보류")
+_SCHEMA_READY: set[str] = set()
 
 
 def _connect() -> sqlite3.Connection:
-    con = sqlite3.connect(str(DB_PATH), timeout=30.0)
-    con.row_factory = sqlite3.Row
-    con.execute("PRAGMA foreign_keys=ON;")
-    try:
-        con.execute("PRAGMA busy_timeout=30000;")
-    except Exception:
-        pass
-    return con
+    return _open_connection(DB_PATH)
 
 
 def _clean_text(value: Any, *, field: str, required: bool = False, max_len: int = 4000) -> str:
@@ -63,6 +57,9 @@ def _clean_date(value: Any, *, field: str) -> str:
 
 
 def _ensure_schema(con: sqlite3.Connection) -> None:
+    schema_key = str(DB_PATH)
+    if schema_key in _SCHEMA_READY:
+        return
     con.executescript(
         """
         CREATE TABLE IF NOT EXISTS info_buildings (
@@ -100,10 +97,13 @@ def _ensure_schema(con: sqlite3.Connection) -> None:
 
         CREATE INDEX IF NOT EXISTS idx_info_buildings_tenant
           ON info_buildings(tenant_id, usage_type, status, building_code ASC, id DESC);
+        CREATE INDEX IF NOT EXISTS idx_info_buildings_tenant_code
+          ON info_buildings(tenant_id, building_code ASC, id DESC);
         CREATE INDEX IF NOT EXISTS idx_info_registrations_tenant
           ON info_registrations(tenant_id, record_type, status, expires_on ASC, id DESC);
         """
     )
+    _SCHEMA_READY.add(schema_key)
 
 
 def init_info_db() -> None:
@@ -223,8 +223,7 @@ def list_buildings(*, tenant_id: str, usage_type: str = "", status: str = "", li
             params.append(_clean_choice(status, BUILDING_STATUS_VALUES, field="status", default="운영중"))
         sql += " ORDER BY building_code ASC, id DESC LIMIT ?"
         params.append(max(1, min(500, int(limit))))
-        rows = con.execute(sql, tuple(params)).fetchall()
-        return [dict(row) for row in rows]
+        return [dict(row) for row in con.execute(sql, tuple(params))]
     finally:
         con.close()
 
@@ -363,8 +362,7 @@ def list_registrations(*, tenant_id: str, record_type: str = "", status: str = "
             params.append(_clean_choice(status, REGISTRATION_STATUS_VALUES, field="status", default="유효"))
         sql += " ORDER BY CASE WHEN expires_on IS NULL OR expires_on='' THEN 1 ELSE 0 END, expires_on ASC, id DESC LIMIT ?"
         params.append(max(1, min(500, int(limit))))
-        rows = con.execute(sql, tuple(params)).fetchall()
-        return [dict(row) for row in rows]
+        return [dict(row) for row in con.execute(sql, tuple(params))]
     finally:
         con.close()
 
@@ -431,18 +429,31 @@ def info_dashboard_summary(*, tenant_id: str) -> Dict[str, Any]:
     buildings = list_buildings(tenant_id=clean_tenant_id, limit=5)
     registrations = list_registrations(tenant_id=clean_tenant_id, limit=5)
     vendors = list_vendors(tenant_id=clean_tenant_id, limit=5)
-    staff = list_staff_users(tenant_id=clean_tenant_id, active_only=False)[:5]
+    staff_rows = list_staff_users(tenant_id=clean_tenant_id, active_only=False)
     assets = list_assets(tenant_id=clean_tenant_id, limit=5)
+    con = _connect()
+    try:
+        counts = con.execute(
+            """
+            SELECT
+              (SELECT COUNT(*) FROM ops_vendors WHERE tenant_id=?) AS vendor_count,
+              (SELECT COUNT(*) FROM facility_assets WHERE tenant_id=?) AS asset_count,
+              (SELECT COUNT(*) FROM info_buildings WHERE tenant_id=?) AS building_count,
+              (SELECT COUNT(*) FROM info_registrations WHERE tenant_id=?) AS registration_count
+            """,
+            (clean_tenant_id, clean_tenant_id, clean_tenant_id, clean_tenant_id),
+        ).fetchone()
+    finally:
+        con.close()
     return {
-        "vendor_count": len(list_vendors(tenant_id=clean_tenant_id, limit=500)),
-        "staff_count": len(list_staff_users(tenant_id=clean_tenant_id, active_only=False)),
-        "asset_count": len(list_assets(tenant_id=clean_tenant_id, limit=500)),
-        "building_count": len(list_buildings(tenant_id=clean_tenant_id, limit=500)),
-        "registration_count": len(list_registrations(tenant_id=clean_tenant_id, limit=500)),
+        "vendor_count": int(counts["vendor_count"] or 0),
+        "staff_count": len(staff_rows),
+        "asset_count": int(counts["asset_count"] or 0),
+        "building_count": int(counts["building_count"] or 0),
+        "registration_count": int(counts["registration_count"] or 0),
         "recent_vendors": vendors,
-        "recent_staff": staff,
+        "recent_staff": staff_rows[:5],
         "recent_assets": assets,
         "recent_buildings": buildings,
         "recent_registrations": registrations,
     }
-
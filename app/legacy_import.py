@@ -4,7 +4,7 @@ import csv
 import json
 import sqlite3
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Collection, Dict, List, Optional, Set, Tuple
 
 from . import db as core_db
 from .ai_service import classify_complaint_text, normalize_summary_text
@@ -12,9 +12,8 @@ from .db import (
     hash_password,
     now_iso,
 )
-from .engine_db import COMPLAINT_TYPES, STATUS_VALUES, URGENCY_VALUES
+from .engine_db import COMPLAINT_TYPE_SET, STATUS_VALUES, URGENCY_VALUES
 from .ops_db import (
-    DOCUMENT_CATEGORY_VALUES,
     DOCUMENT_STATUS_VALUES,
     NOTICE_CATEGORY_VALUES,
     NOTICE_STATUS_VALUES,
@@ -22,6 +21,7 @@ from .ops_db import (
     SCHEDULE_TYPE_VALUES,
     VENDOR_STATUS_VALUES,
 )
+from .ops_document_catalog import DOCUMENT_CATEGORY_VALUE_SET
 
 LEGACY_TABLE_ALIASES: Dict[str, tuple[str, ...]] = {
     "users": ("staff_users", "users", "employees", "legacy_users", "admin_users"),
@@ -72,6 +72,9 @@ FIELD_ALIASES: Dict[str, tuple[str, ...]] = {
     "vendor_name": ("vendor_name", "company_name", "vendor"),
     "vendor_service_type": ("vendor_service_type", "service_type"),
 }
+FIELD_ALIAS_KEYS: Dict[str, tuple[str, ...]] = {
+    field: tuple(alias.lower() for alias in aliases) for field, aliases in FIELD_ALIASES.items()
+}
 
 ROLE_MAP = {
     "desk": "desk",
@@ -193,10 +196,7 @@ BOOL_TRUE = {"1", "true", "yes", "y", "on", "활성", "사용", "예"}
 
 
 def _connect() -> sqlite3.Connection:
-    con = sqlite3.connect(str(core_db.DB_PATH), timeout=30.0)
-    con.row_factory = sqlite3.Row
-    con.execute("PRAGMA foreign_keys=ON;")
-    return con
+    return core_db._open_connection(core_db.DB_PATH)
 
 
 def _clean_text(value: Any, max_len: int = 4000) -> str:
@@ -204,12 +204,14 @@ def _clean_text(value: Any, max_len: int = 4000) -> str:
     return text[:max_len]
 
 
+def _lowered_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {str(key).strip().lower(): value for key, value in row.items()}
+
+
 def _pick(row: Dict[str, Any], field: str, default: Any = "") -> Any:
-    aliases = FIELD_ALIASES.get(field, (field,))
-    lowered = {str(key).strip().lower(): value for key, value in row.items()}
-    for alias in aliases:
-        if alias.lower() in lowered:
-            return lowered[alias.lower()]
+    for alias in FIELD_ALIAS_KEYS.get(field) or (field.lower(),):
+        if alias in row:
+            return row[alias]
     return default
 
 
@@ -217,7 +219,7 @@ def _truthy(value: Any) -> bool:
     return str(value or "").strip().lower() in BOOL_TRUE
 
 
-def _normalize_choice(value: Any, *, allowed: Iterable[str], mapping: Optional[Dict[str, str]] = None, default: str) -> str:
+def _normalize_choice(value: Any, *, allowed: Collection[str], mapping: Optional[Dict[str, str]] = None, default: str) -> str:
     raw = str(value or "").strip()
     if not raw:
         return default
@@ -242,7 +244,19 @@ def _normalize_timestamp(value: Any) -> str:
 
 def _read_csv_rows(path: Path) -> List[Dict[str, Any]]:
     with path.open("r", encoding="utf-8-sig", newline="") as handle:
-        return list(csv.DictReader(handle))
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if not header:
+            return []
+        width = len(header)
+        rows: List[Dict[str, Any]] = []
+        for values in reader:
+            if not values:
+                continue
+            if len(values) < width:
+                values = [*values, *([None] * (width - len(values)))]
+            rows.append(dict(zip(header, values)))
+        return rows
 
 
 def _read_json_bundle(path: Path) -> Dict[str, Any]:
@@ -253,6 +267,24 @@ def _read_json_bundle(path: Path) -> Dict[str, Any]:
     return data
 
 
+def _json_source_bundle(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "tenant": data.get("tenant") or {},
+        "users": list(data.get("users") or []),
+        "complaints": list(data.get("complaints") or []),
+        "notices": list(data.get("notices") or []),
+        "documents": list(data.get("documents") or []),
+        "vendors": list(data.get("vendors") or []),
+        "schedules": list(data.get("schedules") or []),
+        "facility_assets": list(data.get("facility_assets") or []),
+        "facility_qr_assets": list(data.get("facility_qr_assets") or []),
+        "facility_checklists": list(data.get("facility_checklists") or []),
+        "facility_inspections": list(data.get("facility_inspections") or []),
+        "facility_work_orders": list(data.get("facility_work_orders") or []),
+        "audit_logs": list(data.get("audit_logs") or []),
+    }
+
+
 def _sqlite_rows(path: Path, table_names: tuple[str, ...]) -> List[Dict[str, Any]]:
     con = sqlite3.connect(str(path))
     con.row_factory = sqlite3.Row
@@ -260,8 +292,7 @@ def _sqlite_rows(path: Path, table_names: tuple[str, ...]) -> List[Dict[str, Any
         names = {str(row[0]) for row in con.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()}
         for table_name in table_names:
             if table_name in names:
-                rows = con.execute(f"SELECT * FROM {table_name}").fetchall()
-                return [dict(row) for row in rows]
+                return [dict(row) for row in con.execute(f"SELECT * FROM {table_name}")]
         return []
     finally:
         con.close()
@@ -307,7 +338,7 @@ def _sqlite_complaint_rows(con: sqlite3.Connection) -> List[Dict[str, Any]]:
             FROM complaint_attachments
             ORDER BY complaint_id ASC, id ASC
             """
-        ).fetchall():
+        ):
             complaint_id = int(row["complaint_id"] or 0)
             if complaint_id <= 0:
                 continue
@@ -333,7 +364,7 @@ def _sqlite_complaint_rows(con: sqlite3.Connection) -> List[Dict[str, Any]]:
             FROM complaint_events
             ORDER BY complaint_id ASC, id ASC
             """
-        ).fetchall():
+        ):
             complaint_id = int(row["complaint_id"] or 0)
             if complaint_id <= 0:
                 continue
@@ -348,7 +379,7 @@ def _sqlite_complaint_rows(con: sqlite3.Connection) -> List[Dict[str, Any]]:
             )
 
     rows: List[Dict[str, Any]] = []
-    for row in con.execute("SELECT * FROM complaint_cases ORDER BY id ASC").fetchall():
+    for row in con.execute("SELECT * FROM complaint_cases ORDER BY id ASC"):
         item = dict(row)
         complaint_id = int(item.get("id") or 0)
         building = _normalize_building(item.get("building"))
@@ -398,15 +429,14 @@ def _sqlite_checklist_document_rows(con: sqlite3.Connection) -> List[Dict[str, A
     names = _sqlite_table_names(con)
     if "ops_checklist_sets" not in names or "ops_checklist_set_items" not in names:
         return []
-    item_rows = con.execute(
+    item_map: Dict[str, List[str]] = {}
+    for row in con.execute(
         """
         SELECT set_id, seq, item_text
         FROM ops_checklist_set_items
         ORDER BY set_id ASC, seq ASC, id ASC
         """
-    ).fetchall()
-    item_map: Dict[str, List[str]] = {}
-    for row in item_rows:
+    ):
         set_id = str(row["set_id"] or "").strip()
         text = _clean_text(row["item_text"], 400)
         if not set_id or not text:
@@ -420,7 +450,7 @@ def _sqlite_checklist_document_rows(con: sqlite3.Connection) -> List[Dict[str, A
         FROM ops_checklist_sets
         ORDER BY id ASC
         """
-    ).fetchall():
+    ):
         set_id = str(row["set_id"] or "").strip()
         title = _clean_text(row["label"], 160) or set_id
         summary_lines = [
@@ -453,7 +483,7 @@ def _sqlite_sla_document_rows(con: sqlite3.Connection) -> List[Dict[str, Any]]:
     if "sla_policies" not in names:
         return []
     rows: List[Dict[str, Any]] = []
-    for row in con.execute("SELECT policy_key, policy_json, updated_at FROM sla_policies ORDER BY id ASC").fetchall():
+    for row in con.execute("SELECT policy_key, policy_json, updated_at FROM sla_policies ORDER BY id ASC"):
         policy_key = _clean_text(row["policy_key"], 80) or "default"
         policy_json = _clean_text(row["policy_json"], 4000) or "{}"
         rows.append(
@@ -491,7 +521,7 @@ def _sqlite_facility_asset_rows(con: sqlite3.Connection) -> List[Dict[str, Any]]
             FROM ops_equipment_assets
             ORDER BY id ASC
             """
-        ).fetchall()
+        )
     ]
 
 
@@ -518,7 +548,7 @@ def _sqlite_facility_qr_rows(con: sqlite3.Connection) -> List[Dict[str, Any]]:
             FROM ops_qr_assets
             ORDER BY id ASC
             """
-        ).fetchall()
+        )
     ]
 
 
@@ -534,7 +564,7 @@ def _sqlite_facility_checklist_rows(con: sqlite3.Connection) -> List[Dict[str, A
             FROM ops_checklist_set_items
             ORDER BY set_id ASC, seq ASC, id ASC
             """
-        ).fetchall():
+        ):
             set_id = str(row["set_id"] or "").strip()
             item_text = _clean_text(row["item_text"], 200)
             if not set_id or not item_text:
@@ -547,7 +577,7 @@ def _sqlite_facility_checklist_rows(con: sqlite3.Connection) -> List[Dict[str, A
         FROM ops_checklist_sets
         ORDER BY id ASC
         """
-    ).fetchall():
+    ):
         rows.append(
             {
                 "checklist_key": _clean_text(row["set_id"], 80),
@@ -569,7 +599,18 @@ def _sqlite_facility_inspection_rows(con: sqlite3.Connection) -> List[Dict[str,
     if "inspections" not in names:
         return []
     rows: List[Dict[str, Any]] = []
-    for row in con.execute("SELECT * FROM inspections ORDER BY id ASC").fetchall():
+    cursor = con.execute(
+        """
+        SELECT
+          cycle, transformer_kva, voltage_r, voltage_s, voltage_t, current_r, current_s, current_t,
+          winding_temp_c, grounding_ohm, insulation_mohm, risk_flags, risk_level, site, location,
+          equipment_snapshot, equipment_location_snapshot, checklist_set_id, inspector, inspected_at,
+          created_at, notes, qr_id
+        FROM inspections
+        ORDER BY id ASC
+        """
+    )
+    for row in cursor:
         measurement = {
             "cycle": row["cycle"],
             "transformer_kva": row["transformer_kva"],
@@ -610,7 +651,7 @@ def _sqlite_facility_work_order_rows(con: sqlite3.Connection) -> List[Dict[str,
     priority_map = {"low": "낮음", "medium": "보통", "high": "높음", "critical": "긴급"}
     status_map = {"open": "접수", "acknowledged": "진행중", "in_progress": "진행중", "done": "완료", "closed": "완료", "hold": "보류"}
     rows: List[Dict[str, Any]] = []
-    for row in con.execute("SELECT * FROM work_orders ORDER BY id ASC").fetchall():
+    for row in con.execute("SELECT * FROM work_orders ORDER BY id ASC"):
         rows.append(
             {
                 "title": _clean_text(row["title"], 200),
@@ -646,7 +687,7 @@ def _sqlite_audit_rows(con: sqlite3.Connection) -> List[Dict[str, Any]]:
         FROM admin_audit_logs
         ORDER BY id ASC
         """
-    ).fetchall():
+    ):
         rows.append(
             {
                 "actor": _clean_text(row["actor_username"], 120) or "legacy",
@@ -703,22 +744,7 @@ def load_legacy_source(source_path: str | Path) -> Dict[str, Any]:
         raise FileNotFoundError(f"legacy source not found: {path}")
 
     if path.is_file() and path.suffix.lower() == ".json":
-        data = _read_json_bundle(path)
-        return {
-            "tenant": data.get("tenant") or {},
-            "users": list(data.get("users") or []),
-            "complaints": list(data.get("complaints") or []),
-            "notices": list(data.get("notices") or []),
-            "documents": list(data.get("documents") or []),
-            "vendors": list(data.get("vendors") or []),
-            "schedules": list(data.get("schedules") or []),
-            "facility_assets": list(data.get("facility_assets") or []),
-            "facility_qr_assets": list(data.get("facility_qr_assets") or []),
-            "facility_checklists": list(data.get("facility_checklists") or []),
-            "facility_inspections": list(data.get("facility_inspections") or []),
-            "facility_work_orders": list(data.get("facility_work_orders") or []),
-            "audit_logs": list(data.get("audit_logs") or []),
-        }
+        return _json_source_bundle(_read_json_bundle(path))
 
     if path.is_dir():
         def rows(name: str) -> List[Dict[str, Any]]:
@@ -821,29 +847,11 @@ def _find_existing_row_id(con: sqlite3.Connection, table: str, where: Dict[str,
     return int(row["id"]) if row else None
 
 
-def _apply_timestamps(con: sqlite3.Connection, table: str, row_id: int, created_at: str = "", updated_at: str = "", closed_at: str = "") -> None:
-    fields: List[str] = []
-    params: List[Any] = []
-    if created_at:
-        fields.append("created_at=?")
-        params.append(created_at)
-    if updated_at:
-        fields.append("updated_at=?")
-        params.append(updated_at)
-    if closed_at:
-        fields.append("closed_at=?")
-        params.append(closed_at)
-    if not fields:
-        return
-    params.extend([int(row_id)])
-    con.execute(f"UPDATE {table} SET {', '.join(fields)} WHERE id=?", tuple(params))
-
-
 def _import_users(con: sqlite3.Connection, *, tenant_id: str, rows: List[Dict[str, Any]], default_password: str) -> Dict[str, int]:
     created = 0
     updated = 0
     skipped = 0
-    for row in rows:
+    for row in map(_lowered_row, rows):
         login_id = _clean_text(_pick(row, "login_id"), 32).lower()
         name = _clean_text(_pick(row, "name"), 40)
         if not login_id or not name:
@@ -917,7 +925,9 @@ def _import_complaints(con: sqlite3.Connection, *, tenant_id: str, rows: List[Di
     created = 0
     updated = 0
     skipped = 0
-    for row in rows:
+    attachment_params: List[Tuple[Any, ...]] = []
+    history_params: List[Tuple[Any, ...]] = []
+    for row in map(_lowered_row, rows):
         building = _clean_text(_pick(row, "building"), 20)
         unit = _clean_text(_pick(row, "unit"), 20)
         content = _clean_text(_pick(row, "content"), 8000)
@@ -925,7 +935,7 @@ def _import_complaints(con: sqlite3.Connection, *, tenant_id: str, rows: List[Di
             skipped += 1
             continue
         classification = classify_complaint_text(" ".join(part for part in [building and f"{building}동", unit and f"{unit}호", content] if part))
-        complaint_type = _normalize_choice(_pick(row, "type"), allowed=COMPLAINT_TYPES, mapping=COMPLAINT_TYPE_MAP, default=classification["type"])
+        complaint_type = _normalize_choice(_pick(row, "type"), allowed=COMPLAINT_TYPE_SET, mapping=COMPLAINT_TYPE_MAP, default=classification["type"])
         urgency = _normalize_choice(_pick(row, "urgency"), allowed=URGENCY_VALUES, mapping=URGENCY_MAP, default=classification["urgency"])
         status = _normalize_choice(_pick(row, "status"), allowed=STATUS_VALUES, mapping=STATUS_MAP, default="접수")
         summary = normalize_summary_text(
@@ -1003,49 +1013,66 @@ def _import_complaints(con: sqlite3.Connection, *, tenant_id: str, rows: List[Di
             ),
         )
         created += 1
+        complaint_id = int(cur.lastrowid)
         attachments = row.get("attachments") if isinstance(row.get("attachments"), list) else []
         for attachment in attachments:
             file_url = _clean_text((attachment or {}).get("file_url"), 500)
             if not file_url:
                 continue
-            con.execute(
-                """
-                INSERT INTO complaint_attachments(complaint_id, file_url, mime_type, size_bytes, created_at)
-                VALUES(?,?,?,?,?)
-                """,
+            attachment_params.append(
                 (
-                    int(cur.lastrowid),
+                    complaint_id,
                     file_url,
                     _clean_text((attachment or {}).get("mime_type"), 120) or None,
                     int((attachment or {}).get("size_bytes") or 0) or None,
                     _normalize_timestamp((attachment or {}).get("created_at")),
-                ),
+                )
             )
         history = row.get("history") if isinstance(row.get("history"), list) else []
         for hist in history:
             to_status = _normalize_choice((hist or {}).get("to_status"), allowed=STATUS_VALUES, mapping=STATUS_MAP, default=status)
-            con.execute(
-                """
-                INSERT INTO complaint_history(complaint_id, from_status, to_status, note, actor_label, created_at)
-                VALUES(?,?,?,?,?,?)
-                """,
+            history_params.append(
                 (
-                    int(cur.lastrowid),
+                    complaint_id,
                     _clean_text((hist or {}).get("from_status"), 40) or None,
                     to_status,
                     _clean_text((hist or {}).get("note"), 4000) or None,
                     _clean_text((hist or {}).get("actor_label"), 120) or "legacy-import",
                     _normalize_timestamp((hist or {}).get("created_at")),
-                ),
+                )
             )
+    if attachment_params:
+        con.executemany(
+            """
+            INSERT INTO complaint_attachments(complaint_id, file_url, mime_type, size_bytes, created_at)
+            VALUES(?,?,?,?,?)
+            """,
+            attachment_params,
+        )
+    if history_params:
+        con.executemany(
+            """
+            INSERT INTO complaint_history(complaint_id, from_status, to_status, note, actor_label, created_at)
+            VALUES(?,?,?,?,?,?)
+            """,
+            history_params,
+        )
     return {"created": created, "updated": updated, "skipped": skipped}
 
 
 def _import_notices(con: sqlite3.Connection, *, tenant_id: str, rows: List[Dict[str, Any]]) -> Dict[str, int]:
-    created = 0
     updated = 0
     skipped = 0
-    for row in rows:
+    existing_ids = {
+        (str(row["title"]), str(row["body"])): int(row["id"])
+        for row in con.execute(
+            "SELECT id, title, body FROM ops_notices WHERE tenant_id=? ORDER BY id DESC",
+            (tenant_id,),
+        )
+    }
+    update_params: List[Tuple[Any, ...]] = []
+    insert_params: Dict[Tuple[str, str], Tuple[Any, ...]] = {}
+    for row in map(_lowered_row, rows):
         title = _clean_text(_pick(row, "title"), 160)
         body = _clean_text(_pick(row, "body"), 12000)
         if not title or not body:
@@ -1061,36 +1088,44 @@ def _import_notices(con: sqlite3.Connection, *, tenant_id: str, rows: List[Dict[
         pinned = _truthy(_pick(row, "pinned"))
         created_at = _normalize_timestamp(_pick(row, "created_at"))
         updated_at = _normalize_timestamp(_pick(row, "updated_at")) or created_at
-        existing_id = _find_existing_row_id(con, "ops_notices", {"tenant_id": tenant_id, "title": title, "body": body})
+        key = (title, body)
+        existing_id = existing_ids.get(key)
         if existing_id:
-            con.execute(
-                "UPDATE ops_notices SET category=?, status=?, pinned=?, updated_at=? WHERE id=? AND tenant_id=?",
-                (category, status, 1 if pinned else 0, updated_at, int(existing_id), tenant_id),
-            )
+            update_params.append((category, status, 1 if pinned else 0, updated_at, existing_id, tenant_id))
             updated += 1
             continue
-        cur = con.execute(
+        pending = insert_params.get(key)
+        if pending:
+            insert_params[key] = (*pending[:3], category, status, 1 if pinned else 0, *pending[6:8], updated_at)
+            updated += 1
+            continue
+        insert_params[key] = (tenant_id, title, body, category, status, 1 if pinned else 0, "legacy-import", created_at, updated_at)
+    if update_params:
+        con.executemany(
+            "UPDATE ops_notices SET category=?, status=?, pinned=?, updated_at=? WHERE id=? AND tenant_id=?",
+            update_params,
+        )
+    if insert_params:
+        con.executemany(
             """
             INSERT INTO ops_notices(tenant_id, title, body, category, status, pinned, created_by_label, created_at, updated_at)
             VALUES(?,?,?,?,?,?,?,?,?)
             """,
-            (tenant_id, title, body, category, status, 1 if pinned else 0, "legacy-import", created_at, updated_at),
+            list(insert_params.values()),
         )
-        _apply_timestamps(con, "ops_notices", int(cur.lastrowid), created_at, updated_at)
-        created += 1
-    return {"created": created, "updated": updated, "skipped": skipped}
+    return {"created": len(insert_params), "updated": updated, "skipped": skipped}
 
 
 def _import_documents(con: sqlite3.Connection, *, tenant_id: str, rows: List[Dict[str, Any]]) -> Dict[str, int]:
     created = 0
     updated = 0
     skipped = 0
-    for row in rows:
+    for row in map(_lowered_row, rows):
         title = _clean_text(_pick(row, "title"), 160)
         if not title:
             skipped += 1
             continue
-        category = _normalize_choice(_pick(row, "category"), allowed=DOCUMENT_CATEGORY_VALUES, default="기타")
+        category = _normalize_choice(_pick(row, "category"), allowed=DOCUMENT_CATEGORY_VALUE_SET, default="기타")
         status = _normalize_choice(_pick(row, "status"), allowed=DOCUMENT_STATUS_VALUES, mapping=DOCUMENT_STATUS_MAP, default="작성중")
         summary = _clean_text(_pick(row, "summary"), 4000)
         owner = _clean_text(_pick(row, "owner"), 80)
@@ -1114,7 +1149,7 @@ def _import_documents(con: sqlite3.Connection, *, tenant_id: str, rows: List[Dic
             )
             updated += 1
             continue
-        cur = con.execute(
+        con.execute(
             """
             INSERT INTO ops_documents(
               tenant_id, title, summary, category, status, owner, due_date, reference_no, created_by_label, created_at, updated_at
@@ -1123,7 +1158,6 @@ def _import_documents(con: sqlite3.Connection, *, tenant_id: str, rows: List[Dic
             """,
             (tenant_id, title, summary or None, category, status, owner or None, due_date or None, reference_no or None, "legacy-import", created_at, updated_at),
         )
-        _apply_timestamps(con, "ops_documents", int(cur.lastrowid), created_at, updated_at)
         created += 1
     return {"created": created, "updated": updated, "skipped": skipped}
 
@@ -1132,7 +1166,7 @@ def _import_vendors(con: sqlite3.Connection, *, tenant_id: str, rows: List[Dict[
     created = 0
     updated = 0
     skipped = 0
-    for row in rows:
+    for row in map(_lowered_row, rows):
         company_name = _clean_text(_pick(row, "company_name"), 160)
         service_type = _clean_text(_pick(row, "service_type"), 80)
         if not company_name or not service_type:
@@ -1165,7 +1199,7 @@ def _import_vendors(con: sqlite3.Connection, *, tenant_id: str, rows: List[Dict[
             )
             updated += 1
             continue
-        cur = con.execute(
+        con.execute(
             """
             INSERT INTO ops_vendors(
               tenant_id, company_name, service_type, contact_name, phone, email, status, note, created_by_label, created_at, updated_at
@@ -1174,32 +1208,36 @@ def _import_vendors(con: sqlite3.Connection, *, tenant_id: str, rows: List[Dict[
             """,
             (tenant_id, company_name, service_type, values[0], values[1], values[2], values[3], values[4], "legacy-import", created_at, updated_at),
         )
-        _apply_timestamps(con, "ops_vendors", int(cur.lastrowid), created_at, updated_at)
         created += 1
     return {"created": created, "updated": updated, "skipped": skipped}
 
 
-def _resolve_vendor_id(con: sqlite3.Connection, *, tenant_id: str, row: Dict[str, Any]) -> Optional[int]:
+def _vendor_id_index(con: sqlite3.Connection, *, tenant_id: str) -> Dict[Tuple[str, str], int]:
+    index: Dict[Tuple[str, str], int] = {}
+    for row in con.execute(
+        "SELECT id, company_name, service_type FROM ops_vendors WHERE tenant_id=? ORDER BY id ASC",
+        (tenant_id,),
+    ):
+        company_name = str(row["company_name"] or "")
+        index.setdefault((company_name, str(row["service_type"] or "")), int(row["id"]))
+        index.setdefault((company_name, ""), int(row["id"]))
+    return index
+
+
+def _resolve_vendor_id(vendor_ids: Dict[Tuple[str, str], int], *, row: Dict[str, Any]) -> Optional[int]:
     vendor_name = _clean_text(_pick(row, "vendor_name"), 160)
     vendor_service_type = _clean_text(_pick(row, "vendor_service_type"), 80)
     if not vendor_name:
         return None
-    return _find_existing_row_id(
-        con,
-        "ops_vendors",
-        {
-            "tenant_id": tenant_id,
-            "company_name": vendor_name,
-            "service_type": vendor_service_type or None,
-        },
-    ) or _find_existing_row_id(con, "ops_vendors", {"tenant_id": tenant_id, "company_name": vendor_name})
+    return vendor_ids.get((vendor_name, vendor_service_type)) or vendor_ids.get((vendor_name, ""))
 
 
 def _import_schedules(con: sqlite3.Connection, *, tenant_id: str, rows: List[Dict[str, Any]]) -> Dict[str, int]:
     created = 0
     updated = 0
     skipped = 0
-    for row in rows:
+    vendor_ids = _vendor_id_index(con, tenant_id=tenant_id)
+    for row in map(_lowered_row, rows):
         title = _clean_text(_pick(row, "title"), 160)
         if not title:
             skipped += 1
@@ -1209,7 +1247,7 @@ def _import_schedules(con: sqlite3.Connection, *, tenant_id: str, rows: List[Dic
         due_date = _clean_text(_pick(row, "due_date"), 20)
         owner = _clean_text(_pick(row, "owner"), 80)
         note = _clean_text(_pick(row, "note"), 4000)
-        vendor_id = _resolve_vendor_id(con, tenant_id=tenant_id, row=row)
+        vendor_id = _resolve_vendor_id(vendor_ids, row=row)
         created_at = _normalize_timestamp(_pick(row, "created_at"))
         updated_at = _normalize_timestamp(_pick(row, "updated_at")) or created_at
         existing_id = _find_existing_row_id(con, "ops_schedules", {"tenant_id": tenant_id, "title": title, "due_date": due_date or None})
@@ -1224,7 +1262,7 @@ def _import_schedules(con: sqlite3.Connection, *, tenant_id: str, rows: List[Dic
             )
             updated += 1
             continue
-        cur = con.execute(
+        con.execute(
             """
             INSERT INTO ops_schedules(
               tenant_id, title, schedule_type, status, due_date, owner, note, vendor_id, created_by_label, created_at, updated_at
@@ -1233,7 +1271,6 @@ def _import_schedules(con: sqlite3.Connection, *, tenant_id: str, rows: List[Dic
             """,
             (tenant_id, title, schedule_type, status, due_date or None, owner or None, note or None, vendor_id, "legacy-import", created_at, updated_at),
         )
-        _apply_timestamps(con, "ops_schedules", int(cur.lastrowid), created_at, updated_at)
         created += 1
     return {"created": created, "updated": updated, "skipped": skipped}
 
@@ -1360,7 +1397,7 @@ def _import_facility_assets(con: sqlite3.Connection, *, tenant_id: str, rows: Li
             )
             updated += 1
             continue
-        cur = con.execute(
+        con.execute(
             """
             INSERT INTO facility_assets(
               tenant_id, asset_code, asset_name, category, location_name, lifecycle_state, source, qr_id, checklist_key,
@@ -1370,7 +1407,6 @@ def _import_facility_assets(con: sqlite3.Connection, *, tenant_id: str, rows: Li
             """,
             (tenant_id, *values[:-1], "legacy-import", created_at, updated_at),
         )
-        _apply_timestamps(con, "facility_assets", int(cur.lastrowid), created_at, updated_at)
         created += 1
     return {"created": created, "updated": updated, "skipped": skipped}
 
@@ -1410,7 +1446,7 @@ def _import_facility_checklists(con: sqlite3.Connection, *, tenant_id: str, rows
             )
             updated += 1
             continue
-        cur = con.execute(
+        con.execute(
             """
             INSERT INTO facility_checklists(
               tenant_id, checklist_key, title, task_type, version_no, lifecycle_state, source, note, items_json, created_by_label, created_at, updated_at
@@ -1419,7 +1455,6 @@ def _import_facility_checklists(con: sqlite3.Connection, *, tenant_id: str, rows
             """,
             (tenant_id, checklist_key, *values[:-1], "legacy-import", created_at, updated_at),
         )
-        _apply_timestamps(con, "facility_checklists", int(cur.lastrowid), created_at, updated_at)
         created += 1
     return {"created": created, "updated": updated, "skipped": skipped}
 
@@ -1459,7 +1494,7 @@ def _import_facility_qr_assets(con: sqlite3.Connection, *, tenant_id: str, rows:
             )
             updated += 1
             continue
-        cur = con.execute(
+        con.execute(
             """
             INSERT INTO facility_qr_assets(
               tenant_id, qr_id, asset_id, asset_code_snapshot, asset_name_snapshot, location_snapshot, default_item, checklist_key,
@@ -1469,7 +1504,6 @@ def _import_facility_qr_assets(con: sqlite3.Connection, *, tenant_id: str, rows:
             """,
             (tenant_id, qr_id, *values[:-1], "legacy-import", created_at, updated_at),
         )
-        _apply_timestamps(con, "facility_qr_assets", int(cur.lastrowid), created_at, updated_at)
         created += 1
     return {"created": created, "updated": updated, "skipped": skipped}
 
@@ -1510,7 +1544,7 @@ def _import_facility_inspections(con: sqlite3.Connection, *, tenant_id: str, row
             )
             updated += 1
             continue
-        cur = con.execute(
+        con.execute(
             """
             INSERT INTO facility_inspections(
               tenant_id, title, asset_id, qr_asset_id, checklist_key, inspector, inspected_at, result_status, notes, measurement_json,
@@ -1520,7 +1554,6 @@ def _import_facility_inspections(con: sqlite3.Connection, *, tenant_id: str, row
             """,
             (tenant_id, title, values[0], values[1], values[2], values[3], inspected_at, values[4], values[5], values[6], "legacy-import", inspected_at, updated_at),
         )
-        _apply_timestamps(con, "facility_inspections", int(cur.lastrowid), inspected_at, updated_at)
         created += 1
     return {"created": created, "updated": updated, "skipped": skipped}
 
@@ -1568,7 +1601,7 @@ def _import_facility_work_orders(con: sqlite3.Connection, *, tenant_id: str, row
             )
             updated += 1
             continue
-        cur = con.execute(
+        con.execute(
             """
             INSERT INTO facility_work_orders(
               tenant_id, title, description, asset_id, qr_asset_id, inspection_id, category, priority, status, assignee, reporter,
@@ -1578,14 +1611,18 @@ def _import_facility_work_orders(con: sqlite3.Connection, *, tenant_id: str, row
             """,
             (tenant_id, title, *values[:-1], "legacy-import", created_at, updated_at),
         )
-        _apply_timestamps(con, "facility_work_orders", int(cur.lastrowid), created_at, updated_at)
         created += 1
     return {"created": created, "updated": updated, "skipped": skipped}
 
 
 def _import_audit_logs(con: sqlite3.Connection, *, tenant_id: str, rows: List[Dict[str, Any]]) -> Dict[str, int]:
-    created = 0
     skipped = 0
+    seen_stamped: Set[Tuple[str, str, Any]] = set()
+    seen_any: Set[Tuple[str, str]] = set()
+    for row in con.execute("SELECT action, actor, created_at FROM audit_logs WHERE tenant_id=?", (tenant_id,)):
+        seen_stamped.add((row["action"], row["actor"], row["created_at"]))
+        seen_any.add((row["action"], row["actor"]))
+    insert_params: List[Tuple[Any, ...]] = []
     for row in rows:
         action = _clean_text(row.get("action"), 160)
         created_at = _normalize_timestamp(row.get("created_at"))
@@ -1594,33 +1631,34 @@ def _import_audit_logs(con: sqlite3.Connection, *, tenant_id: str, rows: List[Di
         if not action:
             skipped += 1
             continue
-        existing_id = _find_existing_row_id(
-            con,
-            "audit_logs",
-            {
-                "tenant_id": tenant_id,
-                "action": action,
-                "actor": actor,
-                "created_at": created_at,
-            },
-        )
-        if existing_id:
+        if ((action, actor, created_at) in seen_stamped) if created_at else ((action, actor) in seen_any):
             skipped += 1
             continue
-        con.execute(
+        seen_stamped.add((action, actor, created_at))
+        seen_any.add((action, actor))
+        insert_params.append((tenant_id, action, actor, data_json or None, created_at))
+    if insert_params:
+        con.executemany(
             """
             INSERT INTO audit_logs(tenant_id, action, actor, data_json, created_at)
             VALUES(?,?,?,?,?)
             """,
-            (tenant_id, action, actor, data_json or None, created_at),
+            insert_params,
         )
-        created += 1
-    return {"created": created, "skipped": skipped}
+    return {"created": len(insert_params), "skipped": skipped}
+
+
+def load_legacy_json_bytes(raw: bytes) -> Dict[str, Any]:
+    data = json.loads(raw.decode("utf-8"))
+    if not isinstance(data, dict):
+        raise ValueError("JSON source must be an object")
+    return _json_source_bundle(data)
 
 
 def import_legacy_source(
     *,
-    source_path: str | Path,
+    source_path: str | Path = "",
+    source_bundle: Optional[Dict[str, Any]] = None,
     tenant_id: str,
     tenant_name: str,
     site_code: str = "",
@@ -1636,7 +1674,7 @@ def import_legacy_source(
     init_engine_db()
     init_ops_db()
     init_facility_db()
-    bundle = load_legacy_source(source_path)
+    bundle = source_bundle if source_bundle is not None else load_legacy_source(source_path)
     tenant_meta = bundle.get("tenant") or {}
     resolved_tenant_id = _clean_text(tenant_id or tenant_meta.get("id"), 32).lower()
     resolved_tenant_name = _clean_text(tenant_name or tenant_meta.get("name"), 120)
@@ -1655,7 +1693,7 @@ def import_legacy_source(
         summary = {
             "tenant_id": resolved_tenant_id,
             "tenant_name": resolved_tenant_name,
-            "source_path": str(Path(source_path).resolve()),
+            "source_path": str(Path(source_path).resolve()) if source_path else "",
             "users": _import_users(con, tenant_id=resolved_tenant_id, rows=list(bundle.get("users") or []), default_password=default_user_password),
             "complaints": _import_complaints(con, tenant_id=resolved_tenant_id, rows=list(bundle.get("complaints") or [])),
             "notices": _import_notices(con, tenant_id=resolved_tenant_id, rows=list(bundle.get("notices") or [])),
@@ -1674,6 +1712,7 @@ def import_legacy_source(
             summary["dry_run"] = True
         else:
             con.commit()
+            core_db._forget_cached_tenant(resolved_tenant_id)
             summary["dry_run"] = False
         return summary
     finally:
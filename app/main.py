@@ -67,6 +67,9 @@ def _env_truthy(name: str, default: bool = False) -> bool:
     return raw in {"1", "true", "yes", "on"}
 
 
+HSTS_ENABLED = _env_truthy("KA_HSTS_ENABLED", True)
+
+
 def _is_https(request: Request) -> bool:
     proto = str(request.headers.get("x-forwarded-proto") or request.url.scheme or "").strip().lower()
     return proto == "https"
@@ -93,7 +96,7 @@ async def _security_headers(request: Request, call_next):
     resp.headers.setdefault("X-Content-Type-Options", "nosniff")
     resp.headers.setdefault("X-Frame-Options", "SAMEORIGIN")
     resp.headers.setdefault("Referrer-Policy", "strict-origin-when-cross-origin")
-    if _env_truthy("KA_HSTS_ENABLED", True) and _is_https(request):
+    if HSTS_ENABLED and _is_https(request):
         resp.headers.setdefault("Strict-Transport-Security", "max-age=31536000; includeSubDomains")
     _apply_pwa_cache_headers(request, resp)
     return resp
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
 import json
-import re
 import sqlite3
 from datetime import date
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from .db import DB_PATH, _ensure_column, normalize_document_numbering_config, now_iso
+from .db import DB_PATH, _ensure_columns, _open_connection, normalize_document_numbering_config, now_iso
 from .ops_document_catalog import (
     DOCUMENT_CATEGORY_CODES,
     DOCUMENT_CATEGORY_VALUES,
+    LEGACY_DOCUMENT_CATEGORY_ALIASES,
     document_category_db_values,
     normalize_document_category,
 )
@@ -17,20 +17,28 @@ from .ops_document_catalog import (
 NOTICE_CATEGORY_VALUES = ("공지", "기안", "구매", "견적및발주", "작업내용", "기타")
 NOTICE_STATUS_VALUES = ("draft", "published", "archived")
 DOCUMENT_STATUS_VALUES = ("작성중", "검토중", "완료", "보관")
+MAX_DOCUMENT_EXPORT_ROWS = 5000
 SCHEDULE_TYPE_VALUES = ("행정", "점검", "회의", "계약", "민원", "기타")
 SCHEDULE_STATUS_VALUES = ("예정", "진행중", "완료", "보류")
 VENDOR_STATUS_VALUES = ("활성", "중지", "종료")
+DOCUMENT_CATEGORY_GROUP_SQL = (
+    f"CASE WHEN TRIM(category) IN ({','.join('?' for _ in DOCUMENT_CATEGORY_VALUES)}) THEN TRIM(category) "
+    + "".join("WHEN TRIM(category)=? THEN ? " for _ in LEGACY_DOCUMENT_CATEGORY_ALIASES)
+    + "ELSE '기타' END"
+)
+DOCUMENT_CATEGORY_GROUP_PARAMS: Tuple[str, ...] = (
+    *DOCUMENT_CATEGORY_VALUES,
+    *(
+        value
+        for legacy, current in LEGACY_DOCUMENT_CATEGORY_ALIASES.items()
+        for value in (legacy, normalize_document_category(current, default="기타"))
+    ),
+)
+_SCHEMA_READY: set[str] = set()
 
 
 def _connect() -> sqlite3.Connection:
-    con = sqlite3.connect(str(DB_PATH), timeout=30.0)
-    con.row_factory = sqlite3.Row
-    con.execute("PRAGMA foreign_keys=ON;")
-    try:
-        con.execute("PRAGMA busy_timeout=30000;")
-    except Exception:
-        pass
-    return con
+    return _open_connection(DB_PATH)
 
 
 def _clean_text(value: Any, *, field: str, required: bool = False, max_len: int = 4000) -> str:
@@ -62,19 +70,29 @@ def _clean_date(value: Any, *, field: str, required: bool = False) -> str:
 
 
 def _clean_amount(value: Any, *, field: str) -> float | None:
-    raw = str(value or "").strip().replace(",", "")
-    if not raw:
-        return None
-    try:
-        amount = float(raw)
-    except Exception as exc:
-        raise ValueError(f"{field} must be a number") from exc
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if not value:
+            return None
+        amount = float(value)
+    else:
+        raw = str(value or "").strip()
+        if "," in raw:
+            raw = raw.replace(",", "")
+        if not raw:
+            return None
+        try:
+            amount = float(raw)
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"{field} must be a number") from exc
     if amount < 0:
         raise ValueError(f"{field} must be >= 0")
     return round(amount, 2)
 
 
 def _ensure_schema(con: sqlite3.Connection) -> None:
+    schema_key = str(DB_PATH)
+    if schema_key in _SCHEMA_READY:
+        return
     con.executescript(
         """
         CREATE TABLE IF NOT EXISTS ops_notices (
@@ -137,21 +155,36 @@ def _ensure_schema(con: sqlite3.Connection) -> None:
 
         CREATE INDEX IF NOT EXISTS idx_ops_notices_tenant_updated
           ON ops_notices(tenant_id, status, pinned DESC, updated_at DESC, id DESC);
+        CREATE INDEX IF NOT EXISTS idx_ops_notices_tenant_pinned
+          ON ops_notices(tenant_id, pinned DESC, updated_at DESC, id DESC);
         CREATE INDEX IF NOT EXISTS idx_ops_documents_tenant_due
           ON ops_documents(tenant_id, status, due_date ASC, id DESC);
+        CREATE INDEX IF NOT EXISTS idx_ops_documents_tenant_due_date
+          ON ops_documents(tenant_id, due_date ASC, id DESC);
         CREATE INDEX IF NOT EXISTS idx_ops_vendors_tenant_status
           ON ops_vendors(tenant_id, status, company_name ASC, id DESC);
         CREATE INDEX IF NOT EXISTS idx_ops_schedules_tenant_due
           ON ops_schedules(tenant_id, status, due_date ASC, id DESC);
+        CREATE INDEX IF NOT EXISTS idx_ops_documents_tenant_due_order
+          ON ops_documents(tenant_id, (CASE WHEN due_date IS NULL OR due_date='' THEN 1 ELSE 0 END), due_date ASC, updated_at DESC, id DESC);
+        CREATE INDEX IF NOT EXISTS idx_ops_schedules_tenant_due_order
+          ON ops_schedules(tenant_id, (CASE WHEN due_date IS NULL OR due_date='' THEN 1 ELSE 0 END), due_date ASC, updated_at DESC, id DESC);
         """
     )
-    _ensure_column(con, "ops_documents", "amount_total", "amount_total REAL")
-    _ensure_column(con, "ops_documents", "vendor_name", "vendor_name TEXT")
-    _ensure_column(con, "ops_documents", "target_label", "target_label TEXT")
-    _ensure_column(con, "ops_documents", "basis_date", "basis_date TEXT")
-    _ensure_column(con, "ops_documents", "period_start", "period_start TEXT")
-    _ensure_column(con, "ops_documents", "period_end", "period_end TEXT")
-    _ensure_column(con, "ops_documents", "document_meta_json", "document_meta_json TEXT")
+    _ensure_columns(
+        con,
+        "ops_documents",
+        {
+            "amount_total": "amount_total REAL",
+            "vendor_name": "vendor_name TEXT",
+            "target_label": "target_label TEXT",
+            "basis_date": "basis_date TEXT",
+            "period_start": "period_start TEXT",
+            "period_end": "period_end TEXT",
+            "document_meta_json": "document_meta_json TEXT",
+        },
+    )
+    _SCHEMA_READY.add(schema_key)
 
 
 def init_ops_db() -> None:
@@ -309,8 +342,7 @@ def list_notices(*, tenant_id: str, status: str = "", limit: int = 100) -> List[
             params.append(_clean_choice(status, NOTICE_STATUS_VALUES, field="status"))
         sql += " ORDER BY pinned DESC, updated_at DESC, id DESC LIMIT ?"
         params.append(max(1, min(500, int(limit))))
-        rows = con.execute(sql, tuple(params)).fetchall()
-        return [dict(row) for row in rows]
+        return [dict(row) for row in con.execute(sql, tuple(params))]
     finally:
         con.close()
 
@@ -442,64 +474,101 @@ def create_document(
         con.close()
 
 
-def list_documents(*, tenant_id: str, status: str = "", category: str = "", limit: int = 100) -> List[Dict[str, Any]]:
+def _document_list_query(*, tenant_id: str, status: str, category: str, limit: int) -> Tuple[str, Tuple[Any, ...]]:
     clean_tenant_id = _clean_text(tenant_id, field="tenant_id", required=True, max_len=32).lower()
+    sql = """
+        SELECT
+          id, tenant_id, title, summary, category, status, owner, due_date, reference_no,
+          amount_total, vendor_name, target_label, basis_date, period_start, period_end, document_meta_json,
+          created_by_label, created_at, updated_at
+        FROM ops_documents
+        WHERE tenant_id=?
+    """
+    params: List[Any] = [clean_tenant_id]
+    if str(status or "").strip():
+        sql += " AND status=?"
+        params.append(_clean_choice(status, DOCUMENT_STATUS_VALUES, field="status"))
+    if str(category or "").strip():
+        db_values = document_category_db_values(category)
+        placeholders = ", ".join("?" for _ in db_values)
+        sql += f" AND category IN ({placeholders})"
+        params.extend(db_values)
+    sql += " ORDER BY CASE WHEN due_date IS NULL OR due_date='' THEN 1 ELSE 0 END, due_date ASC, updated_at DESC, id DESC LIMIT ?"
+    params.append(int(limit))
+    return sql, tuple(params)
+
+
+def list_documents(*, tenant_id: str, status: str = "", category: str = "", limit: int = 100) -> List[Dict[str, Any]]:
+    sql, params = _document_list_query(
+        tenant_id=tenant_id,
+        status=status,
+        category=category,
+        limit=max(1, min(500, int(limit))),
+    )
     con = _connect()
     try:
         _ensure_schema(con)
-        sql = """
-            SELECT
-              id, tenant_id, title, summary, category, status, owner, due_date, reference_no,
-              amount_total, vendor_name, target_label, basis_date, period_start, period_end, document_meta_json,
-              created_by_label, created_at, updated_at
-            FROM ops_documents
-            WHERE tenant_id=?
-        """
-        params: List[Any] = [clean_tenant_id]
-        if str(status or "").strip():
-            sql += " AND status=?"
-            params.append(_clean_choice(status, DOCUMENT_STATUS_VALUES, field="status"))
-        if str(category or "").strip():
-            db_values = document_category_db_values(category)
-            placeholders = ", ".join("?" for _ in db_values)
-            sql += f" AND category IN ({placeholders})"
-            params.extend(db_values)
-        sql += " ORDER BY CASE WHEN due_date IS NULL OR due_date='' THEN 1 ELSE 0 END, due_date ASC, updated_at DESC, id DESC LIMIT ?"
-        params.append(max(1, min(500, int(limit))))
-        rows = con.execute(sql, tuple(params)).fetchall()
+        rows = con.execute(sql, params).fetchall()
         return [_document_row_payload(row) for row in rows]
     finally:
         con.close()
 
 
+def _iter_document_rows(sql: str, params: Tuple[Any, ...], *, batch_size: int) -> Iterator[Dict[str, Any]]:
+    con = _connect()
+    try:
+        _ensure_schema(con)
+        cur = con.execute(sql, params)
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield _document_row_payload(row)
+    finally:
+        con.close()
+
+
+def iter_documents(
+    *,
+    tenant_id: str,
+    status: str = "",
+    category: str = "",
+    limit: int = 2000,
+    batch_size: int = 200,
+) -> Iterator[Dict[str, Any]]:
+    sql, params = _document_list_query(
+        tenant_id=tenant_id,
+        status=status,
+        category=category,
+        limit=max(1, min(MAX_DOCUMENT_EXPORT_ROWS, int(limit))),
+    )
+    return _iter_document_rows(sql, params, batch_size=max(1, int(batch_size)))
+
+
 def summarize_document_categories(*, tenant_id: str) -> List[Dict[str, Any]]:
     clean_tenant_id = _clean_text(tenant_id, field="tenant_id", required=True, max_len=32).lower()
     con = _connect()
     try:
         _ensure_schema(con)
         rows = con.execute(
-            """
+            f"""
             SELECT
-              category,
+              {DOCUMENT_CATEGORY_GROUP_SQL} AS category,
               COUNT(*) AS total_count,
               SUM(CASE WHEN status IN ('작성중','검토중') THEN 1 ELSE 0 END) AS open_count
             FROM ops_documents
             WHERE tenant_id=?
-            GROUP BY category
+            GROUP BY 1
             """,
-            (clean_tenant_id,),
+            (*DOCUMENT_CATEGORY_GROUP_PARAMS, clean_tenant_id),
         ).fetchall()
-        category_map: Dict[str, Dict[str, Any]] = {}
-        for row in rows:
-            normalized = normalize_document_category(row["category"], default="기타")
-            bucket = category_map.setdefault(normalized, {"total_count": 0, "open_count": 0})
-            bucket["total_count"] += int(row["total_count"] or 0)
-            bucket["open_count"] += int(row["open_count"] or 0)
+        category_map = {str(row["category"]): row for row in rows}
         return [
             {
                 "category": category,
-                "total_count": int((category_map.get(category) or {}).get("total_count") or 0),
-                "open_count": int((category_map.get(category) or {}).get("open_count") or 0),
+                "total_count": int(category_map[category]["total_count"] or 0),
+                "open_count": int(category_map[category]["open_count"] or 0),
             }
             for category in DOCUMENT_CATEGORY_VALUES
             if category in category_map
@@ -508,14 +577,25 @@ def summarize_document_categories(*, tenant_id: str) -> List[Dict[str, Any]]:
         con.close()
 
 
-def _next_document_reference_no(con: sqlite3.Connection, *, tenant_id: str, category: str) -> str:
-    clean_tenant_id = _clean_text(tenant_id, field="tenant_id", required=True, max_len=32).lower()
-    clean_category = normalize_document_category(category, default="기타")
+def _document_numbering_config(con: sqlite3.Connection, *, tenant_id: str) -> Dict[str, Any]:
     row = con.execute(
         "SELECT ops_document_numbering_json FROM tenants WHERE id=? LIMIT 1",
-        (clean_tenant_id,),
+        (tenant_id,),
     ).fetchone()
-    config = normalize_document_numbering_config(row["ops_document_numbering_json"] if row else None)
+    return normalize_document_numbering_config(row["ops_document_numbering_json"] if row else None)
+
+
+def _next_document_reference_no(
+    con: sqlite3.Connection,
+    *,
+    tenant_id: str,
+    category: str,
+    config: Optional[Dict[str, Any]] = None,
+) -> str:
+    clean_tenant_id = _clean_text(tenant_id, field="tenant_id", required=True, max_len=32).lower()
+    clean_category = normalize_document_category(category, default="기타")
+    if config is None:
+        config = _document_numbering_config(con, tenant_id=clean_tenant_id)
     separator = str(config.get("separator") or "-")
     date_mode = str(config.get("date_mode") or "yyyymmdd")
     sequence_digits = int(config.get("sequence_digits") or 3)
@@ -527,16 +607,20 @@ def _next_document_reference_no(con: sqlite3.Connection, *, tenant_id: str, cate
         prefix_parts.append(date.today().strftime("%Y%m"))
     prefix_core = separator.join([part for part in prefix_parts if part]) if separator else "".join(prefix_parts)
     prefix = f"{prefix_core}{separator}" if prefix_core and separator else prefix_core
-    rows = con.execute(
-        "SELECT reference_no FROM ops_documents WHERE tenant_id=? AND reference_no LIKE ?",
-        (clean_tenant_id, f"{prefix}%"),
-    ).fetchall()
-    max_seq = 0
-    for row in rows:
-        reference_no = str(row["reference_no"] or "").strip()
-        matched = re.match(rf"^{re.escape(prefix)}(\d{{2,}})$", reference_no)
-        if matched:
-            max_seq = max(max_seq, int(matched.group(1)))
+    seq_start = len(prefix) + 1
+    row = con.execute(
+        """
+        SELECT MAX(CAST(substr(ref, ?) AS INTEGER)) AS max_seq
+        FROM (
+          SELECT trim(reference_no) AS ref
+          FROM ops_documents
+          WHERE tenant_id=? AND reference_no LIKE ?
+        )
+        WHERE substr(ref, 1, ?)=? AND length(ref)>=? AND substr(ref, ?) NOT GLOB '*[^0-9]*'
+        """,
+        (seq_start, clean_tenant_id, f"{prefix}%", len(prefix), prefix, len(prefix) + 2, seq_start),
+    ).fetchone()
+    max_seq = int(row["max_seq"] or 0) if row else 0
     return f"{prefix}{max_seq + 1:0{sequence_digits}d}"
 
 
@@ -549,6 +633,20 @@ def next_document_reference_no(*, tenant_id: str, category: str) -> str:
         con.close()
 
 
+def next_document_reference_nos(*, tenant_id: str, categories: List[str]) -> Dict[str, str]:
+    clean_tenant_id = _clean_text(tenant_id, field="tenant_id", required=True, max_len=32).lower()
+    con = _connect()
+    try:
+        _ensure_schema(con)
+        config = _document_numbering_config(con, tenant_id=clean_tenant_id)
+        return {
+            category: _next_document_reference_no(con, tenant_id=clean_tenant_id, category=category, config=config)
+            for category in categories
+        }
+    finally:
+        con.close()
+
+
 def update_document(
     document_id: int,
     *,
@@ -689,8 +787,7 @@ def list_vendors(*, tenant_id: str, status: str = "", limit: int = 100) -> List[
             params.append(_clean_choice(status, VENDOR_STATUS_VALUES, field="status"))
         sql += " ORDER BY CASE WHEN status='활성' THEN 0 ELSE 1 END, company_name ASC, id DESC LIMIT ?"
         params.append(max(1, min(500, int(limit))))
-        rows = con.execute(sql, tuple(params)).fetchall()
-        return [dict(row) for row in rows]
+        return [dict(row) for row in con.execute(sql, tuple(params))]
     finally:
         con.close()
 
@@ -824,8 +921,7 @@ def list_schedules(*, tenant_id: str, status: str = "", limit: int = 100) -> Lis
             params.append(_clean_choice(status, SCHEDULE_STATUS_VALUES, field="status"))
         sql += " ORDER BY CASE WHEN s.due_date IS NULL OR s.due_date='' THEN 1 ELSE 0 END, s.due_date ASC, s.updated_at DESC, s.id DESC LIMIT ?"
         params.append(max(1, min(500, int(limit))))
-        rows = con.execute(sql, tuple(params)).fetchall()
-        return [dict(row) for row in rows]
+        return [dict(row) for row in con.execute(sql, tuple(params))]
     finally:
         con.close()
 
@@ -255,6 +255,7 @@ DOCUMENT_CATEGORY_PROFILES: List[Dict[str, Any]] = [
 ]
 
 DOCUMENT_CATEGORY_VALUES = tuple(item["category"] for item in DOCUMENT_CATEGORY_PROFILES)
+DOCUMENT_CATEGORY_VALUE_SET = frozenset(DOCUMENT_CATEGORY_VALUES)
 DOCUMENT_CATEGORY_CODES = {item["category"]: item["code"] for item in DOCUMENT_CATEGORY_PROFILES}
 DOCUMENT_CATEGORY_PROFILE_MAP = {item["category"]: json.loads(json.dumps(item, ensure_ascii=False)) for item in DOCUMENT_CATEGORY_PROFILES}
 LEGACY_DOCUMENT_CATEGORY_ALIASES = {
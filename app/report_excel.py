@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from datetime import datetime
 from io import BytesIO
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Alignment, Font, PatternFill
 
 
@@ -12,104 +13,112 @@ def _as_text(value: Any) -> str:
     return str(value or "").strip()
 
 
+HEADER_COLUMNS = (
+    "제목",
+    "분류",
+    "상태",
+    "담당",
+    "기한",
+    "문서번호",
+    "대상/설비",
+    "업체/상대처",
+    "금액(원)",
+    "기준일",
+    "시작일",
+    "종료일",
+    "요약",
+    "등록자",
+    "등록일",
+    "수정일",
+)
+COLUMN_WIDTHS = {
+    "A": 30,
+    "B": 12,
+    "C": 12,
+    "D": 14,
+    "E": 14,
+    "F": 22,
+    "G": 22,
+    "H": 22,
+    "I": 14,
+    "J": 14,
+    "K": 14,
+    "L": 14,
+    "M": 42,
+    "N": 16,
+    "O": 20,
+    "P": 20,
+}
+DOCUMENT_FIELDS = (
+    "title",
+    "category",
+    "status",
+    "owner",
+    "due_date",
+    "reference_no",
+    "target_label",
+    "vendor_name",
+    "amount_total",
+    "basis_date",
+    "period_start",
+    "period_end",
+    "summary",
+    "created_by_label",
+    "created_at",
+    "updated_at",
+)
+
+
+def _styled_cell(sheet: Any, value: Any, **styles: Any) -> WriteOnlyCell:
+    cell = WriteOnlyCell(sheet, value=value)
+    for name, style in styles.items():
+        setattr(cell, name, style)
+    return cell
+
+
 def build_ops_document_ledger_xlsx(
     *,
     tenant_label: str,
     selected_category: str,
     documents: Iterable[Dict[str, Any]],
 ) -> bytes:
-    workbook = Workbook()
-    sheet = workbook.active
-    sheet.title = "문서관리대장"
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("문서관리대장")
+    sheet.freeze_panes = "A6"
+    for column, width in COLUMN_WIDTHS.items():
+        sheet.column_dimensions[column].width = width
 
     title = "행정문서 관리대장"
     category_label = _as_text(selected_category) or "전체"
     generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    sheet["A1"] = title
-    sheet["A2"] = f"사업장: {tenant_label}"
-    sheet["A3"] = f"분류: {category_label}"
-    sheet["F2"] = f"출력일시: {generated_at}"
-
-    headers = [
-        "제목",
-        "분류",
-        "상태",
-        "담당",
-        "기한",
-        "문서번호",
-        "대상/설비",
-        "업체/상대처",
-        "금액(원)",
-        "기준일",
-        "시작일",
-        "종료일",
-        "요약",
-        "등록자",
-        "등록일",
-        "수정일",
-    ]
-    sheet.append([])
-    sheet.append(headers)
-
     title_fill = PatternFill(fill_type="solid", fgColor="0D6A67")
     header_fill = PatternFill(fill_type="solid", fgColor="DDEEEB")
+    header_font = Font(bold=True)
+    header_alignment = Alignment(horizontal="center", vertical="center")
+    body_alignment = Alignment(vertical="top", wrap_text=True)
 
-    sheet["A1"].font = Font(size=16, bold=True, color="FFFFFF")
-    sheet["A1"].fill = title_fill
-    for cell in sheet[5]:
-        cell.font = Font(bold=True)
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal="center", vertical="center")
-
-    rows: List[Dict[str, Any]] = list(documents)
-    for item in rows:
-        sheet.append(
-            [
-                _as_text(item.get("title")),
-                _as_text(item.get("category")),
-                _as_text(item.get("status")),
-                _as_text(item.get("owner")),
-                _as_text(item.get("due_date")),
-                _as_text(item.get("reference_no")),
-                _as_text(item.get("target_label")),
-                _as_text(item.get("vendor_name")),
-                _as_text(item.get("amount_total")),
-                _as_text(item.get("basis_date")),
-                _as_text(item.get("period_start")),
-                _as_text(item.get("period_end")),
-                _as_text(item.get("summary")),
-                _as_text(item.get("created_by_label")),
-                _as_text(item.get("created_at")),
-                _as_text(item.get("updated_at")),
-            ]
-        )
-
-    sheet.freeze_panes = "A6"
-    column_widths = {
-        "A": 30,
-        "B": 12,
-        "C": 12,
-        "D": 14,
-        "E": 14,
-        "F": 22,
-        "G": 22,
-        "H": 22,
-        "I": 14,
-        "J": 14,
-        "K": 14,
-        "L": 14,
-        "M": 42,
-        "N": 16,
-        "O": 20,
-        "P": 20,
-    }
-    for column, width in column_widths.items():
-        sheet.column_dimensions[column].width = width
+    sheet.append([_styled_cell(sheet, title, font=Font(size=16, bold=True, color="FFFFFF"), fill=title_fill)])
+    sheet.append([f"사업장: {tenant_label}", None, None, None, None, f"출력일시: {generated_at}"])
+    sheet.append([f"분류: {category_label}"])
+    sheet.append([])
+    sheet.append(
+        [
+            _styled_cell(sheet, header, font=header_font, fill=header_fill, alignment=header_alignment)
+            for header in HEADER_COLUMNS
+        ]
+    )
 
-    for row in sheet.iter_rows(min_row=6, max_row=sheet.max_row):
-        for cell in row:
-            cell.alignment = Alignment(vertical="top", wrap_text=True)
+    # Write-only rows are serialized as soon as they are appended, so one styled
+    # cell per column can be refilled for every document instead of rebuilt.
+    body_cells = [_styled_cell(sheet, None, alignment=body_alignment) for _ in DOCUMENT_FIELDS]
+    body_pairs = tuple(zip(body_cells, DOCUMENT_FIELDS))
+    append_row = sheet.append
+    for item in documents:
+        get = item.get
+        for cell, field in body_pairs:
+            cell.value = str(get(field) or "").strip()
+        append_row(body_cells)
 
     stream = BytesIO()
     workbook.save(stream)
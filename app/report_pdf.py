@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from datetime import datetime
+from functools import lru_cache
 from io import BytesIO
 from typing import Any, Dict, Iterable, List, Sequence
 
@@ -113,9 +114,14 @@ def _work_report_header_meta_lines(report: Dict[str, Any], *, tenant_label: str)
 
 
 def _styles() -> Dict[str, ParagraphStyle]:
+    return dict(_shared_styles())
+
+
+@lru_cache(maxsize=1)
+def _shared_styles() -> Dict[str, ParagraphStyle]:
     font_name = _register_font()
     base_styles = getSampleStyleSheet()
-    return {
+    styles = {
         "title": ParagraphStyle(
             "KaTitle",
             parent=base_styles["Title"],
@@ -174,15 +180,17 @@ def _styles() -> Dict[str, ParagraphStyle]:
             wordWrap="CJK",
         ),
     }
-
-
-def _work_report_approval_table(styles: Dict[str, ParagraphStyle]) -> Table:
-    approval_style = ParagraphStyle(
+    styles["approval"] = ParagraphStyle(
         "KaApprovalCell",
         parent=styles["small"],
         alignment=TA_CENTER,
         leading=10,
     )
+    return styles
+
+
+def _work_report_approval_table(styles: Dict[str, ParagraphStyle]) -> Table:
+    approval_style = styles["approval"]
     rows = [
         [
             Paragraph("결<br/>재", approval_style),
@@ -335,7 +343,7 @@ def build_kakao_digest_pdf(
     meta_lines = [
         f"대상 단지: {tenant_label or '-'}",
         f"생성 시각: {generated_label}",
-        f"텍스트 줄 수: {len([line for line in str(source_text or '').splitlines() if _collapse(line)])}",
+        f"텍스트 줄 수: {sum(1 for line in str(source_text or '').splitlines() if _collapse(line))}",
         f"입력 이미지 수: {int(digest.get('input_image_count') or 0)}",
         f"이미지 분석 모델: {_collapse(digest.get('image_analysis_model') or '-')}",
     ]
@@ -434,22 +442,25 @@ def _work_report_detail_table(item: Dict[str, Any], styles: Dict[str, ParagraphS
         [Paragraph("위치", styles["small"]), Paragraph(_escape(item.get("location_name") or "-"), styles["small"])],
     ]
     table = Table(rows, colWidths=[24 * mm, 146 * mm])
-    table.setStyle(
-        TableStyle(
-            [
-                ("GRID", (0, 0), (-1, -1), 0.55, colors.HexColor("#C8D3CE")),
-                ("BACKGROUND", (0, 0), (0, -1), colors.HexColor("#F0F5F2")),
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("LEFTPADDING", (0, 0), (-1, -1), 6),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-                ("TOPPADDING", (0, 0), (-1, -1), 6),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-            ]
-        )
-    )
+    table.setStyle(_work_report_detail_table_style())
     return table
 
 
+@lru_cache(maxsize=1)
+def _work_report_detail_table_style() -> TableStyle:
+    return TableStyle(
+        [
+            ("GRID", (0, 0), (-1, -1), 0.55, colors.HexColor("#C8D3CE")),
+            ("BACKGROUND", (0, 0), (0, -1), colors.HexColor("#F0F5F2")),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("LEFTPADDING", (0, 0), (-1, -1), 6),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+            ("TOPPADDING", (0, 0), (-1, -1), 6),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+        ]
+    )
+
+
 def _work_report_image_lookup(image_inputs: Sequence[Dict[str, Any]] | None = None) -> Dict[int, Dict[str, Any]]:
     return {index: row for index, row in enumerate(list(image_inputs or []), start=1)}
 
@@ -820,6 +831,51 @@ def build_reference_document_pdf(
     return buffer.getvalue()
 
 
+@lru_cache(maxsize=1)
+def _document_info_table_style() -> TableStyle:
+    return TableStyle(
+        [
+            ("GRID", (0, 0), (-1, -1), 0.6, colors.HexColor("#B9C8C0")),
+            ("BACKGROUND", (0, 0), (0, -1), colors.HexColor("#F0F5F2")),
+            ("BACKGROUND", (2, 0), (2, -1), colors.HexColor("#F0F5F2")),
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            ("LEFTPADDING", (0, 0), (-1, -1), 6),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+            ("TOPPADDING", (0, 0), (-1, -1), 6),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+        ]
+    )
+
+
+@lru_cache(maxsize=1)
+def _document_approval_table_style() -> TableStyle:
+    return TableStyle(
+        [
+            ("GRID", (0, 0), (-1, -1), 0.6, colors.HexColor("#B9C8C0")),
+            ("BACKGROUND", (0, 0), (0, -1), colors.HexColor("#F0F5F2")),
+            ("BACKGROUND", (1, 0), (-1, 0), colors.HexColor("#FAFCFB")),
+            ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            ("TOPPADDING", (0, 1), (-1, 1), 18),
+            ("BOTTOMPADDING", (0, 1), (-1, 1), 18),
+        ]
+    )
+
+
+def _amount_number(value: Any) -> float | None:
+    if not value:
+        return None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    text = str(value).replace(",", "").strip()
+    if not text:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
 def build_ops_draft_pdf(
     *,
     tenant_label: str,
@@ -867,10 +923,7 @@ def build_ops_draft_pdf(
     safe_heading = _collapse(pdf_heading) or "행 정 문 서"
     safe_request_text = _collapse(request_text) or "위 사항을 보고드립니다."
     safe_amount_policy = _collapse(amount_policy)
-    try:
-        amount_number = float(str(amount_total or "").replace(",", "").strip()) if str(amount_total or "").strip() else None
-    except Exception:
-        amount_number = None
+    amount_number = _amount_number(amount_total)
     safe_amount = f"{amount_number:,.0f}원" if amount_number is not None else "-"
 
     story: List[Any] = []
@@ -885,20 +938,7 @@ def build_ops_draft_pdf(
         ],
         colWidths=[24 * mm, 58 * mm, 24 * mm, 58 * mm],
     )
-    header.setStyle(
-        TableStyle(
-            [
-                ("GRID", (0, 0), (-1, -1), 0.6, colors.HexColor("#B9C8C0")),
-                ("BACKGROUND", (0, 0), (0, -1), colors.HexColor("#F0F5F2")),
-                ("BACKGROUND", (2, 0), (2, -1), colors.HexColor("#F0F5F2")),
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ("LEFTPADDING", (0, 0), (-1, -1), 6),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-                ("TOPPADDING", (0, 0), (-1, -1), 6),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-            ]
-        )
-    )
+    header.setStyle(_document_info_table_style())
     story.append(header)
     story.append(Spacer(1, 5 * mm))
 
@@ -909,19 +949,7 @@ def build_ops_draft_pdf(
         ],
         colWidths=[20 * mm, 34 * mm, 34 * mm, 34 * mm, 34 * mm],
     )
-    approval.setStyle(
-        TableStyle(
-            [
-                ("GRID", (0, 0), (-1, -1), 0.6, colors.HexColor("#B9C8C0")),
-                ("BACKGROUND", (0, 0), (0, -1), colors.HexColor("#F0F5F2")),
-                ("BACKGROUND", (1, 0), (-1, 0), colors.HexColor("#FAFCFB")),
-                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ("TOPPADDING", (0, 1), (-1, 1), 18),
-                ("BOTTOMPADDING", (0, 1), (-1, 1), 18),
-            ]
-        )
-    )
+    approval.setStyle(_document_approval_table_style())
     story.append(approval)
     story.append(Spacer(1, 7 * mm))
 
@@ -938,20 +966,7 @@ def build_ops_draft_pdf(
     if meta_rows:
         story.append(Paragraph("업무정보", styles["heading"]))
         meta_table = Table(meta_rows, colWidths=[24 * mm, 58 * mm, 24 * mm, 58 * mm])
-        meta_table.setStyle(
-            TableStyle(
-                [
-                    ("GRID", (0, 0), (-1, -1), 0.6, colors.HexColor("#B9C8C0")),
-                    ("BACKGROUND", (0, 0), (0, -1), colors.HexColor("#F0F5F2")),
-                    ("BACKGROUND", (2, 0), (2, -1), colors.HexColor("#F0F5F2")),
-                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 6),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-                    ("TOPPADDING", (0, 0), (-1, -1), 6),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-                ]
-            )
-        )
+        meta_table.setStyle(_document_info_table_style())
         story.append(meta_table)
         story.append(Spacer(1, 5 * mm))
 
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import mimetypes
 import os
 import re
+import stat
 import tempfile
-from typing import Any, Dict, Tuple
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional, Tuple
+from urllib.parse import quote
 
 from fastapi import APIRouter, Body, File, Form, HTTPException, Query, Request, UploadFile
-from fastapi.responses import JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
+from starlette.concurrency import run_in_threadpool
 
-from ..build_info import build_info_payload
+from ..build_info import build_info_json
 from ..db import (
+    STORAGE_ROOT,
     append_audit_log,
     cleanup_expired_sessions,
     count_staff_admins,
@@ -26,7 +32,7 @@ from ..db import (
     list_staff_users,
     list_tenants,
     list_usage_logs,
-    list_work_report_image_feedback,
+    list_work_report_image_feedback_by_tenant,
     list_work_report_image_feedback_stats,
     mark_staff_user_login,
     revoke_all_user_sessions,
@@ -37,7 +43,7 @@ from ..db import (
     update_staff_user,
     verify_password,
 )
-from ..legacy_import import import_legacy_source
+from ..legacy_import import import_legacy_source, load_legacy_json_bytes
 from ..work_report_evaluation import evaluate_deploy_readiness, summarize_feedback_rows
 from ..work_report_learning import build_feedback_few_shot_examples, build_feedback_learning_dataset
 
@@ -53,6 +59,35 @@ AUTH_COOKIE_MAX_AGE = max(300, int(os.getenv("KA_AUTH_COOKIE_MAX_AGE") or "43200
 
 VALID_LOGIN_RE = re.compile(r"^[a-z0-9._-]{2,32}$")
 USER_ROLE_VALUES = ("staff", "desk", "manager", "vendor", "reader", "integration")
+USER_ROLE_SET = frozenset(USER_ROLE_VALUES)
+USER_ROLE_SET_WITH_SUPER_ADMIN = USER_ROLE_SET | {"super_admin"}
+UPLOAD_COPY_BUFFER_BYTES = 1024 * 1024
+UPLOAD_FILES_ROOT = (STORAGE_ROOT / "uploads").resolve()
+X_ACCEL_REDIRECT_PREFIX = str(os.getenv("KA_X_ACCEL_REDIRECT_PREFIX") or "").strip().rstrip("/")
+MODULE_CONTRACTS: Tuple[Dict[str, Any], ...] = (
+    {
+        "module_key": "complaint_engine",
+        "module_name": "AI 민원처리 엔진",
+        "ui_path": "/pwa/",
+        "api_prefix": "/api",
+        "auth_modes": ["session", "api_key"],
+    },
+    {
+        "module_key": "operations_admin",
+        "module_name": "행정업무 모듈",
+        "ui_path": "/pwa/",
+        "api_prefix": "/api/ops",
+        "auth_modes": ["session"],
+    },
+    {
+        "module_key": "facility_ops",
+        "module_name": "시설운영 모듈",
+        "ui_path": "/pwa/",
+        "api_prefix": "/api/facility",
+        "auth_modes": ["session"],
+    },
+)
+MODULE_KEYS = tuple(str(contract["module_key"]) for contract in MODULE_CONTRACTS)
 
 
 def _client_ip(request: Request) -> str:
@@ -100,9 +135,7 @@ def _public_user(user: Dict[str, Any]) -> Dict[str, Any]:
 
 def _clean_role(value: Any, *, allow_super_admin: bool = False) -> str:
     role = str(value or "staff").strip().lower() or "staff"
-    allowed = set(USER_ROLE_VALUES)
-    if allow_super_admin:
-        allowed.add("super_admin")
+    allowed = USER_ROLE_SET_WITH_SUPER_ADMIN if allow_super_admin else USER_ROLE_SET
     if role not in allowed:
         raise HTTPException(status_code=400, detail="지원하지 않는 역할입니다.")
     return role
@@ -163,13 +196,96 @@ def _extract_access_token(request: Request) -> str:
 
 def _require_auth(request: Request) -> Tuple[Dict[str, Any], str]:
     token = _extract_access_token(request)
+    cached = getattr(request.state, "auth_user", None)
+    if cached is not None and cached[1] == token:
+        return cached
     cleanup_expired_sessions()
     user = get_auth_user_by_token(token)
     if not user:
         raise HTTPException(status_code=401, detail="로그인이 필요합니다.")
+    request.state.auth_user = (user, token)
     return user, token
 
 
+def _request_tenant(request: Request, tenant_id: str) -> Optional[Dict[str, Any]]:
+    clean_tenant_id = str(tenant_id or "").strip().lower()
+    if not clean_tenant_id:
+        return None
+    cache = getattr(request.state, "tenant_cache", None)
+    if cache is None:
+        cache = {}
+        request.state.tenant_cache = cache
+    if clean_tenant_id not in cache:
+        cache[clean_tenant_id] = get_tenant(clean_tenant_id)
+    return cache[clean_tenant_id]
+
+
+def _file_response(request: Request, target: Path, *, media_type: str | None = None, detail: str = "file not found") -> Response:
+    try:
+        stat_result = os.stat(target)
+    except OSError as exc:
+        raise HTTPException(status_code=404, detail=detail) from exc
+    if not stat.S_ISREG(stat_result.st_mode):
+        raise HTTPException(status_code=404, detail=detail)
+    if X_ACCEL_REDIRECT_PREFIX:
+        resolved = Path(target).resolve()
+        if resolved.is_relative_to(UPLOAD_FILES_ROOT):
+            # Let the fronting nginx send the file itself; the app only authorizes the request.
+            internal_path = f"{X_ACCEL_REDIRECT_PREFIX}/{quote(resolved.relative_to(UPLOAD_FILES_ROOT).as_posix())}"
+            return Response(
+                media_type=media_type or mimetypes.guess_type(resolved.name)[0],
+                headers={"X-Accel-Redirect": internal_path},
+            )
+    response = FileResponse(target, media_type=media_type, stat_result=stat_result)
+    etag = response.headers.get("etag")
+    if etag and etag in str(request.headers.get("if-none-match") or ""):
+        return Response(
+            status_code=304,
+            headers={"etag": etag, "last-modified": response.headers.get("last-modified", "")},
+        )
+    return response
+
+
+def _copy_upload(source: BinaryIO, target_path: Path, *, max_bytes: int = 0) -> int:
+    buffer = bytearray(UPLOAD_COPY_BUFFER_BYTES)
+    view = memoryview(buffer)
+    total = 0
+    try:
+        with target_path.open("wb") as handle:
+            while True:
+                size = source.readinto(buffer)
+                if not size:
+                    break
+                total += size
+                if max_bytes and total > max_bytes:
+                    raise ValueError("upload exceeds size limit")
+                handle.write(view[:size])
+    except BaseException:
+        target_path.unlink(missing_ok=True)
+        raise
+    return total
+
+
+def _remove_upload(target: Optional[Path]) -> None:
+    if target is None:
+        return
+    try:
+        target.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+async def _save_upload(file: UploadFile, target_path: Path, *, max_bytes: int = 0) -> int:
+    try:
+        await file.seek(0)
+        return await run_in_threadpool(_copy_upload, file.file, target_path, max_bytes=max_bytes)
+    finally:
+        try:
+            await file.close()
+        except Exception:
+            pass
+
+
 def _require_admin(request: Request) -> Tuple[Dict[str, Any], str]:
     user, token = _require_auth(request)
     if int(user.get("is_admin") or 0) != 1:
@@ -241,9 +357,14 @@ def _admin_work_report_learning_snapshot(*, tenant_id: str = "", limit: int = 30
     tenants_with_feedback = 0
     latest_feedback_at = ""
 
+    feedback_by_tenant = list_work_report_image_feedback_by_tenant(
+        tenant_ids=[str(tenant.get("id") or "").strip().lower() for tenant in tenants],
+        limit=inspected_limit,
+    )
+
     for tenant in tenants:
         current_tenant_id = str(tenant.get("id") or "").strip().lower()
-        rows = list_work_report_image_feedback(tenant_id=current_tenant_id, limit=inspected_limit)
+        rows = feedback_by_tenant.get(current_tenant_id, [])
         summary = summarize_feedback_rows(rows)
         readiness = evaluate_deploy_readiness(summary)
         few_shot_examples = build_feedback_few_shot_examples(rows, limit=6)
@@ -302,9 +423,10 @@ def health() -> Dict[str, Any]:
 
 
 @router.get("/build_info")
-def build_info() -> JSONResponse:
-    return JSONResponse(
-        content=build_info_payload(),
+def build_info() -> Response:
+    return Response(
+        content=build_info_json(),
+        media_type="application/json",
         headers={
             "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0",
             "Pragma": "no-cache",
@@ -511,33 +633,10 @@ def auth_change_password(request: Request, payload: Dict[str, Any] = Body(...))
 @router.get("/modules/contracts")
 def modules_contracts(request: Request) -> Dict[str, Any]:
     _user, _token = _require_auth(request)
-    contracts = [
-        {
-            "module_key": "complaint_engine",
-            "module_name": "AI 민원처리 엔진",
-            "ui_path": "/pwa/",
-            "api_prefix": "/api",
-            "auth_modes": ["session", "api_key"],
-        },
-        {
-            "module_key": "operations_admin",
-            "module_name": "행정업무 모듈",
-            "ui_path": "/pwa/",
-            "api_prefix": "/api/ops",
-            "auth_modes": ["session"],
-        },
-        {
-            "module_key": "facility_ops",
-            "module_name": "시설운영 모듈",
-            "ui_path": "/pwa/",
-            "api_prefix": "/api/facility",
-            "auth_modes": ["session"],
-        },
-    ]
     return {
         "ok": True,
-        "allowed_modules": ["complaint_engine", "operations_admin", "facility_ops"],
-        "contracts": contracts,
+        "allowed_modules": list(MODULE_KEYS),
+        "contracts": list(MODULE_CONTRACTS),
     }
 
 
@@ -808,17 +907,20 @@ async def admin_legacy_import(
         raise HTTPException(status_code=400, detail="지원하지 않는 이관 파일 형식입니다.")
 
     temp_path = ""
+    source_bundle: Optional[Dict[str, Any]] = None
     try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as handle:
-            temp_path = handle.name
-            while True:
-                chunk = await source_file.read(1024 * 1024)
-                if not chunk:
-                    break
-                handle.write(chunk)
+        if suffix == ".json":
+            # JSON bundles parse straight from the upload; only SQLite sources need a file on disk.
+            await source_file.seek(0)
+            source_bundle = load_legacy_json_bytes(await source_file.read())
+        else:
+            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as handle:
+                temp_path = handle.name
+            await _save_upload(source_file, Path(temp_path))
 
         item = import_legacy_source(
             source_path=temp_path,
+            source_bundle=source_bundle,
             tenant_id=str(tenant_id or "").strip().lower(),
             tenant_name=str(tenant_name or "").strip(),
             site_code=str(site_code or "").strip(),
@@ -846,8 +948,5 @@ async def admin_legacy_import(
             await source_file.close()
         except Exception:
             pass
-        if temp_path and os.path.exists(temp_path):
-            try:
-                os.remove(temp_path)
-            except OSError:
-                pass
+        if temp_path:
+            _remove_upload(Path(temp_path))
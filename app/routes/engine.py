@@ -10,8 +10,8 @@ from io import BytesIO
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, Body, File, Form, HTTPException, Query, Request, UploadFile
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi import APIRouter, BackgroundTasks, Body, File, Form, HTTPException, Query, Request, UploadFile
+from fastapi.responses import Response
 from starlette.concurrency import run_in_threadpool
 
 from ..ai_service import MAX_CHAT_DIGEST_IMAGES, analyze_chat_digest, classify_complaint_text, normalize_summary_text
@@ -23,6 +23,7 @@ from ..db import (
     get_auth_user_by_token,
     get_tenant,
     get_tenant_by_api_key,
+    log_activity,
     log_usage,
     mark_tenant_used,
 )
@@ -38,7 +39,6 @@ from ..engine_db import (
     list_complaints,
     update_complaint,
 )
-from ..report_pdf import build_kakao_digest_pdf, build_work_report_pdf
 from ..work_report_batch import (
     build_work_report_job_dir,
     complete_work_report_job,
@@ -51,12 +51,14 @@ from ..work_report_batch import (
     reclaim_work_report_job_storage,
     WORK_REPORT_JOB_IMAGE_PREVIEW_DIR,
     update_work_report_job_progress,
+    work_report_job_payload,
 )
 from ..work_report_service import (
     MAX_WORK_REPORT_ATTACHMENTS,
     MAX_WORK_REPORT_IMAGES,
     analyze_work_report,
 )
+from .core import _file_response, _remove_upload, _request_tenant, _save_upload
 
 router = APIRouter()
 logger = logging.getLogger("ka-part.work-report")
@@ -73,6 +75,8 @@ WORK_REPORT_SAMPLE_MAX_BYTES = 30 * 1024 * 1024
 MAX_WORK_REPORT_SOURCE_FILES = 20
 WORK_REPORT_BATCH_METADATA_FILE = "job-input.json"
 WORK_REPORT_BATCH_TASKS: set[asyncio.Task[Any]] = set()
+WORK_REPORT_PREVIEW_TEXT_EXTENSIONS = frozenset((".hwp", ".txt", ".md"))
+WORK_REPORT_IMAGE_EXTENSIONS = frozenset((".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp"))
 WORK_REPORT_PREVIEW_MAX_DIM = 960
 WORK_REPORT_PREVIEW_IMAGE_QUALITY = 78
 
@@ -93,7 +97,7 @@ def _resolve_context(request: Request) -> Tuple[Optional[Dict[str, Any]], Option
     token = _access_token(request)
     user = get_auth_user_by_token(token)
     if user:
-        tenant = get_tenant(str(user.get("tenant_id") or "")) if user.get("tenant_id") else None
+        tenant = _request_tenant(request, str(user.get("tenant_id") or "")) if user.get("tenant_id") else None
         return user, tenant
     tenant = get_tenant_by_api_key(token)
     if tenant:
@@ -113,14 +117,14 @@ def _tenant_id_from_request(request: Request, payload: Dict[str, Any] | None = N
         tenant_id = requested or str(user.get("tenant_id") or "").strip().lower()
         if not tenant_id:
             raise HTTPException(status_code=400, detail="tenant_id가 필요합니다.")
-        tenant = get_tenant(tenant_id)
+        tenant = _request_tenant(request, tenant_id)
         if not tenant:
             raise HTTPException(status_code=404, detail="tenant not found")
         return tenant_id, user, tenant
     tenant_id = str(user.get("tenant_id") or "").strip().lower()
     if not tenant_id:
         raise HTTPException(status_code=400, detail="계정에 tenant_id가 연결되어 있지 않습니다.")
-    tenant = get_tenant(tenant_id)
+    tenant = _request_tenant(request, tenant_id)
     if not tenant:
         raise HTTPException(status_code=404, detail="tenant not found")
     return tenant_id, user, tenant
@@ -179,7 +183,7 @@ def _resolve_uploaded_path(file_url: str) -> Path | None:
     if not tenant_id or not filename:
         return None
     target = (UPLOAD_ROOT / tenant_id / filename).resolve()
-    if not str(target).startswith(str(UPLOAD_ROOT)):
+    if not target.is_relative_to(UPLOAD_ROOT):
         return None
     return target
 
@@ -254,10 +258,9 @@ async def _read_work_report_attachments(files: List[UploadFile]) -> List[Dict[st
         try:
             if len(raw) > WORK_REPORT_FILE_MAX_BYTES:
                 raise HTTPException(status_code=400, detail="업무보고 첨부파일 한 건은 15MB 이하여야 합니다.")
-            suffix = Path(filename).suffix.lower()
-            if suffix in {".hwp", ".txt", ".md"}:
+            if os.path.splitext(filename)[1].lower() in WORK_REPORT_PREVIEW_TEXT_EXTENSIONS:
                 try:
-                    preview = extract_document_sample(filename, raw)
+                    preview = await run_in_threadpool(extract_document_sample, filename, raw)
                     preview_text = "\n".join(str(line or "") for line in (preview.get("lines") or [])[:8])
                 except Exception:
                     preview_text = ""
@@ -287,7 +290,7 @@ async def _read_work_report_sample(upload: Optional[UploadFile]) -> Dict[str, An
         if len(file_bytes) > WORK_REPORT_SAMPLE_MAX_BYTES:
             raise HTTPException(status_code=400, detail="샘플 양식 파일은 30MB 이하여야 합니다.")
         try:
-            sample = extract_document_sample(raw_name, file_bytes)
+            sample = await run_in_threadpool(extract_document_sample, raw_name, file_bytes)
         except ValueError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
         sample["source_name"] = raw_name
@@ -303,7 +306,7 @@ def _is_work_report_image_upload(upload: UploadFile, file_name: str) -> bool:
     content_type = str(upload.content_type or "").lower()
     if content_type.startswith("image/"):
         return True
-    return Path(str(file_name or "")).suffix.lower() in {".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp"}
+    return os.path.splitext(str(file_name or ""))[1].lower() in WORK_REPORT_IMAGE_EXTENSIONS
 
 
 async def _read_work_report_sources(uploads: List[UploadFile]) -> Dict[str, Any]:
@@ -333,7 +336,7 @@ async def _read_work_report_sources(uploads: List[UploadFile]) -> Dict[str, Any]
             if len(file_bytes) > WORK_REPORT_SAMPLE_MAX_BYTES:
                 raise HTTPException(status_code=400, detail="카톡 원문 파일은 30MB 이하여야 합니다.")
             try:
-                source = extract_document_sample(raw_name, file_bytes)
+                source = await run_in_threadpool(extract_document_sample, raw_name, file_bytes)
             except ValueError as exc:
                 raise HTTPException(status_code=400, detail=str(exc)) from exc
             source_names.append(raw_name)
@@ -362,10 +365,11 @@ def _safe_work_report_batch_name(filename: str, default: str) -> str:
 def _write_work_report_batch_preview_image(job_dir: Path, *, image_index: int, raw: bytes) -> str:
     if image_index <= 0 or not raw:
         return ""
-    preview_root = (job_dir / WORK_REPORT_JOB_IMAGE_PREVIEW_DIR).resolve()
+    job_root = job_dir.resolve()
+    preview_root = (job_root / WORK_REPORT_JOB_IMAGE_PREVIEW_DIR).resolve()
     preview_root.mkdir(parents=True, exist_ok=True)
     preview_path = (preview_root / f"{image_index:03d}.jpg").resolve()
-    if not str(preview_path).startswith(str(job_dir.resolve())):
+    if not preview_path.is_relative_to(job_root):
         raise ValueError("invalid batch image preview path")
     if PILImage is None:
         return ""
@@ -380,19 +384,20 @@ def _write_work_report_batch_preview_image(job_dir: Path, *, image_index: int, r
         if not preview_bytes:
             return ""
         preview_path.write_bytes(preview_bytes)
-        return str(preview_path.relative_to(job_dir.resolve())).replace("\\", "/")
+        return str(preview_path.relative_to(job_root)).replace("\\", "/")
     except Exception:
         return ""
 
 
 def _stage_work_report_batch_images(job_dir: Path, rows: List[Dict[str, Any]], folder: str, *, create_preview: bool = False) -> List[Dict[str, Any]]:
     staged: List[Dict[str, Any]] = []
-    target_root = (job_dir / folder).resolve()
+    job_root = job_dir.resolve()
+    target_root = (job_root / folder).resolve()
     target_root.mkdir(parents=True, exist_ok=True)
     for index, row in enumerate(list(rows or []), start=1):
         filename = _safe_work_report_batch_name(str(row.get("filename") or ""), f"{folder}-{index}.bin")
         target_path = (target_root / f"{index:03d}-{filename}").resolve()
-        if not str(target_path).startswith(str(job_dir.resolve())):
+        if not target_path.is_relative_to(job_root):
             raise ValueError("invalid batch image path")
         raw = bytes(row.get("bytes") or b"")
         target_path.write_bytes(raw)
@@ -402,7 +407,7 @@ def _stage_work_report_batch_images(job_dir: Path, rows: List[Dict[str, Any]], f
                 "filename": str(row.get("filename") or filename),
                 "content_type": str(row.get("content_type") or "image/jpeg"),
                 "size_bytes": int(row.get("size_bytes") or len(raw)),
-                "relative_path": str(target_path.relative_to(job_dir.resolve())).replace("\\", "/"),
+                "relative_path": str(target_path.relative_to(job_root)).replace("\\", "/"),
                 "preview_relative_path": preview_relative_path,
             }
         )
@@ -446,7 +451,7 @@ def _write_work_report_batch_payload(
         },
     }
     metadata_path = (target_dir / WORK_REPORT_BATCH_METADATA_FILE).resolve()
-    if not str(metadata_path).startswith(str(target_dir)):
+    if not metadata_path.is_relative_to(target_dir):
         raise ValueError("invalid work report metadata path")
     metadata_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
 
@@ -454,7 +459,7 @@ def _write_work_report_batch_payload(
 def _read_work_report_batch_payload(job_dir: Path) -> Dict[str, Any]:
     target_dir = job_dir.resolve()
     metadata_path = (target_dir / WORK_REPORT_BATCH_METADATA_FILE).resolve()
-    if not str(metadata_path).startswith(str(target_dir)) or not metadata_path.exists():
+    if not metadata_path.is_relative_to(target_dir) or not metadata_path.exists():
         raise ValueError("업무보고 배치 입력을 찾을 수 없습니다.")
     try:
         payload = json.loads(metadata_path.read_text(encoding="utf-8"))
@@ -472,14 +477,18 @@ def _read_work_report_batch_payload(job_dir: Path) -> Dict[str, Any]:
             if not relative_path:
                 continue
             file_path = (target_dir / relative_path).resolve()
-            if not str(file_path).startswith(str(target_dir)) or not file_path.exists():
+            if not file_path.is_relative_to(target_dir):
+                continue
+            try:
+                raw = file_path.read_bytes()
+            except OSError:
                 continue
             items.append(
                 {
                     "filename": str(row.get("filename") or file_path.name),
                     "content_type": str(row.get("content_type") or "image/jpeg"),
-                    "size_bytes": int(row.get("size_bytes") or file_path.stat().st_size),
-                    "bytes": file_path.read_bytes(),
+                    "size_bytes": int(row.get("size_bytes") or len(raw)),
+                    "bytes": raw,
                     "preview_relative_path": str(row.get("preview_relative_path") or "").strip(),
                 }
             )
@@ -639,8 +648,7 @@ def ai_classify(request: Request, payload: Dict[str, Any] = Body(...)) -> Dict[s
         item = classify_complaint_text(text)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    log_usage(tenant_id, "ai.classify")
-    append_audit_log(tenant_id, "ai_classify", _actor_label(user, tenant), {"text": text[:120]})
+    log_activity(tenant_id, "ai.classify", "ai_classify", _actor_label(user, tenant), {"text": text[:120]})
     return {"ok": True, "item": item}
 
 
@@ -654,8 +662,13 @@ def ai_kakao_digest(request: Request, payload: Dict[str, Any] = Body(...)) -> Di
         item = analyze_chat_digest(text)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    log_usage(tenant_id, "ai.kakao_digest")
-    append_audit_log(tenant_id, "ai_kakao_digest", _actor_label(user, tenant), {"lines": len(text.splitlines())})
+    log_activity(
+        tenant_id,
+        "ai.kakao_digest",
+        "ai_kakao_digest",
+        _actor_label(user, tenant),
+        {"lines": len(text.splitlines())},
+    )
     return {"ok": True, "item": item}
 
 
@@ -672,12 +685,12 @@ async def ai_kakao_digest_images(
     if not str(text or "").strip() and not image_inputs:
         raise HTTPException(status_code=400, detail="text or image is required")
     try:
-        item = analyze_chat_digest(str(text or "").strip(), image_inputs=image_inputs)
+        item = await run_in_threadpool(analyze_chat_digest, str(text or "").strip(), image_inputs=image_inputs)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    log_usage(resolved_tenant_id, "ai.kakao_digest.images")
-    append_audit_log(
+    log_activity(
         resolved_tenant_id,
+        "ai.kakao_digest.images",
         "ai_kakao_digest_images",
         _actor_label(user, tenant),
         {"lines": len(str(text or "").splitlines()), "images": len(image_inputs)},
@@ -691,7 +704,7 @@ async def ai_kakao_digest_pdf(
     tenant_id: str = Form(default=""),
     text: str = Form(default=""),
     files: List[UploadFile] = File(default=[]),
-) -> StreamingResponse:
+) -> Response:
     payload = {"tenant_id": tenant_id}
     resolved_tenant_id, user, tenant = _tenant_id_from_request(request, payload)
     source_text = str(text or "").strip()
@@ -699,8 +712,11 @@ async def ai_kakao_digest_pdf(
     if not source_text and not image_inputs:
         raise HTTPException(status_code=400, detail="text or image is required")
     try:
-        digest = analyze_chat_digest(source_text, image_inputs=image_inputs)
-        pdf_bytes = build_kakao_digest_pdf(
+        digest = await run_in_threadpool(analyze_chat_digest, source_text, image_inputs=image_inputs)
+        from ..report_pdf import build_kakao_digest_pdf
+
+        pdf_bytes = await run_in_threadpool(
+            build_kakao_digest_pdf,
             digest=digest,
             tenant_label=_tenant_label(resolved_tenant_id, tenant),
             source_text=source_text,
@@ -708,16 +724,16 @@ async def ai_kakao_digest_pdf(
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    log_usage(resolved_tenant_id, "ai.kakao_digest.pdf")
-    append_audit_log(
+    log_activity(
         resolved_tenant_id,
+        "ai.kakao_digest.pdf",
         "ai_kakao_digest_pdf",
         _actor_label(user, tenant),
         {"lines": len(source_text.splitlines()), "images": len(image_inputs)},
     )
     file_name = f"kakao-digest-{_download_name(resolved_tenant_id)}.pdf"
     headers = {"Content-Disposition": f'attachment; filename="{file_name}"'}
-    return StreamingResponse(iter([pdf_bytes]), media_type="application/pdf", headers=headers)
+    return Response(content=pdf_bytes, media_type="application/pdf", headers=headers)
 
 
 @router.post("/ai/work_report")
@@ -760,9 +776,9 @@ async def ai_work_report(
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     item["template_source_name"] = str(sample.get("source_name") or "").strip()
     item["template_kind"] = str(sample.get("kind") or "").strip()
-    log_usage(resolved_tenant_id, "ai.work_report")
-    append_audit_log(
+    log_activity(
         resolved_tenant_id,
+        "ai.work_report",
         "ai_work_report",
         _actor_label(user, tenant),
         {
@@ -847,9 +863,9 @@ async def ai_work_report_job_create(
         shutil.rmtree(job_dir, ignore_errors=True)
         raise
 
-    log_usage(resolved_tenant_id, "ai.work_report.batch")
-    append_audit_log(
+    log_activity(
         resolved_tenant_id,
+        "ai.work_report.batch",
         "ai_work_report_batch_create",
         _actor_label(user, tenant),
         {
@@ -880,22 +896,19 @@ async def ai_work_report_job_create(
 @router.get("/ai/work_report/jobs/{job_id}")
 def ai_work_report_job_detail(request: Request, job_id: str) -> Dict[str, Any]:
     record, _user, _tenant = _authorized_work_report_job(request, job_id)
-    item = get_work_report_job(str(record.get("id") or ""), include_result=True)
-    if not item:
-        raise HTTPException(status_code=404, detail="work report job not found")
-    return {"ok": True, "item": item}
+    return {"ok": True, "item": work_report_job_payload(record, include_result=True)}
 
 
 @router.get("/ai/work_report/jobs/{job_id}/images/{image_index}")
-def ai_work_report_job_image_preview(request: Request, job_id: str, image_index: int) -> FileResponse:
+def ai_work_report_job_image_preview(request: Request, job_id: str, image_index: int) -> Response:
     record, _user, _tenant = _authorized_work_report_job(request, job_id)
     if int(image_index or 0) <= 0:
         raise HTTPException(status_code=404, detail="work report image not found")
     job_dir = Path(str(record.get("job_dir") or "")).resolve()
     preview_path = (job_dir / WORK_REPORT_JOB_IMAGE_PREVIEW_DIR / f"{int(image_index):03d}.jpg").resolve()
-    if not str(preview_path).startswith(str(job_dir)) or not preview_path.exists():
+    if not preview_path.is_relative_to(job_dir):
         raise HTTPException(status_code=404, detail="work report image not found")
-    return FileResponse(preview_path, media_type="image/jpeg")
+    return _file_response(request, preview_path, media_type="image/jpeg", detail="work report image not found")
 
 
 @router.post("/ai/work_report/pdf")
@@ -909,7 +922,7 @@ async def ai_work_report_pdf(
     attachments: List[UploadFile] = File(default=[]),
     sample_file: UploadFile | None = File(default=None),
     report_json: str = Form(default=""),
-) -> StreamingResponse:
+) -> Response:
     payload = {"tenant_id": tenant_id}
     resolved_tenant_id, user, tenant = _tenant_id_from_request(request, payload)
     merged_source_files = ([source_file] if source_file else []) + list(source_files or [])
@@ -946,6 +959,8 @@ async def ai_work_report_pdf(
             sample_title=str(sample.get("title") or "").strip(),
             sample_lines=[str(line or "") for line in sample.get("lines") or []],
         )
+        from ..report_pdf import build_work_report_pdf
+
         pdf_bytes = await run_in_threadpool(
             build_work_report_pdf,
             report=report,
@@ -957,9 +972,9 @@ async def ai_work_report_pdf(
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    log_usage(resolved_tenant_id, "ai.work_report.pdf")
-    append_audit_log(
+    log_activity(
         resolved_tenant_id,
+        "ai.work_report.pdf",
         "ai_work_report_pdf",
         _actor_label(user, tenant),
         {
@@ -974,7 +989,7 @@ async def ai_work_report_pdf(
     )
     file_name = f"work-report-{_download_name(resolved_tenant_id)}.pdf"
     headers = {"Content-Disposition": f'attachment; filename="{file_name}"'}
-    return StreamingResponse(iter([pdf_bytes]), media_type="application/pdf", headers=headers)
+    return Response(content=pdf_bytes, media_type="application/pdf", headers=headers)
 
 
 @router.post("/ai/work_report/feedback")
@@ -988,7 +1003,7 @@ def ai_work_report_feedback(request: Request, payload: Dict[str, Any] = Body(...
         raise HTTPException(status_code=400, detail="report 형식이 잘못되었습니다.")
 
     corrections: List[Dict[str, Any]] = []
-    for row in list(corrections_raw or [])[:500]:
+    for row in corrections_raw[:500]:
         if not isinstance(row, dict):
             continue
         corrections.append(
@@ -1018,9 +1033,13 @@ def ai_work_report_feedback(request: Request, payload: Dict[str, Any] = Body(...
             }
         )
 
-    report = dict(report_raw or {})
-    report_items = list(report.get("items") or []) if isinstance(report.get("items"), list) else []
-    unmatched_images = list(report.get("unmatched_images") or []) if isinstance(report.get("unmatched_images"), list) else []
+    report = report_raw
+    report_items = report.get("items")
+    if not isinstance(report_items, list):
+        report_items = []
+    unmatched_images = report.get("unmatched_images")
+    if not isinstance(unmatched_images, list):
+        unmatched_images = []
     actor_label = _actor_label(user, tenant)
     report_summary = {
         "report_title": str(report.get("report_title") or "").strip()[:160],
@@ -1028,7 +1047,7 @@ def ai_work_report_feedback(request: Request, payload: Dict[str, Any] = Body(...
         "analysis_model": str(report.get("analysis_model") or "").strip()[:80],
         "analysis_reason": str(report.get("analysis_reason") or "").strip()[:80],
         "item_count": len(report_items),
-        "image_item_count": sum(1 for item in report_items if isinstance(item, dict) and list(item.get("images") or [])),
+        "image_item_count": sum(1 for item in report_items if isinstance(item, dict) and item.get("images")),
         "unmatched_image_count": len(unmatched_images),
         "items": [
             {
@@ -1138,9 +1157,9 @@ def ai_kakao_digest_import(request: Request, payload: Dict[str, Any] = Body(...)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    log_usage(tenant_id, "ai.kakao_digest.import")
-    append_audit_log(
+    log_activity(
         tenant_id,
+        "ai.kakao_digest.import",
         "ai_kakao_digest_import",
         _actor_label(user, tenant),
         {"count": len(created_items), "source_text_lines": len(source_text.splitlines())},
@@ -1156,8 +1175,13 @@ def dashboard(request: Request, tenant_id: str = Query(default=""), day: str = Q
         item = dashboard_summary(tenant_id=resolved_tenant_id, target_day=day)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    log_usage(resolved_tenant_id, "dashboard.summary")
-    append_audit_log(resolved_tenant_id, "dashboard_summary", _actor_label(user, tenant), {"day": day or ""})
+    log_activity(
+        resolved_tenant_id,
+        "dashboard.summary",
+        "dashboard_summary",
+        _actor_label(user, tenant),
+        {"day": day or ""},
+    )
     return {"ok": True, "tenant": tenant, "item": item}
 
 
@@ -1169,8 +1193,7 @@ def report_daily(request: Request, tenant_id: str = Query(default=""), day: str
         item = generate_daily_report(tenant_id=resolved_tenant_id, target_day=day)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    log_usage(resolved_tenant_id, "report.daily")
-    append_audit_log(resolved_tenant_id, "daily_report", _actor_label(user, tenant), {"day": day or ""})
+    log_activity(resolved_tenant_id, "report.daily", "daily_report", _actor_label(user, tenant), {"day": day or ""})
     return {"ok": True, "tenant": tenant, "item": item}
 
 
@@ -1210,8 +1233,13 @@ def complaints_create(request: Request, payload: Dict[str, Any] = Body(...)) ->
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    log_usage(tenant_id, "complaints.create")
-    append_audit_log(tenant_id, "create_complaint", _actor_label(user, tenant), {"complaint_id": item.get("id")})
+    log_activity(
+        tenant_id,
+        "complaints.create",
+        "create_complaint",
+        _actor_label(user, tenant),
+        {"complaint_id": item.get("id")},
+    )
     return {"ok": True, "item": item}
 
 
@@ -1223,6 +1251,7 @@ def complaints_list(
     building: str = Query(default=""),
     unit: str = Query(default=""),
     complaint_type: str = Query(default=""),
+    query: str = Query(default=""),
     limit: int = Query(default=100, ge=1, le=500),
 ) -> Dict[str, Any]:
     payload = {"tenant_id": tenant_id}
@@ -1234,6 +1263,7 @@ def complaints_list(
             building=building,
             unit=unit,
             complaint_type=complaint_type,
+            query=query,
             limit=limit,
         )
     except ValueError as exc:
@@ -1273,13 +1303,23 @@ def complaints_update(request: Request, complaint_id: int, payload: Dict[str, An
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    log_usage(tenant_id, "complaints.update")
-    append_audit_log(tenant_id, "update_complaint", _actor_label(user, tenant), {"complaint_id": int(complaint_id), "status": status})
+    log_activity(
+        tenant_id,
+        "complaints.update",
+        "update_complaint",
+        _actor_label(user, tenant),
+        {"complaint_id": int(complaint_id), "status": status},
+    )
     return {"ok": True, "item": item}
 
 
 @router.delete("/complaints/{complaint_id}")
-def complaints_delete(request: Request, complaint_id: int, payload: Dict[str, Any] | None = Body(default=None)) -> Dict[str, Any]:
+def complaints_delete(
+    request: Request,
+    complaint_id: int,
+    background_tasks: BackgroundTasks,
+    payload: Dict[str, Any] | None = Body(default=None),
+) -> Dict[str, Any]:
     payload = payload or {}
     tenant_id, user, tenant = _tenant_id_from_request(request, payload)
     if not _can_delete_complaint(user):
@@ -1289,11 +1329,14 @@ def complaints_delete(request: Request, complaint_id: int, payload: Dict[str, An
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     for attachment in item.get("attachments") or []:
-        target = _resolve_uploaded_path(str(attachment.get("file_url") or ""))
-        if target and target.exists() and target.is_file():
-            target.unlink(missing_ok=True)
-    log_usage(tenant_id, "complaints.delete")
-    append_audit_log(tenant_id, "delete_complaint", _actor_label(user, tenant), {"complaint_id": int(complaint_id)})
+        background_tasks.add_task(_remove_upload, _resolve_uploaded_path(str(attachment.get("file_url") or "")))
+    log_activity(
+        tenant_id,
+        "complaints.delete",
+        "delete_complaint",
+        _actor_label(user, tenant),
+        {"complaint_id": int(complaint_id)},
+    )
     return {"ok": True, "item": item}
 
 
@@ -1311,20 +1354,7 @@ async def complaints_add_attachment(
     target_dir.mkdir(parents=True, exist_ok=True)
     target_name = f"{uuid.uuid4().hex}{ext}"
     target_path = target_dir / target_name
-    total = 0
-    try:
-        with target_path.open("wb") as fp:
-            while True:
-                chunk = await file.read(1024 * 1024)
-                if not chunk:
-                    break
-                total += len(chunk)
-                fp.write(chunk)
-    finally:
-        try:
-            await file.close()
-        except Exception:
-            pass
+    total = await _save_upload(file, target_path)
     try:
         item = add_attachment(
             tenant_id=resolved_tenant_id,
@@ -1334,11 +1364,15 @@ async def complaints_add_attachment(
             size_bytes=total,
         )
     except ValueError as exc:
-        if target_path.exists():
-            target_path.unlink(missing_ok=True)
+        _remove_upload(target_path)
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    log_usage(resolved_tenant_id, "complaints.attachments")
-    append_audit_log(resolved_tenant_id, "add_attachment", _actor_label(user, tenant), {"complaint_id": int(complaint_id)})
+    log_activity(
+        resolved_tenant_id,
+        "complaints.attachments",
+        "add_attachment",
+        _actor_label(user, tenant),
+        {"complaint_id": int(complaint_id)},
+    )
     return {"ok": True, "item": item}
 
 
@@ -1346,6 +1380,7 @@ async def complaints_add_attachment(
 def complaints_delete_attachments(
     request: Request,
     complaint_id: int,
+    background_tasks: BackgroundTasks,
     payload: Dict[str, Any] | None = Body(default=None),
 ) -> Dict[str, Any]:
     payload = payload or {}
@@ -1365,12 +1400,10 @@ def complaints_delete_attachments(
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     for item in result.get("deleted") or []:
-        target = _resolve_uploaded_path(str(item.get("file_url") or ""))
-        if target and target.exists() and target.is_file():
-            target.unlink(missing_ok=True)
-    log_usage(tenant_id, "complaints.attachments.delete")
-    append_audit_log(
+        background_tasks.add_task(_remove_upload, _resolve_uploaded_path(str(item.get("file_url") or "")))
+    log_activity(
         tenant_id,
+        "complaints.attachments.delete",
         "delete_attachments",
         _actor_label(user, tenant),
         {"complaint_id": int(complaint_id), "count": len(result.get("deleted") or [])},
@@ -1379,10 +1412,8 @@ def complaints_delete_attachments(
 
 
 @router.get("/files/{tenant_id}/{filename}")
-def uploaded_file(tenant_id: str, filename: str) -> FileResponse:
+def uploaded_file(request: Request, tenant_id: str, filename: str) -> Response:
     target = (UPLOAD_ROOT / str(tenant_id or "").strip().lower() / str(filename or "").strip()).resolve()
-    if not str(target).startswith(str(UPLOAD_ROOT)):
-        raise HTTPException(status_code=404, detail="file not found")
-    if not target.exists() or not target.is_file():
+    if not target.is_relative_to(UPLOAD_ROOT):
         raise HTTPException(status_code=404, detail="file not found")
-    return FileResponse(target)
+    return _file_response(request, target)
@@ -5,10 +5,10 @@ import uuid
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
-from fastapi import APIRouter, Body, File, HTTPException, Query, Request, UploadFile
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, BackgroundTasks, Body, File, HTTPException, Query, Request, UploadFile
+from fastapi.responses import Response
 
-from ..db import STORAGE_ROOT, append_audit_log, get_tenant, log_usage
+from ..db import STORAGE_ROOT, log_activity
 from ..engine_db import create_complaint, get_complaint
 from ..facility_db import (
     MAX_ASSET_IMAGE_COUNT,
@@ -44,11 +44,37 @@ from ..facility_db import (
     update_qr_asset,
     update_work_order,
 )
-from .core import _require_auth
+from .core import _file_response, _remove_upload, _request_tenant, _require_auth, _save_upload
 
 router = APIRouter()
 UPLOAD_ROOT = (STORAGE_ROOT / "uploads" / "facility-assets").resolve()
 MAX_ASSET_IMAGE_BYTES = 10 * 1024 * 1024
+ASSET_IMAGE_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/jpg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+    "image/bmp": ".bmp",
+    "image/heic": ".heic",
+}
+ASSET_UPDATE_FIELDS = (
+    "asset_code", "asset_name", "category", "location_name", "vendor_name", "installed_on", "inspection_cycle_days",
+    "lifecycle_state", "source", "qr_id", "checklist_key", "last_inspected_at", "next_inspection_date", "note",
+)
+CHECKLIST_UPDATE_FIELDS = ("checklist_key", "title", "task_type", "version_no", "lifecycle_state", "source", "note")
+QR_ASSET_UPDATE_FIELDS = (
+    "qr_id", "asset_id", "asset_code_snapshot", "asset_name_snapshot", "location_snapshot", "default_item",
+    "checklist_key", "lifecycle_state", "source",
+)
+INSPECTION_UPDATE_FIELDS = (
+    "title", "asset_id", "qr_asset_id", "checklist_key", "inspector", "inspected_at", "result_status", "notes",
+    "measurement",
+)
+WORK_ORDER_UPDATE_FIELDS = (
+    "title", "description", "asset_id", "qr_asset_id", "inspection_id", "complaint_id", "category", "priority",
+    "status", "assignee", "reporter", "due_date", "completed_at", "resolution_notes", "is_escalated",
+)
 
 
 def _resolve_facility_context(request: Request, payload: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], str]:
@@ -58,7 +84,7 @@ def _resolve_facility_context(request: Request, payload: Optional[Dict[str, Any]
         tenant_id = requested or str(user.get("tenant_id") or "").strip().lower()
         if not tenant_id:
             raise HTTPException(status_code=400, detail="tenant_id가 필요합니다.")
-        tenant = get_tenant(tenant_id)
+        tenant = _request_tenant(request, tenant_id)
         if not tenant:
             raise HTTPException(status_code=404, detail="tenant not found")
         return user, tenant_id
@@ -91,6 +117,10 @@ def _payload_items(value: Any) -> Any:
     return str(value or "")
 
 
+def _payload_fields(payload: Dict[str, Any], fields: Tuple[str, ...]) -> Dict[str, Any]:
+    return {field: payload.get(field) for field in fields}
+
+
 def _default_work_order_priority(result_status: str) -> str:
     mapping = {"조치필요": "긴급", "주의": "높음", "정상": "보통"}
     return mapping.get(str(result_status or "").strip(), "보통")
@@ -128,7 +158,7 @@ def _resolve_uploaded_asset_path(file_url: str) -> Path | None:
         return None
     tenant_id, filename = parts
     target = (UPLOAD_ROOT / str(tenant_id or "").strip().lower() / str(filename or "").strip()).resolve()
-    if not str(target).startswith(str(UPLOAD_ROOT)):
+    if not target.is_relative_to(UPLOAD_ROOT):
         return None
     return target
 
@@ -140,32 +170,19 @@ async def _store_uploaded_asset_image(file: UploadFile, *, tenant_id: str) -> Tu
 
     ext = Path(str(file.filename or "asset-image")).suffix.lower()
     if not ext:
-        ext = str(mimetypes.guess_extension(content_type or "image/jpeg") or ".jpg").lower()
+        ext = ASSET_IMAGE_EXTENSIONS.get(content_type) or str(mimetypes.guess_extension(content_type) or ".jpg").lower()
 
     target_dir = (UPLOAD_ROOT / str(tenant_id or "").strip().lower()).resolve()
     target_dir.mkdir(parents=True, exist_ok=True)
     target_name = f"{uuid.uuid4().hex}{ext}"
     target_path = target_dir / target_name
-    total = 0
-
     try:
-        with target_path.open("wb") as handle:
-            while True:
-                chunk = await file.read(1024 * 1024)
-                if not chunk:
-                    break
-                total += len(chunk)
-                if total > MAX_ASSET_IMAGE_BYTES:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"자산 이미지는 장당 최대 10MB까지 업로드할 수 있습니다. 최대 {MAX_ASSET_IMAGE_COUNT}장까지 등록됩니다.",
-                    )
-                handle.write(chunk)
-    finally:
-        try:
-            await file.close()
-        except Exception:
-            pass
+        total = await _save_upload(file, target_path, max_bytes=MAX_ASSET_IMAGE_BYTES)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=400,
+            detail=f"자산 이미지는 장당 최대 10MB까지 업로드할 수 있습니다. 최대 {MAX_ASSET_IMAGE_COUNT}장까지 등록됩니다.",
+        ) from exc
 
     return target_path, target_name, total, content_type or "image/jpeg"
 
@@ -195,8 +212,7 @@ def _asset_uploaded_targets(item: Dict[str, Any]) -> list[Path]:
 def facility_dashboard(request: Request, tenant_id: str = Query(default="")) -> Dict[str, Any]:
     user, resolved_tenant_id = _resolve_facility_context(request, {"tenant_id": tenant_id})
     item = facility_dashboard_summary(tenant_id=resolved_tenant_id)
-    log_usage(resolved_tenant_id, "facility.dashboard")
-    append_audit_log(resolved_tenant_id, "facility_dashboard", _actor_label(user), {})
+    log_activity(resolved_tenant_id, "facility.dashboard", "facility_dashboard", _actor_label(user), {})
     return {"ok": True, "item": item}
 
 
@@ -241,8 +257,13 @@ def facility_assets_create(request: Request, payload: Dict[str, Any] = Body(...)
         note=str(payload.get("note") or "").strip(),
         created_by_label=_actor_label(user),
     )
-    log_usage(tenant_id, "facility.assets.create")
-    append_audit_log(tenant_id, "facility_create_asset", _actor_label(user), {"asset_id": int(item["id"])})
+    log_activity(
+        tenant_id,
+        "facility.assets.create",
+        "facility_create_asset",
+        _actor_label(user),
+        {"asset_id": int(item["id"])},
+    )
     return {"ok": True, "item": item}
 
 
@@ -252,23 +273,15 @@ def facility_assets_update(request: Request, asset_id: int, payload: Dict[str, A
     item = update_asset(
         int(asset_id),
         tenant_id=tenant_id,
-        asset_code=payload.get("asset_code"),
-        asset_name=payload.get("asset_name"),
-        category=payload.get("category"),
-        location_name=payload.get("location_name"),
-        vendor_name=payload.get("vendor_name"),
-        installed_on=payload.get("installed_on"),
-        inspection_cycle_days=payload.get("inspection_cycle_days"),
-        lifecycle_state=payload.get("lifecycle_state"),
-        source=payload.get("source"),
-        qr_id=payload.get("qr_id"),
-        checklist_key=payload.get("checklist_key"),
-        last_inspected_at=payload.get("last_inspected_at"),
-        next_inspection_date=payload.get("next_inspection_date"),
-        note=payload.get("note"),
-    )
-    log_usage(tenant_id, "facility.assets.update")
-    append_audit_log(tenant_id, "facility_update_asset", _actor_label(user), {"asset_id": int(asset_id)})
+        **_payload_fields(payload, ASSET_UPDATE_FIELDS),
+    )
+    log_activity(
+        tenant_id,
+        "facility.assets.update",
+        "facility_update_asset",
+        _actor_label(user),
+        {"asset_id": int(asset_id)},
+    )
     return {"ok": True, "item": item}
 
 
@@ -292,15 +305,14 @@ async def facility_assets_upload_image(
             is_primary=bool(is_primary),
         )
     except Exception as exc:
-        if target_path.exists():
-            target_path.unlink(missing_ok=True)
+        _remove_upload(target_path)
         if isinstance(exc, ValueError):
             raise HTTPException(status_code=400, detail=str(exc)) from exc
         raise
 
-    log_usage(resolved_tenant_id, "facility.assets.image.upload")
-    append_audit_log(
+    log_activity(
         resolved_tenant_id,
+        "facility.assets.image.upload",
         "facility_asset_image_upload",
         _actor_label(user),
         {"asset_id": int(asset_id), "is_primary": bool(is_primary)},
@@ -312,6 +324,7 @@ async def facility_assets_upload_image(
 async def facility_assets_replace_primary_image(
     request: Request,
     asset_id: int,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     tenant_id: str = Query(default=""),
 ) -> Dict[str, Any]:
@@ -332,16 +345,15 @@ async def facility_assets_replace_primary_image(
             image_size_bytes=total,
         )
     except Exception as exc:
-        if target_path.exists():
-            target_path.unlink(missing_ok=True)
+        _remove_upload(target_path)
         if isinstance(exc, ValueError):
             raise HTTPException(status_code=400, detail=str(exc)) from exc
         raise
-    if old_target and old_target != target_path and old_target.exists() and old_target.is_file():
-        old_target.unlink(missing_ok=True)
-    log_usage(resolved_tenant_id, "facility.assets.image.replace_primary")
-    append_audit_log(
+    if old_target != target_path:
+        background_tasks.add_task(_remove_upload, old_target)
+    log_activity(
         resolved_tenant_id,
+        "facility.assets.image.replace_primary",
         "facility_asset_primary_image_replace",
         _actor_label(user),
         {"asset_id": int(asset_id)},
@@ -356,9 +368,9 @@ def facility_assets_set_primary_image(request: Request, asset_id: int, image_id:
         item = set_asset_primary_image(tenant_id=resolved_tenant_id, asset_id=int(asset_id), image_id=int(image_id))
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    log_usage(resolved_tenant_id, "facility.assets.image.primary")
-    append_audit_log(
+    log_activity(
         resolved_tenant_id,
+        "facility.assets.image.primary",
         "facility_asset_image_set_primary",
         _actor_label(user),
         {"asset_id": int(asset_id), "image_id": int(image_id)},
@@ -367,7 +379,13 @@ def facility_assets_set_primary_image(request: Request, asset_id: int, image_id:
 
 
 @router.delete("/facility/assets/{asset_id}/images/{image_id}")
-def facility_assets_delete_image(request: Request, asset_id: int, image_id: int, tenant_id: str = Query(default="")) -> Dict[str, Any]:
+def facility_assets_delete_image(
+    request: Request,
+    asset_id: int,
+    image_id: int,
+    background_tasks: BackgroundTasks,
+    tenant_id: str = Query(default=""),
+) -> Dict[str, Any]:
     user, resolved_tenant_id = _require_facility_editor(request, {"tenant_id": tenant_id})
     try:
         current_image = get_asset_image(tenant_id=resolved_tenant_id, asset_id=int(asset_id), image_id=int(image_id))
@@ -378,11 +396,10 @@ def facility_assets_delete_image(request: Request, asset_id: int, image_id: int,
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     target = _resolve_uploaded_asset_path(str(current_image.get("image_url") or current_image.get("file_url") or ""))
-    if target and target.exists() and target.is_file():
-        target.unlink(missing_ok=True)
-    log_usage(resolved_tenant_id, "facility.assets.image.delete")
-    append_audit_log(
+    background_tasks.add_task(_remove_upload, target)
+    log_activity(
         resolved_tenant_id,
+        "facility.assets.image.delete",
         "facility_asset_image_delete",
         _actor_label(user),
         {"asset_id": int(asset_id), "image_id": int(image_id)},
@@ -391,7 +408,12 @@ def facility_assets_delete_image(request: Request, asset_id: int, image_id: int,
 
 
 @router.delete("/facility/assets/{asset_id}/image")
-def facility_assets_delete_primary_image(request: Request, asset_id: int, tenant_id: str = Query(default="")) -> Dict[str, Any]:
+def facility_assets_delete_primary_image(
+    request: Request,
+    asset_id: int,
+    background_tasks: BackgroundTasks,
+    tenant_id: str = Query(default=""),
+) -> Dict[str, Any]:
     user, resolved_tenant_id = _require_facility_editor(request, {"tenant_id": tenant_id})
     try:
         current = get_asset(tenant_id=resolved_tenant_id, asset_id=int(asset_id))
@@ -400,11 +422,10 @@ def facility_assets_delete_primary_image(request: Request, asset_id: int, tenant
     current_primary = next((image for image in (current.get("images") or []) if int(image.get("is_primary") or 0) == 1), None)
     item = clear_asset_image(tenant_id=resolved_tenant_id, asset_id=int(asset_id))
     target = _resolve_uploaded_asset_path(str((current_primary or {}).get("image_url") or current.get("image_url") or ""))
-    if target and target.exists() and target.is_file():
-        target.unlink(missing_ok=True)
-    log_usage(resolved_tenant_id, "facility.assets.image.delete_primary")
-    append_audit_log(
+    background_tasks.add_task(_remove_upload, target)
+    log_activity(
         resolved_tenant_id,
+        "facility.assets.image.delete_primary",
         "facility_asset_primary_image_delete",
         _actor_label(user),
         {"asset_id": int(asset_id)},
@@ -413,25 +434,32 @@ def facility_assets_delete_primary_image(request: Request, asset_id: int, tenant
 
 
 @router.delete("/facility/assets/{asset_id}")
-def facility_assets_delete(request: Request, asset_id: int, payload: Dict[str, Any] | None = Body(default=None)) -> Dict[str, Any]:
+def facility_assets_delete(
+    request: Request,
+    asset_id: int,
+    background_tasks: BackgroundTasks,
+    payload: Dict[str, Any] | None = Body(default=None),
+) -> Dict[str, Any]:
     user, tenant_id = _require_facility_editor(request, payload or {})
     item = delete_asset(tenant_id=tenant_id, asset_id=int(asset_id))
     for target in _asset_uploaded_targets(item):
-        if target.exists() and target.is_file():
-            target.unlink(missing_ok=True)
-    log_usage(tenant_id, "facility.assets.delete")
-    append_audit_log(tenant_id, "facility_delete_asset", _actor_label(user), {"asset_id": int(asset_id)})
+        background_tasks.add_task(_remove_upload, target)
+    log_activity(
+        tenant_id,
+        "facility.assets.delete",
+        "facility_delete_asset",
+        _actor_label(user),
+        {"asset_id": int(asset_id)},
+    )
     return {"ok": True, "item": item}
 
 
 @router.get("/facility/files/{tenant_id}/{filename}")
-def facility_uploaded_file(tenant_id: str, filename: str) -> FileResponse:
+def facility_uploaded_file(request: Request, tenant_id: str, filename: str) -> Response:
     target = (UPLOAD_ROOT / str(tenant_id or "").strip().lower() / str(filename or "").strip()).resolve()
-    if not str(target).startswith(str(UPLOAD_ROOT)):
-        raise HTTPException(status_code=404, detail="file not found")
-    if not target.exists() or not target.is_file():
+    if not target.is_relative_to(UPLOAD_ROOT):
         raise HTTPException(status_code=404, detail="file not found")
-    return FileResponse(target)
+    return _file_response(request, target)
 
 
 @router.get("/facility/checklists")
@@ -455,8 +483,13 @@ def facility_checklists_create(request: Request, payload: Dict[str, Any] = Body(
         items=_payload_items(payload.get("items")),
         created_by_label=_actor_label(user),
     )
-    log_usage(tenant_id, "facility.checklists.create")
-    append_audit_log(tenant_id, "facility_create_checklist", _actor_label(user), {"checklist_id": int(item["id"])})
+    log_activity(
+        tenant_id,
+        "facility.checklists.create",
+        "facility_create_checklist",
+        _actor_label(user),
+        {"checklist_id": int(item["id"])},
+    )
     return {"ok": True, "item": item}
 
 
@@ -466,17 +499,16 @@ def facility_checklists_update(request: Request, checklist_id: int, payload: Dic
     item = update_checklist(
         int(checklist_id),
         tenant_id=tenant_id,
-        checklist_key=payload.get("checklist_key"),
-        title=payload.get("title"),
-        task_type=payload.get("task_type"),
-        version_no=payload.get("version_no"),
-        lifecycle_state=payload.get("lifecycle_state"),
-        source=payload.get("source"),
-        note=payload.get("note"),
+        **_payload_fields(payload, CHECKLIST_UPDATE_FIELDS),
         items=_payload_items(payload.get("items")) if "items" in payload else None,
     )
-    log_usage(tenant_id, "facility.checklists.update")
-    append_audit_log(tenant_id, "facility_update_checklist", _actor_label(user), {"checklist_id": int(checklist_id)})
+    log_activity(
+        tenant_id,
+        "facility.checklists.update",
+        "facility_update_checklist",
+        _actor_label(user),
+        {"checklist_id": int(checklist_id)},
+    )
     return {"ok": True, "item": item}
 
 
@@ -484,8 +516,13 @@ def facility_checklists_update(request: Request, checklist_id: int, payload: Dic
 def facility_checklists_delete(request: Request, checklist_id: int, payload: Dict[str, Any] | None = Body(default=None)) -> Dict[str, Any]:
     user, tenant_id = _require_facility_editor(request, payload or {})
     item = delete_checklist(tenant_id=tenant_id, checklist_id=int(checklist_id))
-    log_usage(tenant_id, "facility.checklists.delete")
-    append_audit_log(tenant_id, "facility_delete_checklist", _actor_label(user), {"checklist_id": int(checklist_id)})
+    log_activity(
+        tenant_id,
+        "facility.checklists.delete",
+        "facility_delete_checklist",
+        _actor_label(user),
+        {"checklist_id": int(checklist_id)},
+    )
     return {"ok": True, "item": item}
 
 
@@ -511,8 +548,13 @@ def facility_qr_assets_create(request: Request, payload: Dict[str, Any] = Body(.
         source=str(payload.get("source") or "manual").strip(),
         created_by_label=_actor_label(user),
     )
-    log_usage(tenant_id, "facility.qr_assets.create")
-    append_audit_log(tenant_id, "facility_create_qr_asset", _actor_label(user), {"qr_asset_id": int(item["id"])})
+    log_activity(
+        tenant_id,
+        "facility.qr_assets.create",
+        "facility_create_qr_asset",
+        _actor_label(user),
+        {"qr_asset_id": int(item["id"])},
+    )
     return {"ok": True, "item": item}
 
 
@@ -522,18 +564,15 @@ def facility_qr_assets_update(request: Request, qr_asset_id: int, payload: Dict[
     item = update_qr_asset(
         int(qr_asset_id),
         tenant_id=tenant_id,
-        qr_id=payload.get("qr_id"),
-        asset_id=payload.get("asset_id"),
-        asset_code_snapshot=payload.get("asset_code_snapshot"),
-        asset_name_snapshot=payload.get("asset_name_snapshot"),
-        location_snapshot=payload.get("location_snapshot"),
-        default_item=payload.get("default_item"),
-        checklist_key=payload.get("checklist_key"),
-        lifecycle_state=payload.get("lifecycle_state"),
-        source=payload.get("source"),
-    )
-    log_usage(tenant_id, "facility.qr_assets.update")
-    append_audit_log(tenant_id, "facility_update_qr_asset", _actor_label(user), {"qr_asset_id": int(qr_asset_id)})
+        **_payload_fields(payload, QR_ASSET_UPDATE_FIELDS),
+    )
+    log_activity(
+        tenant_id,
+        "facility.qr_assets.update",
+        "facility_update_qr_asset",
+        _actor_label(user),
+        {"qr_asset_id": int(qr_asset_id)},
+    )
     return {"ok": True, "item": item}
 
 
@@ -541,8 +580,13 @@ def facility_qr_assets_update(request: Request, qr_asset_id: int, payload: Dict[
 def facility_qr_assets_delete(request: Request, qr_asset_id: int, payload: Dict[str, Any] | None = Body(default=None)) -> Dict[str, Any]:
     user, tenant_id = _require_facility_editor(request, payload or {})
     item = delete_qr_asset(tenant_id=tenant_id, qr_asset_id=int(qr_asset_id))
-    log_usage(tenant_id, "facility.qr_assets.delete")
-    append_audit_log(tenant_id, "facility_delete_qr_asset", _actor_label(user), {"qr_asset_id": int(qr_asset_id)})
+    log_activity(
+        tenant_id,
+        "facility.qr_assets.delete",
+        "facility_delete_qr_asset",
+        _actor_label(user),
+        {"qr_asset_id": int(qr_asset_id)},
+    )
     return {"ok": True, "item": item}
 
 
@@ -568,8 +612,13 @@ def facility_inspections_create(request: Request, payload: Dict[str, Any] = Body
         measurement=payload.get("measurement"),
         created_by_label=_actor_label(user),
     )
-    log_usage(tenant_id, "facility.inspections.create")
-    append_audit_log(tenant_id, "facility_create_inspection", _actor_label(user), {"inspection_id": int(item["id"])})
+    log_activity(
+        tenant_id,
+        "facility.inspections.create",
+        "facility_create_inspection",
+        _actor_label(user),
+        {"inspection_id": int(item["id"])},
+    )
     return {"ok": True, "item": item}
 
 
@@ -579,18 +628,15 @@ def facility_inspections_update(request: Request, inspection_id: int, payload: D
     item = update_inspection(
         int(inspection_id),
         tenant_id=tenant_id,
-        title=payload.get("title"),
-        asset_id=payload.get("asset_id"),
-        qr_asset_id=payload.get("qr_asset_id"),
-        checklist_key=payload.get("checklist_key"),
-        inspector=payload.get("inspector"),
-        inspected_at=payload.get("inspected_at"),
-        result_status=payload.get("result_status"),
-        notes=payload.get("notes"),
-        measurement=payload.get("measurement"),
+        **_payload_fields(payload, INSPECTION_UPDATE_FIELDS),
+    )
+    log_activity(
+        tenant_id,
+        "facility.inspections.update",
+        "facility_update_inspection",
+        _actor_label(user),
+        {"inspection_id": int(inspection_id)},
     )
-    log_usage(tenant_id, "facility.inspections.update")
-    append_audit_log(tenant_id, "facility_update_inspection", _actor_label(user), {"inspection_id": int(inspection_id)})
     return {"ok": True, "item": item}
 
 
@@ -598,8 +644,13 @@ def facility_inspections_update(request: Request, inspection_id: int, payload: D
 def facility_inspections_delete(request: Request, inspection_id: int, payload: Dict[str, Any] | None = Body(default=None)) -> Dict[str, Any]:
     user, tenant_id = _require_facility_editor(request, payload or {})
     item = delete_inspection(tenant_id=tenant_id, inspection_id=int(inspection_id))
-    log_usage(tenant_id, "facility.inspections.delete")
-    append_audit_log(tenant_id, "facility_delete_inspection", _actor_label(user), {"inspection_id": int(inspection_id)})
+    log_activity(
+        tenant_id,
+        "facility.inspections.delete",
+        "facility_delete_inspection",
+        _actor_label(user),
+        {"inspection_id": int(inspection_id)},
+    )
     return {"ok": True, "item": item}
 
 
@@ -630,9 +681,9 @@ def facility_inspections_issue_work_order(request: Request, inspection_id: int,
         is_escalated=bool(payload.get("is_escalated")) or priority == "긴급",
         created_by_label=_actor_label(user),
     )
-    log_usage(tenant_id, "facility.inspections.issue_work_order")
-    append_audit_log(
+    log_activity(
         tenant_id,
+        "facility.inspections.issue_work_order",
         "facility_issue_work_order_from_inspection",
         _actor_label(user),
         {"inspection_id": int(inspection_id), "work_order_id": int(item["id"])},
@@ -673,8 +724,13 @@ def facility_work_orders_create(request: Request, payload: Dict[str, Any] = Body
         is_escalated=bool(payload.get("is_escalated")),
         created_by_label=_actor_label(user),
     )
-    log_usage(tenant_id, "facility.work_orders.create")
-    append_audit_log(tenant_id, "facility_create_work_order", _actor_label(user), {"work_order_id": int(item["id"])})
+    log_activity(
+        tenant_id,
+        "facility.work_orders.create",
+        "facility_create_work_order",
+        _actor_label(user),
+        {"work_order_id": int(item["id"])},
+    )
     return {"ok": True, "item": item}
 
 
@@ -684,24 +740,15 @@ def facility_work_orders_update(request: Request, work_order_id: int, payload: D
     item = update_work_order(
         int(work_order_id),
         tenant_id=tenant_id,
-        title=payload.get("title"),
-        description=payload.get("description"),
-        asset_id=payload.get("asset_id"),
-        qr_asset_id=payload.get("qr_asset_id"),
-        inspection_id=payload.get("inspection_id"),
-        complaint_id=payload.get("complaint_id"),
-        category=payload.get("category"),
-        priority=payload.get("priority"),
-        status=payload.get("status"),
-        assignee=payload.get("assignee"),
-        reporter=payload.get("reporter"),
-        due_date=payload.get("due_date"),
-        completed_at=payload.get("completed_at"),
-        resolution_notes=payload.get("resolution_notes"),
-        is_escalated=payload.get("is_escalated"),
-    )
-    log_usage(tenant_id, "facility.work_orders.update")
-    append_audit_log(tenant_id, "facility_update_work_order", _actor_label(user), {"work_order_id": int(work_order_id)})
+        **_payload_fields(payload, WORK_ORDER_UPDATE_FIELDS),
+    )
+    log_activity(
+        tenant_id,
+        "facility.work_orders.update",
+        "facility_update_work_order",
+        _actor_label(user),
+        {"work_order_id": int(work_order_id)},
+    )
     return {"ok": True, "item": item}
 
 
@@ -709,8 +756,13 @@ def facility_work_orders_update(request: Request, work_order_id: int, payload: D
 def facility_work_orders_delete(request: Request, work_order_id: int, payload: Dict[str, Any] | None = Body(default=None)) -> Dict[str, Any]:
     user, tenant_id = _require_facility_editor(request, payload or {})
     item = delete_work_order(tenant_id=tenant_id, work_order_id=int(work_order_id))
-    log_usage(tenant_id, "facility.work_orders.delete")
-    append_audit_log(tenant_id, "facility_delete_work_order", _actor_label(user), {"work_order_id": int(work_order_id)})
+    log_activity(
+        tenant_id,
+        "facility.work_orders.delete",
+        "facility_delete_work_order",
+        _actor_label(user),
+        {"work_order_id": int(work_order_id)},
+    )
     return {"ok": True, "item": item}
 
 
@@ -749,9 +801,9 @@ def facility_work_orders_create_complaint(request: Request, work_order_id: int,
         tenant_id=tenant_id,
         complaint_id=int(complaint["id"]),
     )
-    log_usage(tenant_id, "facility.work_orders.create_complaint")
-    append_audit_log(
+    log_activity(
         tenant_id,
+        "facility.work_orders.create_complaint",
         "facility_create_complaint_from_work_order",
         actor,
         {"work_order_id": int(work_order_id), "complaint_id": int(complaint["id"])},
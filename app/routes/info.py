@@ -4,7 +4,7 @@ from typing import Any, Dict, Optional, Tuple
 
 from fastapi import APIRouter, Body, HTTPException, Query, Request
 
-from ..db import append_audit_log, get_tenant, log_usage
+from ..db import log_activity
 from ..info_db import (
     create_building,
     create_registration,
@@ -16,7 +16,7 @@ from ..info_db import (
     update_building,
     update_registration,
 )
-from .core import _require_auth
+from .core import _request_tenant, _require_auth
 
 router = APIRouter()
 
@@ -28,7 +28,7 @@ def _resolve_info_context(request: Request, payload: Optional[Dict[str, Any]] =
         tenant_id = requested or str(user.get("tenant_id") or "").strip().lower()
         if not tenant_id:
             raise HTTPException(status_code=400, detail="tenant_id가 필요합니다.")
-        tenant = get_tenant(tenant_id)
+        tenant = _request_tenant(request, tenant_id)
         if not tenant:
             raise HTTPException(status_code=404, detail="tenant not found")
         return user, tenant_id
@@ -59,8 +59,7 @@ def _require_info_editor(request: Request, payload: Optional[Dict[str, Any]] = N
 def info_dashboard(request: Request, tenant_id: str = Query(default="")) -> Dict[str, Any]:
     user, resolved_tenant_id = _resolve_info_context(request, {"tenant_id": tenant_id})
     item = info_dashboard_summary(tenant_id=resolved_tenant_id)
-    log_usage(resolved_tenant_id, "info.dashboard")
-    append_audit_log(resolved_tenant_id, "info_dashboard", _actor_label(user), {})
+    log_activity(resolved_tenant_id, "info.dashboard", "info_dashboard", _actor_label(user), {})
     return {"ok": True, "item": item}
 
 
@@ -90,8 +89,13 @@ def info_buildings_create(request: Request, payload: Dict[str, Any] = Body(...))
         note=str(payload.get("note") or "").strip(),
         created_by_label=_actor_label(user),
     )
-    log_usage(tenant_id, "info.buildings.create")
-    append_audit_log(tenant_id, "create_info_building", _actor_label(user), {"building_id": int(item["id"])})
+    log_activity(
+        tenant_id,
+        "info.buildings.create",
+        "create_info_building",
+        _actor_label(user),
+        {"building_id": int(item["id"])},
+    )
     return {"ok": True, "item": item}
 
 
@@ -110,8 +114,13 @@ def info_buildings_update(request: Request, building_id: int, payload: Dict[str,
         household_count=payload.get("household_count"),
         note=payload.get("note"),
     )
-    log_usage(tenant_id, "info.buildings.update")
-    append_audit_log(tenant_id, "update_info_building", _actor_label(user), {"building_id": int(building_id)})
+    log_activity(
+        tenant_id,
+        "info.buildings.update",
+        "update_info_building",
+        _actor_label(user),
+        {"building_id": int(building_id)},
+    )
     return {"ok": True, "item": item}
 
 
@@ -119,8 +128,13 @@ def info_buildings_update(request: Request, building_id: int, payload: Dict[str,
 def info_buildings_delete(request: Request, building_id: int, payload: Dict[str, Any] | None = Body(default=None)) -> Dict[str, Any]:
     user, tenant_id = _require_info_editor(request, payload or {})
     item = delete_building(tenant_id=tenant_id, building_id=int(building_id))
-    log_usage(tenant_id, "info.buildings.delete")
-    append_audit_log(tenant_id, "delete_info_building", _actor_label(user), {"building_id": int(building_id)})
+    log_activity(
+        tenant_id,
+        "info.buildings.delete",
+        "delete_info_building",
+        _actor_label(user),
+        {"building_id": int(building_id)},
+    )
     return {"ok": True, "item": item}
 
 
@@ -150,8 +164,13 @@ def info_registrations_create(request: Request, payload: Dict[str, Any] = Body(.
         note=str(payload.get("note") or "").strip(),
         created_by_label=_actor_label(user),
     )
-    log_usage(tenant_id, "info.registrations.create")
-    append_audit_log(tenant_id, "create_info_registration", _actor_label(user), {"registration_id": int(item["id"])})
+    log_activity(
+        tenant_id,
+        "info.registrations.create",
+        "create_info_registration",
+        _actor_label(user),
+        {"registration_id": int(item["id"])},
+    )
     return {"ok": True, "item": item}
 
 
@@ -170,8 +189,13 @@ def info_registrations_update(request: Request, registration_id: int, payload: D
         expires_on=payload.get("expires_on"),
         note=payload.get("note"),
     )
-    log_usage(tenant_id, "info.registrations.update")
-    append_audit_log(tenant_id, "update_info_registration", _actor_label(user), {"registration_id": int(registration_id)})
+    log_activity(
+        tenant_id,
+        "info.registrations.update",
+        "update_info_registration",
+        _actor_label(user),
+        {"registration_id": int(registration_id)},
+    )
     return {"ok": True, "item": item}
 
 
@@ -179,7 +203,12 @@ def info_registrations_update(request: Request, registration_id: int, payload: D
 def info_registrations_delete(request: Request, registration_id: int, payload: Dict[str, Any] | None = Body(default=None)) -> Dict[str, Any]:
     user, tenant_id = _require_info_editor(request, payload or {})
     item = delete_registration(tenant_id=tenant_id, registration_id=int(registration_id))
-    log_usage(tenant_id, "info.registrations.delete")
-    append_audit_log(tenant_id, "delete_info_registration", _actor_label(user), {"registration_id": int(registration_id)})
+    log_activity(
+        tenant_id,
+        "info.registrations.delete",
+        "delete_info_registration",
+        _actor_label(user),
+        {"registration_id": int(registration_id)},
+    )
     return {"ok": True, "item": item}
 
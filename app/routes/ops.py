@@ -1,17 +1,16 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 from fastapi import APIRouter, Body, File, Form, HTTPException, Query, Request, UploadFile
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
 
 from ..db import (
-    append_audit_log,
     default_document_numbering_config,
-    get_tenant,
     get_tenant_document_numbering_config,
-    log_usage,
+    log_activity,
     normalize_document_numbering_config,
     update_tenant_document_numbering_config,
 )
@@ -25,11 +24,13 @@ from ..ops_db import (
     delete_notice,
     delete_schedule,
     delete_vendor,
+    iter_documents,
     list_documents,
     list_notices,
     list_schedules,
     list_vendors,
     next_document_reference_no,
+    next_document_reference_nos,
     ops_dashboard_summary,
     summarize_document_categories,
     update_document,
@@ -42,11 +43,16 @@ from ..ops_document_catalog import (
     document_common_field_definitions,
     get_document_category_profile,
 )
-from ..report_excel import build_ops_document_ledger_xlsx
-from ..report_pdf import build_ops_draft_pdf, build_reference_document_pdf
-from .core import _require_auth
+from .core import _request_tenant, _require_auth
 
 router = APIRouter()
+NOTICE_UPDATE_FIELDS = ("title", "body", "category", "status", "pinned")
+DOCUMENT_UPDATE_FIELDS = (
+    "title", "summary", "category", "status", "owner", "due_date", "reference_no", "amount_total", "vendor_name",
+    "target_label", "basis_date", "period_start", "period_end",
+)
+VENDOR_UPDATE_FIELDS = ("company_name", "service_type", "contact_name", "phone", "email", "status", "note")
+SCHEDULE_UPDATE_FIELDS = ("title", "schedule_type", "status", "due_date", "owner", "note")
 
 
 def _resolve_ops_context(request: Request, payload: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], str]:
@@ -56,7 +62,7 @@ def _resolve_ops_context(request: Request, payload: Optional[Dict[str, Any]] = N
         tenant_id = requested or str(user.get("tenant_id") or "").strip().lower()
         if not tenant_id:
             raise HTTPException(status_code=400, detail="tenant_id가 필요합니다.")
-        tenant = get_tenant(tenant_id)
+        tenant = _request_tenant(request, tenant_id)
         if not tenant:
             raise HTTPException(status_code=404, detail="tenant not found")
         return user, tenant_id
@@ -70,8 +76,8 @@ def _actor_label(user: Dict[str, Any]) -> str:
     return str(user.get("name") or user.get("login_id") or "operator")
 
 
-def _tenant_label(tenant_id: str) -> str:
-    tenant = get_tenant(tenant_id) or {}
+def _tenant_label(request: Request, tenant_id: str) -> str:
+    tenant = _request_tenant(request, tenant_id) or {}
     tenant_name = str(tenant.get("name") or "").strip()
     if tenant_name and tenant_id:
         return f"{tenant_name} 관리사무소"
@@ -83,6 +89,10 @@ def _ascii_download_name(value: str, default: str) -> str:
     return (cleaned or default)[:80]
 
 
+def _payload_fields(payload: Dict[str, Any], fields: Tuple[str, ...]) -> Dict[str, Any]:
+    return {field: payload.get(field) for field in fields}
+
+
 def _can_edit_ops(user: Dict[str, Any]) -> bool:
     if int(user.get("is_admin") or 0) == 1 or int(user.get("is_site_admin") or 0) == 1:
         return True
@@ -104,10 +114,10 @@ def _require_ops_manager(request: Request, payload: Optional[Dict[str, Any]] = N
 
 
 def _numbering_preview_map(*, tenant_id: str) -> Dict[str, str]:
-    return {
-        category: next_document_reference_no(tenant_id=tenant_id, category=category)
-        for category in [item["category"] for item in document_category_profiles()]
-    }
+    return next_document_reference_nos(
+        tenant_id=tenant_id,
+        categories=[item["category"] for item in document_category_profiles()],
+    )
 
 
 @router.get("/ops/documents/catalog")
@@ -129,8 +139,7 @@ def ops_documents_catalog(request: Request, tenant_id: str = Query(default=""))
 def ops_dashboard(request: Request, tenant_id: str = Query(default="")) -> Dict[str, Any]:
     user, resolved_tenant_id = _resolve_ops_context(request, {"tenant_id": tenant_id})
     item = ops_dashboard_summary(tenant_id=resolved_tenant_id)
-    log_usage(resolved_tenant_id, "ops.dashboard")
-    append_audit_log(resolved_tenant_id, "ops_dashboard", _actor_label(user), {})
+    log_activity(resolved_tenant_id, "ops.dashboard", "ops_dashboard", _actor_label(user), {})
     return {"ok": True, "item": item}
 
 
@@ -152,8 +161,7 @@ def ops_notices_create(request: Request, payload: Dict[str, Any] = Body(...)) ->
         pinned=bool(payload.get("pinned")),
         created_by_label=_actor_label(user),
     )
-    log_usage(tenant_id, "ops.notices.create")
-    append_audit_log(tenant_id, "create_notice", _actor_label(user), {"notice_id": int(item["id"])})
+    log_activity(tenant_id, "ops.notices.create", "create_notice", _actor_label(user), {"notice_id": int(item["id"])})
     return {"ok": True, "item": item}
 
 
@@ -163,14 +171,9 @@ def ops_notices_update(request: Request, notice_id: int, payload: Dict[str, Any]
     item = update_notice(
         int(notice_id),
         tenant_id=tenant_id,
-        title=payload.get("title"),
-        body=payload.get("body"),
-        category=payload.get("category"),
-        status=payload.get("status"),
-        pinned=payload.get("pinned"),
+        **_payload_fields(payload, NOTICE_UPDATE_FIELDS),
     )
-    log_usage(tenant_id, "ops.notices.update")
-    append_audit_log(tenant_id, "update_notice", _actor_label(user), {"notice_id": int(notice_id)})
+    log_activity(tenant_id, "ops.notices.update", "update_notice", _actor_label(user), {"notice_id": int(notice_id)})
     return {"ok": True, "item": item}
 
 
@@ -178,8 +181,7 @@ def ops_notices_update(request: Request, notice_id: int, payload: Dict[str, Any]
 def ops_notices_delete(request: Request, notice_id: int, payload: Dict[str, Any] | None = Body(default=None)) -> Dict[str, Any]:
     user, tenant_id = _require_ops_editor(request, payload or {})
     item = delete_notice(tenant_id=tenant_id, notice_id=int(notice_id))
-    log_usage(tenant_id, "ops.notices.delete")
-    append_audit_log(tenant_id, "delete_notice", _actor_label(user), {"notice_id": int(notice_id)})
+    log_activity(tenant_id, "ops.notices.delete", "delete_notice", _actor_label(user), {"notice_id": int(notice_id)})
     return {"ok": True, "item": item}
 
 
@@ -228,8 +230,13 @@ def ops_documents_numbering_config_update(request: Request, payload: Dict[str, A
                 "category_codes": payload.get("category_codes"),
             }
         config = update_tenant_document_numbering_config(tenant_id, normalize_document_numbering_config(raw_config))
-    log_usage(tenant_id, "ops.documents.numbering_config.update")
-    append_audit_log(tenant_id, "update_document_numbering_config", _actor_label(user), {"config": config})
+    log_activity(
+        tenant_id,
+        "ops.documents.numbering_config.update",
+        "update_document_numbering_config",
+        _actor_label(user),
+        {"config": config},
+    )
     return {
         "ok": True,
         "item": {
@@ -261,8 +268,7 @@ def ops_documents_create(request: Request, payload: Dict[str, Any] = Body(...))
         document_meta=payload.get("document_meta") if isinstance(payload.get("document_meta"), dict) else {},
         created_by_label=_actor_label(user),
     )
-    log_usage(tenant_id, "ops.documents.create")
-    append_audit_log(tenant_id, "create_document", _actor_label(user), {"document_id": int(item["id"])})
+    log_activity(tenant_id, "ops.documents.create", "create_document", _actor_label(user), {"document_id": int(item["id"])})
     return {"ok": True, "item": item}
 
 
@@ -275,9 +281,9 @@ def ops_documents_next_reference(
     user, resolved_tenant_id = _require_ops_editor(request, {"tenant_id": tenant_id})
     resolved_category = str(category or "").strip() or "기타"
     reference_no = next_document_reference_no(tenant_id=resolved_tenant_id, category=resolved_category)
-    log_usage(resolved_tenant_id, "ops.documents.next_reference")
-    append_audit_log(
+    log_activity(
         resolved_tenant_id,
+        "ops.documents.next_reference",
         "next_document_reference",
         _actor_label(user),
         {"category": resolved_category, "reference_no": reference_no},
@@ -291,23 +297,10 @@ def ops_documents_update(request: Request, document_id: int, payload: Dict[str,
     item = update_document(
         int(document_id),
         tenant_id=tenant_id,
-        title=payload.get("title"),
-        summary=payload.get("summary"),
-        category=payload.get("category"),
-        status=payload.get("status"),
-        owner=payload.get("owner"),
-        due_date=payload.get("due_date"),
-        reference_no=payload.get("reference_no"),
-        amount_total=payload.get("amount_total"),
-        vendor_name=payload.get("vendor_name"),
-        target_label=payload.get("target_label"),
-        basis_date=payload.get("basis_date"),
-        period_start=payload.get("period_start"),
-        period_end=payload.get("period_end"),
+        **_payload_fields(payload, DOCUMENT_UPDATE_FIELDS),
         document_meta=payload.get("document_meta") if isinstance(payload.get("document_meta"), dict) else None,
     )
-    log_usage(tenant_id, "ops.documents.update")
-    append_audit_log(tenant_id, "update_document", _actor_label(user), {"document_id": int(document_id)})
+    log_activity(tenant_id, "ops.documents.update", "update_document", _actor_label(user), {"document_id": int(document_id)})
     return {"ok": True, "item": item}
 
 
@@ -315,8 +308,7 @@ def ops_documents_update(request: Request, document_id: int, payload: Dict[str,
 def ops_documents_delete(request: Request, document_id: int, payload: Dict[str, Any] | None = Body(default=None)) -> Dict[str, Any]:
     user, tenant_id = _require_ops_editor(request, payload or {})
     item = delete_document(tenant_id=tenant_id, document_id=int(document_id))
-    log_usage(tenant_id, "ops.documents.delete")
-    append_audit_log(tenant_id, "delete_document", _actor_label(user), {"document_id": int(document_id)})
+    log_activity(tenant_id, "ops.documents.delete", "delete_document", _actor_label(user), {"document_id": int(document_id)})
     return {"ok": True, "item": item}
 
 
@@ -326,32 +318,45 @@ def ops_documents_export_xlsx(
     tenant_id: str = Query(default=""),
     status: str = Query(default=""),
     category: str = Query(default=""),
-) -> StreamingResponse:
+) -> Response:
     user, resolved_tenant_id = _resolve_ops_context(request, {"tenant_id": tenant_id})
-    items = list_documents(tenant_id=resolved_tenant_id, status=status, category=category, limit=2000)
+    try:
+        items = iter_documents(tenant_id=resolved_tenant_id, status=status, category=category, limit=2000)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    exported = 0
+
+    def _counted_documents() -> Iterator[Dict[str, Any]]:
+        nonlocal exported
+        for item in items:
+            exported += 1
+            yield item
+
+    from ..report_excel import build_ops_document_ledger_xlsx
+
     xlsx_bytes = build_ops_document_ledger_xlsx(
-        tenant_label=_tenant_label(resolved_tenant_id),
+        tenant_label=_tenant_label(request, resolved_tenant_id),
         selected_category=str(category or "").strip(),
-        documents=items,
+        documents=_counted_documents(),
     )
-    log_usage(resolved_tenant_id, "ops.documents.export_xlsx")
-    append_audit_log(
+    log_activity(
         resolved_tenant_id,
+        "ops.documents.export_xlsx",
         "export_document_ledger_xlsx",
         _actor_label(user),
-        {"category": str(category or "").strip() or "전체", "count": len(items)},
+        {"category": str(category or "").strip() or "전체", "count": exported},
     )
     safe_name = _ascii_download_name(f"document-ledger-{str(category or '').strip() or 'all'}", "document-ledger")
     headers = {"Content-Disposition": f'attachment; filename="{safe_name[:80]}.xlsx"'}
-    return StreamingResponse(
-        iter([xlsx_bytes]),
+    return Response(
+        content=xlsx_bytes,
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers=headers,
     )
 
 
 @router.post("/ops/documents/render_pdf")
-def ops_documents_render_pdf(request: Request, payload: Dict[str, Any] = Body(...)) -> StreamingResponse:
+def ops_documents_render_pdf(request: Request, payload: Dict[str, Any] = Body(...)) -> Response:
     user, tenant_id = _require_ops_editor(request, payload)
     title = str(payload.get("title") or "").strip()
     summary = str(payload.get("summary") or "").strip()
@@ -363,8 +368,10 @@ def ops_documents_render_pdf(request: Request, payload: Dict[str, Any] = Body(..
     profile = get_document_category_profile(requested_category)
     category = str(profile.get("category") or requested_category or "기타").strip()
     reference_no = str(payload.get("reference_no") or "").strip() or next_document_reference_no(tenant_id=tenant_id, category=category)
+    from ..report_pdf import build_ops_draft_pdf
+
     pdf_bytes = build_ops_draft_pdf(
-        tenant_label=_tenant_label(tenant_id),
+        tenant_label=_tenant_label(request, tenant_id),
         title=title,
         summary=summary,
         drafter_label=_actor_label(user),
@@ -382,11 +389,10 @@ def ops_documents_render_pdf(request: Request, payload: Dict[str, Any] = Body(..
         request_text=str(profile.get("request_text") or "").strip(),
         amount_policy=str(profile.get("amount_policy") or "").strip(),
     )
-    log_usage(tenant_id, "ops.documents.render_pdf")
-    append_audit_log(tenant_id, "render_document_pdf", _actor_label(user), {"title": title})
+    log_activity(tenant_id, "ops.documents.render_pdf", "render_document_pdf", _actor_label(user), {"title": title})
     safe_name = _ascii_download_name(title, "document")
     headers = {"Content-Disposition": f'attachment; filename="{safe_name[:80]}.pdf"'}
-    return StreamingResponse(iter([pdf_bytes]), media_type="application/pdf", headers=headers)
+    return Response(content=pdf_bytes, media_type="application/pdf", headers=headers)
 
 
 @router.post("/ops/documents/sample_pdf")
@@ -395,12 +401,12 @@ async def ops_documents_sample_pdf(
     tenant_id: str = Form(default=""),
     title: str = Form(default=""),
     source_file: UploadFile = File(...),
-) -> StreamingResponse:
+) -> Response:
     user, resolved_tenant_id = _require_ops_editor(request, {"tenant_id": tenant_id})
     raw_name = str(source_file.filename or "").strip() or "sample"
     file_bytes = await source_file.read()
     try:
-        extracted = extract_document_sample(raw_name, file_bytes)
+        extracted = await run_in_threadpool(extract_document_sample, raw_name, file_bytes)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     finally:
@@ -411,22 +417,25 @@ async def ops_documents_sample_pdf(
 
     final_title = str(title or "").strip() or str(extracted.get("title") or "").strip() or "기안서 샘플 PDF"
     body_lines = [str(line or "").rstrip() for line in extracted.get("lines") or [] if str(line or "").strip()]
-    pdf_bytes = build_reference_document_pdf(
+    from ..report_pdf import build_reference_document_pdf
+
+    pdf_bytes = await run_in_threadpool(
+        build_reference_document_pdf,
         title=final_title,
         source_name=str(extracted.get("source_name") or raw_name),
         body_lines=body_lines,
         preview_image_bytes=bytes(extracted.get("preview_image_bytes") or b""),
     )
-    log_usage(resolved_tenant_id, "ops.documents.sample_pdf")
-    append_audit_log(
+    log_activity(
         resolved_tenant_id,
+        "ops.documents.sample_pdf",
         "ops_document_sample_pdf",
         _actor_label(user),
         {"source_name": raw_name, "title": final_title},
     )
     safe_name = _ascii_download_name(final_title, "document-sample")
     headers = {"Content-Disposition": f'attachment; filename="{safe_name[:80]}.pdf"'}
-    return StreamingResponse(iter([pdf_bytes]), media_type="application/pdf", headers=headers)
+    return Response(content=pdf_bytes, media_type="application/pdf", headers=headers)
 
 
 @router.get("/ops/vendors")
@@ -449,8 +458,7 @@ def ops_vendors_create(request: Request, payload: Dict[str, Any] = Body(...)) ->
         note=str(payload.get("note") or "").strip(),
         created_by_label=_actor_label(user),
     )
-    log_usage(tenant_id, "ops.vendors.create")
-    append_audit_log(tenant_id, "create_vendor", _actor_label(user), {"vendor_id": int(item["id"])})
+    log_activity(tenant_id, "ops.vendors.create", "create_vendor", _actor_label(user), {"vendor_id": int(item["id"])})
     return {"ok": True, "item": item}
 
 
@@ -460,16 +468,9 @@ def ops_vendors_update(request: Request, vendor_id: int, payload: Dict[str, Any]
     item = update_vendor(
         int(vendor_id),
         tenant_id=tenant_id,
-        company_name=payload.get("company_name"),
-        service_type=payload.get("service_type"),
-        contact_name=payload.get("contact_name"),
-        phone=payload.get("phone"),
-        email=payload.get("email"),
-        status=payload.get("status"),
-        note=payload.get("note"),
+        **_payload_fields(payload, VENDOR_UPDATE_FIELDS),
     )
-    log_usage(tenant_id, "ops.vendors.update")
-    append_audit_log(tenant_id, "update_vendor", _actor_label(user), {"vendor_id": int(vendor_id)})
+    log_activity(tenant_id, "ops.vendors.update", "update_vendor", _actor_label(user), {"vendor_id": int(vendor_id)})
     return {"ok": True, "item": item}
 
 
@@ -477,8 +478,7 @@ def ops_vendors_update(request: Request, vendor_id: int, payload: Dict[str, Any]
 def ops_vendors_delete(request: Request, vendor_id: int, payload: Dict[str, Any] | None = Body(default=None)) -> Dict[str, Any]:
     user, tenant_id = _require_ops_editor(request, payload or {})
     item = delete_vendor(tenant_id=tenant_id, vendor_id=int(vendor_id))
-    log_usage(tenant_id, "ops.vendors.delete")
-    append_audit_log(tenant_id, "delete_vendor", _actor_label(user), {"vendor_id": int(vendor_id)})
+    log_activity(tenant_id, "ops.vendors.delete", "delete_vendor", _actor_label(user), {"vendor_id": int(vendor_id)})
     return {"ok": True, "item": item}
 
 
@@ -504,8 +504,7 @@ def ops_schedules_create(request: Request, payload: Dict[str, Any] = Body(...))
         vendor_id=vendor_id,
         created_by_label=_actor_label(user),
     )
-    log_usage(tenant_id, "ops.schedules.create")
-    append_audit_log(tenant_id, "create_schedule", _actor_label(user), {"schedule_id": int(item["id"])})
+    log_activity(tenant_id, "ops.schedules.create", "create_schedule", _actor_label(user), {"schedule_id": int(item["id"])})
     return {"ok": True, "item": item}
 
 
@@ -519,16 +518,10 @@ def ops_schedules_update(request: Request, schedule_id: int, payload: Dict[str,
     item = update_schedule(
         int(schedule_id),
         tenant_id=tenant_id,
-        title=payload.get("title"),
-        schedule_type=payload.get("schedule_type"),
-        status=payload.get("status"),
-        due_date=payload.get("due_date"),
-        owner=payload.get("owner"),
-        note=payload.get("note"),
+        **_payload_fields(payload, SCHEDULE_UPDATE_FIELDS),
         vendor_id=vendor_id,
     )
-    log_usage(tenant_id, "ops.schedules.update")
-    append_audit_log(tenant_id, "update_schedule", _actor_label(user), {"schedule_id": int(schedule_id)})
+    log_activity(tenant_id, "ops.schedules.update", "update_schedule", _actor_label(user), {"schedule_id": int(schedule_id)})
     return {"ok": True, "item": item}
 
 
@@ -536,6 +529,5 @@ def ops_schedules_update(request: Request, schedule_id: int, payload: Dict[str,
 def ops_schedules_delete(request: Request, schedule_id: int, payload: Dict[str, Any] | None = Body(default=None)) -> Dict[str, Any]:
     user, tenant_id = _require_ops_editor(request, payload or {})
     item = delete_schedule(tenant_id=tenant_id, schedule_id=int(schedule_id))
-    log_usage(tenant_id, "ops.schedules.delete")
-    append_audit_log(tenant_id, "delete_schedule", _actor_label(user), {"schedule_id": int(schedule_id)})
+    log_activity(tenant_id, "ops.schedules.delete", "delete_schedule", _actor_label(user), {"schedule_id": int(schedule_id)})
     return {"ok": True, "item": item}
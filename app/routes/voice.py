@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import os
-import xml.etree.ElementTree as ET
 from typing import Any, Dict, Optional
 from urllib.parse import urlencode
+from xml.sax.saxutils import escape
 
 from fastapi import APIRouter, Form, HTTPException, Query, Request
 from fastapi.responses import Response
 
-from ..db import append_audit_log, ensure_service_user, get_tenant, log_usage
+from ..db import ensure_service_user, get_tenant, log_activity, log_usage
 from ..engine_db import create_complaint
 from ..voice_db import (
     append_voice_turn,
@@ -28,11 +28,17 @@ PUBLIC_BASE_URL = (
 VOICE_SAY_LANGUAGE = str(os.getenv("KA_VOICE_SAY_LANGUAGE") or "ko-KR").strip() or "ko-KR"
 VOICE_GATHER_LANGUAGE = str(os.getenv("KA_VOICE_GATHER_LANGUAGE") or VOICE_SAY_LANGUAGE).strip() or VOICE_SAY_LANGUAGE
 VOICE_DEFAULT_TENANT_ID = str(os.getenv("KA_VOICE_DEFAULT_TENANT_ID") or "").strip().lower()
+XML_ATTR_ENTITIES = {'"': "&quot;", "\r": "&#13;", "\n": "&#10;", "\t": "&#09;"}
+TWIML_PREFIX = "<?xml version='1.0' encoding='utf-8'?>\n<Response>"
+TWIML_SAY_OPEN = f'<Say language="{escape(VOICE_SAY_LANGUAGE, XML_ATTR_ENTITIES)}">'
+TWIML_GATHER_ATTRS = (
+    f'method="POST" language="{escape(VOICE_GATHER_LANGUAGE, XML_ATTR_ENTITIES)}" '
+    'speechTimeout="auto" timeout="4" numDigits="1"'
+)
 
 
-def _xml_response(root: ET.Element) -> Response:
-    xml = ET.tostring(root, encoding="utf-8", xml_declaration=True)
-    return Response(content=xml, media_type="application/xml")
+def _xml_response(body: str) -> Response:
+    return Response(content=f"{TWIML_PREFIX}{body}</Response>".encode("utf-8"), media_type="application/xml")
 
 
 def _public_url(request: Request, path: str, *, query: Optional[Dict[str, Any]] = None) -> str:
@@ -45,40 +51,21 @@ def _public_url(request: Request, path: str, *, query: Optional[Dict[str, Any]]
 
 
 def _twiml_gather(message: str, action_url: str) -> Response:
-    root = ET.Element("Response")
-    gather = ET.SubElement(
-        root,
-        "Gather",
-        {
-            "input": "speech dtmf",
-            "action": action_url,
-            "method": "POST",
-            "language": VOICE_GATHER_LANGUAGE,
-            "speechTimeout": "auto",
-            "timeout": "4",
-            "numDigits": "1",
-        },
+    return _xml_response(
+        f'<Gather input="speech dtmf" action="{escape(action_url, XML_ATTR_ENTITIES)}" {TWIML_GATHER_ATTRS}>'
+        f"{TWIML_SAY_OPEN}{escape(message)}</Say></Gather>"
+        f'<Redirect method="POST">{escape(action_url)}</Redirect>'
     )
-    ET.SubElement(gather, "Say", {"language": VOICE_SAY_LANGUAGE}).text = message
-    ET.SubElement(root, "Redirect", {"method": "POST"}).text = action_url
-    return _xml_response(root)
 
 
 def _twiml_say_hangup(message: str) -> Response:
-    root = ET.Element("Response")
-    ET.SubElement(root, "Say", {"language": VOICE_SAY_LANGUAGE}).text = message
-    ET.SubElement(root, "Hangup")
-    return _xml_response(root)
+    return _xml_response(f"{TWIML_SAY_OPEN}{escape(message)}</Say><Hangup />")
 
 
 def _twiml_handoff(message: str, target_number: str) -> Response:
-    root = ET.Element("Response")
-    ET.SubElement(root, "Say", {"language": VOICE_SAY_LANGUAGE}).text = message
-    if str(target_number or "").strip():
-        ET.SubElement(root, "Dial").text = str(target_number or "").strip()
-    else:
-        ET.SubElement(root, "Hangup")
-    return _xml_response(root)
+    clean_number = str(target_number or "").strip()
+    tail = f"<Dial>{escape(clean_number)}</Dial>" if clean_number else "<Hangup />"
+    return _xml_response(f"{TWIML_SAY_OPEN}{escape(message)}</Say>{tail}")
 
 
 def _resolve_tenant_id(request: Request, tenant_id: str = "") -> str:
@@ -205,9 +192,9 @@ def voice_twilio_gather(
         complaint_item = _persist_created_complaint(tenant_id=resolved_tenant_id, session=session)
         session = get_voice_session(int(session["id"])) or session
         if complaint_item:
-            log_usage(resolved_tenant_id, "voice.complaints.create")
-            append_audit_log(
+            log_activity(
                 resolved_tenant_id,
+                "voice.complaints.create",
                 "voice_ai_create_complaint",
                 "전화 AI",
                 {"call_sid": sid, "complaint_id": int(complaint_item["id"])},
@@ -4,21 +4,15 @@ import json
 import sqlite3
 from typing import Any, Dict, List, Optional
 
-from .db import DB_PATH, now_iso
+from .db import DB_PATH, _open_connection, now_iso
 
 VOICE_SESSION_STATUS_VALUES = ("ringing", "in_progress", "completed", "handoff", "failed", "no_input")
 VOICE_TURN_ROLE_VALUES = ("caller", "assistant", "system", "tool", "event")
+_SCHEMA_READY: set[str] = set()
 
 
 def _connect() -> sqlite3.Connection:
-    con = sqlite3.connect(str(DB_PATH), timeout=30.0)
-    con.row_factory = sqlite3.Row
-    con.execute("PRAGMA foreign_keys=ON;")
-    try:
-        con.execute("PRAGMA busy_timeout=30000;")
-    except Exception:
-        pass
-    return con
+    return _open_connection(DB_PATH)
 
 
 def _clean_text(value: Any, *, field: str, required: bool = False, max_len: int = 4000) -> str:
@@ -54,6 +48,9 @@ def _json_load(value: Any, default: Any) -> Any:
 
 
 def _ensure_schema(con: sqlite3.Connection) -> None:
+    schema_key = str(DB_PATH)
+    if schema_key in _SCHEMA_READY:
+        return
     con.executescript(
         """
         CREATE TABLE IF NOT EXISTS voice_sessions (
@@ -97,6 +94,7 @@ def _ensure_schema(con: sqlite3.Connection) -> None:
           ON voice_turns(voice_session_id, id ASC);
         """
     )
+    _SCHEMA_READY.add(schema_key)
 
 
 def init_voice_db() -> None:
@@ -375,9 +373,8 @@ def list_voice_sessions(*, tenant_id: str = "", limit: int = 100) -> List[Dict[s
             params.append(clean_tenant_id)
         sql += " ORDER BY updated_at DESC, id DESC LIMIT ?"
         params.append(max(1, min(500, int(limit))))
-        rows = con.execute(sql, tuple(params)).fetchall()
         items = []
-        for row in rows:
+        for row in con.execute(sql, tuple(params)):
             item = dict(row)
             item["state"] = _json_load(item.pop("state_json", None), {})
             items.append(item)
@@ -23,6 +23,10 @@ VOICE_EMERGENCY_KEYWORDS = (
 VOICE_HANDOFF_KEYWORDS = ("상담원", "직원", "관리실", "사람", "연결", "긴급")
 VOICE_CONFIRM_YES = ("예", "네", "맞", "맞아요", "맞습니다", "그렇습니다", "1")
 VOICE_CONFIRM_NO = ("아니", "아니요", "틀렸", "다시", "수정", "2")
+VOICE_EMERGENCY_KEYWORD_RE = re.compile("|".join(map(re.escape, VOICE_EMERGENCY_KEYWORDS)))
+VOICE_HANDOFF_KEYWORD_RE = re.compile("|".join(map(re.escape, VOICE_HANDOFF_KEYWORDS)))
+VOICE_CONFIRM_YES_RE = re.compile("|".join(map(re.escape, VOICE_CONFIRM_YES)))
+VOICE_CONFIRM_NO_RE = re.compile("|".join(map(re.escape, VOICE_CONFIRM_NO)))
 VOICE_MAX_RETRIES = max(1, min(3, int(os.getenv("KA_VOICE_MAX_RETRIES") or "2")))
 
 
@@ -88,21 +92,21 @@ def is_yes(text: str, digits: str = "") -> bool:
     normalized = collapse_space(text).lower()
     if digits == "1":
         return True
-    return any(token in normalized for token in VOICE_CONFIRM_YES)
+    return VOICE_CONFIRM_YES_RE.search(normalized) is not None
 
 
 def is_no(text: str, digits: str = "") -> bool:
     normalized = collapse_space(text).lower()
     if digits == "2":
         return True
-    return any(token in normalized for token in VOICE_CONFIRM_NO)
+    return VOICE_CONFIRM_NO_RE.search(normalized) is not None
 
 
 def detect_handoff_request(text: str) -> str:
     normalized = collapse_space(text)
-    if any(keyword in normalized for keyword in VOICE_EMERGENCY_KEYWORDS):
+    if VOICE_EMERGENCY_KEYWORD_RE.search(normalized):
         return "긴급 민원 감지"
-    if any(keyword in normalized for keyword in VOICE_HANDOFF_KEYWORDS):
+    if VOICE_HANDOFF_KEYWORD_RE.search(normalized):
         return "상담원 연결 요청"
     return ""
 
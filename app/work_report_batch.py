@@ -8,7 +8,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict
 
-from .db import DB_PATH, STORAGE_ROOT, now_iso
+from .db import DB_PATH, STORAGE_ROOT, _open_connection, now_iso
 
 WORK_REPORT_JOB_ROOT = (STORAGE_ROOT / "uploads" / "work_report_jobs").resolve()
 WORK_REPORT_JOB_TOTAL_STEPS = 5
@@ -16,21 +16,22 @@ WORK_REPORT_JOB_POLL_AFTER_MS = 2000
 WORK_REPORT_JOB_RETENTION_DAYS = 3
 WORK_REPORT_JOB_IMAGE_PREVIEW_DIR = "image_previews"
 _JOB_STATUS_VALUES = {"queued", "running", "completed", "failed"}
+_SCHEMA_READY: set[str] = set()
+_JOB_ROOT_READY: set[str] = set()
 
 
 def _connect() -> sqlite3.Connection:
-    WORK_REPORT_JOB_ROOT.mkdir(parents=True, exist_ok=True)
-    con = sqlite3.connect(str(DB_PATH), timeout=30.0)
-    con.row_factory = sqlite3.Row
-    con.execute("PRAGMA foreign_keys=ON;")
-    try:
-        con.execute("PRAGMA busy_timeout=30000;")
-    except Exception:
-        pass
-    return con
+    root_key = str(WORK_REPORT_JOB_ROOT)
+    if root_key not in _JOB_ROOT_READY:
+        WORK_REPORT_JOB_ROOT.mkdir(parents=True, exist_ok=True)
+        _JOB_ROOT_READY.add(root_key)
+    return _open_connection(DB_PATH)
 
 
 def _ensure_schema(con: sqlite3.Connection) -> None:
+    schema_key = str(DB_PATH)
+    if schema_key in _SCHEMA_READY:
+        return
     con.executescript(
         """
         CREATE TABLE IF NOT EXISTS work_report_jobs (
@@ -60,8 +61,11 @@ def _ensure_schema(con: sqlite3.Connection) -> None:
           ON work_report_jobs(tenant_id, created_at DESC);
         CREATE INDEX IF NOT EXISTS idx_work_report_jobs_tenant_status
           ON work_report_jobs(tenant_id, status, created_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_work_report_jobs_created
+          ON work_report_jobs(created_at);
         """
     )
+    _SCHEMA_READY.add(schema_key)
 
 
 def _parse_iso(value: Any) -> datetime | None:
@@ -76,7 +80,7 @@ def _parse_iso(value: Any) -> datetime | None:
 
 def _safe_job_dir(path: Path) -> Path:
     resolved = path.resolve()
-    if not str(resolved).startswith(str(WORK_REPORT_JOB_ROOT)):
+    if not resolved.is_relative_to(WORK_REPORT_JOB_ROOT):
         raise ValueError("invalid work report job path")
     return resolved
 
@@ -96,23 +100,25 @@ def _cleanup_old_jobs(con: sqlite3.Connection) -> None:
         """
         SELECT id, job_dir, created_at
         FROM work_report_jobs
+        WHERE created_at<?
         ORDER BY created_at ASC
-        """
-    ).fetchall()
-    delete_ids: list[str] = []
+        """,
+        (threshold.replace(microsecond=0).isoformat(sep=" "),),
+    )
+    delete_ids: list[tuple[str]] = []
     for row in rows:
         created_at = _parse_iso(row["created_at"])
         if not created_at or created_at >= threshold:
             continue
-        delete_ids.append(str(row["id"]))
+        delete_ids.append((str(row["id"]),))
         job_dir = str(row["job_dir"] or "").strip()
         if job_dir:
             try:
                 shutil.rmtree(_safe_job_dir(Path(job_dir)), ignore_errors=True)
             except Exception:
                 pass
-    for job_id in delete_ids:
-        con.execute("DELETE FROM work_report_jobs WHERE id=?", (job_id,))
+    if delete_ids:
+        con.executemany("DELETE FROM work_report_jobs WHERE id=?", delete_ids)
 
 
 def _cleanup_job_dir_contents(job_dir: Path, *, keep_paths: set[Path] | None = None) -> None:
@@ -170,7 +176,7 @@ def _cleanup_finished_job_artifacts(con: sqlite3.Connection) -> None:
         FROM work_report_jobs
         WHERE status IN ('completed', 'failed')
         """
-    ).fetchall()
+    )
     for row in rows:
         try:
             _cleanup_finished_job_artifacts_for_record(dict(row))
@@ -466,6 +472,10 @@ def get_work_report_job(job_id: str, *, include_result: bool = False) -> Dict[st
     record = get_work_report_job_record(job_id)
     if not record:
         return None
+    return work_report_job_payload(record, include_result=include_result)
+
+
+def work_report_job_payload(record: Dict[str, Any], *, include_result: bool = False) -> Dict[str, Any]:
     item = {
         "id": str(record.get("id") or ""),
         "tenant_id": str(record.get("tenant_id") or ""),
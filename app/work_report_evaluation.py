@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Sequence
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
 
 
 def _text(value: Any) -> str:
@@ -16,9 +16,7 @@ def _int(value: Any) -> int:
 
 
 def _safe_ratio(numerator: int, denominator: int) -> float:
-    if denominator <= 0:
-        return 0.0
-    return float(numerator) / float(denominator)
+    return numerator / denominator if denominator > 0 else 0.0
 
 
 def _candidate_items(row: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -28,21 +26,12 @@ def _candidate_items(row: Dict[str, Any]) -> List[Dict[str, Any]]:
     return []
 
 
-def _candidate_top1(row: Dict[str, Any]) -> int:
-    candidates = _candidate_items(row)
-    if not candidates:
-        return 0
-    return _int(candidates[0].get("item_index") or 0)
-
-
-def _candidate_contains_choice(row: Dict[str, Any], *, limit: int = 3) -> bool:
-    selected = _int(row.get("to_item_index") or 0)
-    if selected <= 0:
-        return False
-    for candidate in _candidate_items(row)[: max(1, int(limit or 1))]:
-        if _int(candidate.get("item_index") or 0) == selected:
-            return True
-    return False
+def _candidate_hits(row: Dict[str, Any], *, limit: int = 3) -> Tuple[bool, bool]:
+    selected = row["to_item_index"]
+    indexes = [_int(candidate.get("item_index")) for candidate in row["candidate_items"][:limit]]
+    if selected <= 0 or not indexes:
+        return False, False
+    return indexes[0] == selected, selected in indexes
 
 
 def _normalize_feedback_rows(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -72,8 +61,12 @@ def summarize_feedback_rows(rows: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
     choice_rows = [row for row in normalized if row["feedback_type"] in {"reassign_item", "confirm_current", "mark_unmatched"}]
     candidate_rows = [row for row in choice_rows if row["candidate_items"]]
     matched_candidate_rows = [row for row in candidate_rows if row["to_item_index"] > 0]
-    top1_hits = sum(1 for row in matched_candidate_rows if _candidate_top1(row) == row["to_item_index"])
-    top3_hits = sum(1 for row in matched_candidate_rows if _candidate_contains_choice(row, limit=3))
+    top1_hits = 0
+    top3_hits = 0
+    for row in matched_candidate_rows:
+        top1_hit, top3_hit = _candidate_hits(row, limit=3)
+        top1_hits += top1_hit
+        top3_hits += top3_hit
     intervention_rows = [row for row in choice_rows if row["feedback_type"] in {"reassign_item", "mark_unmatched"}]
     unmatched_false_positive_rows = [row for row in unmatched_rows if row["candidate_items"]]
 
@@ -5,8 +5,10 @@ import json
 import logging
 import os
 import re
-from contextvars import ContextVar
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
 from datetime import date, datetime
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
@@ -42,6 +44,10 @@ WORK_REPORT_ACTION_KEYWORDS = (
     "급수",
     "구입",
 )
+WORK_REPORT_ACTION_KEYWORD_RE = re.compile("|".join(map(re.escape, WORK_REPORT_ACTION_KEYWORDS)))
+WORK_REPORT_TITLE_STOP_TOKENS = frozenset(
+    (*WORK_REPORT_ACTION_KEYWORDS, "작업", "민원", "사항", "업체", "요청", "접수", "완료", "예정")
+)
 WORK_REPORT_VENDOR_HINTS = ("업체", "업 체", "시공사", "협력업체", "담당", "작업자")
 WORK_REPORT_FEEDBACK_STOP_TOKENS = {
     "관리실",
@@ -75,6 +81,7 @@ DEFAULT_WORK_REPORT_OPENAI_IMAGE_MATCH_TIMEOUT_SEC = 45.0
 WORK_REPORT_OPENAI_CHUNK_TRIGGER_IMAGES = 12
 WORK_REPORT_OPENAI_IMAGE_MATCH_MAX_CLUSTERS = 4
 WORK_REPORT_OPENAI_IMAGE_MATCH_SAMPLE_PER_CLUSTER = 3
+WORK_REPORT_OPENAI_IMAGE_MATCH_CONCURRENCY = 3
 MAX_WORK_REPORT_OPENAI_REFERENCE_IMAGES = 6
 WORK_REPORT_OPENAI_TEXT_MAX_CHARS = 14000
 WORK_REPORT_OPENAI_TEXT_MAX_EVENTS = 160
@@ -98,6 +105,7 @@ WORK_REPORT_FILE_EXTENSIONS = (
     ".png",
     ".zip",
 )
+WORK_REPORT_FILE_EXTENSION_RE = re.compile("|".join(map(re.escape, WORK_REPORT_FILE_EXTENSIONS)))
 KAKAO_DATE_HEADER_RE = re.compile(
     r"^(?:-+\s*)?(?P<y>\d{4})년\s*(?P<m>\d{1,2})월\s*(?P<d>\d{1,2})일(?:\s*[가-힣]+요일)?(?:\s*-+)?$"
 )
@@ -106,6 +114,18 @@ KAKAO_INLINE_MESSAGE_RE = re.compile(
 )
 KAKAO_BRACKET_MESSAGE_RE = re.compile(r"^\[(?P<sender>[^\]]+)\]\s*\[(?P<time>[^\]]+)\]\s*(?P<body>.+)$")
 KAKAO_SHORT_MESSAGE_RE = re.compile(r"^(?P<time>(?:오전|오후)\s*\d{1,2}:\d{2}),?\s*(?P<sender>[^:]{1,40})\s*:\s*(?P<body>.+)$")
+KOREAN_DATE_RE = re.compile(r"(?P<y>\d{4})\s*년\s*(?P<m>\d{1,2})\s*월\s*(?P<d>\d{1,2})\s*일")
+NUMERIC_DATE_RE = re.compile(r"(?P<y>\d{4})[./-]\s*(?P<m>\d{1,2})[./-]\s*(?P<d>\d{1,2})")
+MONTH_DAY_RE = re.compile(r"(?P<m>\d{1,2})\s*월\s*(?P<d>\d{1,2})\s*일")
+MERIDIEM_TIME_RE = re.compile(r"(오전|오후)\s*(\d{1,2}):(\d{2})")
+KOREAN_STAMP_PREFIX_RE = re.compile(r"^\d{4}년\s*\d{1,2}월\s*\d{1,2}일\s*(오전|오후)?\s*\d{1,2}:\d{2},?\s*")
+NUMERIC_STAMP_PREFIX_RE = re.compile(r"^\d{4}[./-]\d{1,2}[./-]\d{1,2}\s*(오전|오후)?\s*\d{1,2}:\d{2},?\s*")
+TITLE_TOKEN_RE = re.compile(r"\d+동|\d+호|[가-힣a-zA-Z]{2,}")
+TAGGED_TOKEN_RE = re.compile(r"<([^<>]*)>")
+TAGGED_KEY_STRIP_RE = re.compile(r"[\s:]+")
+ITEM_TITLE_PREFIX_RE = re.compile(r"^(작업내용|작업|내용)\s*[:：]?\s*")
+TITLE_KEY_STRIP_RE = re.compile(r"[^0-9a-z가-힣]+")
+IMAGE_FILENAME_STAMP_RE = re.compile(r"(?P<date>\d{8})_(?P<hour>\d{2})(?P<minute>\d{2})(?P<second>\d{2})")
 WorkReportProgressCallback = Callable[[Dict[str, Any]], None]
 
 
@@ -318,10 +338,8 @@ def _safe_date_value(year: int, month: int, day: int) -> str:
         return ""
 
 
-def _date_label(value: str) -> str:
-    raw = _collapse(value)
-    if not raw:
-        return ""
+@lru_cache(maxsize=512)
+def _iso_date_label(raw: str) -> str:
     try:
         parsed = date.fromisoformat(raw[:10])
     except Exception:
@@ -329,8 +347,15 @@ def _date_label(value: str) -> str:
     return f"{parsed.month}월 {parsed.day}일"
 
 
+def _date_label(value: str) -> str:
+    raw = _collapse(value)
+    if not raw:
+        return ""
+    return _iso_date_label(raw)
+
+
 def _time_minutes(text: str) -> int:
-    match = re.search(r"(오전|오후)\s*(\d{1,2}):(\d{2})", str(text or ""))
+    match = MERIDIEM_TIME_RE.search(str(text or ""))
     if not match:
         return -1
     hour = int(match.group(2)) % 12
@@ -349,9 +374,11 @@ def _openai_client(default_model: str = "gpt-5", env_name: str = "OPENAI_MODEL")
     except Exception as exc:
         _set_openai_error_state("missing_sdk", _analysis_reason_notice("missing_sdk"), details=str(exc))
         return None, ""
+    from .ai_service import _shared_openai_client
+
     model = str(os.getenv(env_name) or os.getenv("OPENAI_MODEL") or default_model).strip() or default_model
     _clear_openai_error_state()
-    return OpenAI(api_key=api_key), model
+    return _shared_openai_client(OpenAI, api_key), model
 
 
 def _openai_event_excerpt_line(event: Dict[str, Any]) -> str:
@@ -436,25 +463,17 @@ def _extract_date(text: str) -> Tuple[str, str]:
     raw = _collapse(text)
     if not raw:
         return "", ""
-    m = re.search(r"(?P<y>\d{4})\s*년\s*(?P<m>\d{1,2})\s*월\s*(?P<d>\d{1,2})\s*일", raw)
-    if m:
-        value = _safe_date_value(int(m.group("y")), int(m.group("m")), int(m.group("d")))
-        month = int(m.group("m"))
-        day = int(m.group("d"))
-        return value, f"{month}월 {day}일"
-    m = re.search(r"(?P<y>\d{4})[./-]\s*(?P<m>\d{1,2})[./-]\s*(?P<d>\d{1,2})", raw)
+    m = KOREAN_DATE_RE.search(raw) or NUMERIC_DATE_RE.search(raw)
     if m:
-        value = _safe_date_value(int(m.group("y")), int(m.group("m")), int(m.group("d")))
-        month = int(m.group("m"))
-        day = int(m.group("d"))
-        return value, f"{month}월 {day}일"
-    m = re.search(r"(?P<m>\d{1,2})\s*월\s*(?P<d>\d{1,2})\s*일", raw)
-    if m:
-        value = _safe_date_value(datetime.now().year, int(m.group("m")), int(m.group("d")))
-        month = int(m.group("m"))
-        day = int(m.group("d"))
-        return value, f"{month}월 {day}일"
-    return "", ""
+        year = int(m.group("y"))
+    else:
+        m = MONTH_DAY_RE.search(raw)
+        if not m:
+            return "", ""
+        year = datetime.now().year
+    month = int(m.group("m"))
+    day = int(m.group("d"))
+    return _safe_date_value(year, month, day), f"{month}월 {day}일"
 
 
 def _normalize_message_line(line: str) -> Dict[str, str]:
@@ -472,8 +491,8 @@ def _normalize_message_line(line: str) -> Dict[str, str]:
             sender_candidate = _collapse(prefix.split(",")[-1])
             if sender_candidate and len(sender_candidate) <= 20:
                 sender = sender_candidate
-    text = re.sub(r"^\d{4}년\s*\d{1,2}월\s*\d{1,2}일\s*(오전|오후)?\s*\d{1,2}:\d{2},?\s*", "", text)
-    text = re.sub(r"^\d{4}[./-]\d{1,2}[./-]\d{1,2}\s*(오전|오후)?\s*\d{1,2}:\d{2},?\s*", "", text)
+    text = KOREAN_STAMP_PREFIX_RE.sub("", text)
+    text = NUMERIC_STAMP_PREFIX_RE.sub("", text)
     text = _collapse(text)
     return {
         "text": text,
@@ -510,7 +529,7 @@ def _looks_like_work_item(text: str) -> bool:
         return True
     if any(pattern in lowered for pattern in ("as요청", "as접수", "요청함", "교체예정", "타이머조정", "변경 완료", "회수함", "입고")):
         return True
-    return any(keyword in normalized for keyword in WORK_REPORT_ACTION_KEYWORDS)
+    return WORK_REPORT_ACTION_KEYWORD_RE.search(normalized) is not None
 
 
 def _is_question_like_line(text: str) -> bool:
@@ -605,10 +624,10 @@ def _should_skip_context_line(text: str) -> bool:
 
 
 def _extract_tagged_pairs(text: str) -> Dict[str, str]:
-    values = [_collapse(token) for token in re.findall(r"<([^<>]*)>", str(text or "")) if _collapse(token)]
+    values = [value for value in map(_collapse, TAGGED_TOKEN_RE.findall(str(text or ""))) if value]
     pairs: Dict[str, str] = {}
     for index in range(0, len(values) - 1, 2):
-        key = re.sub(r"[\s:]+", "", values[index])
+        key = TAGGED_KEY_STRIP_RE.sub("", values[index])
         value = values[index + 1]
         if key and value:
             pairs[key] = value
@@ -643,12 +662,12 @@ def _guess_location(text: str) -> str:
 
 def _clean_item_title(text: str) -> str:
     normalized = _collapse(text)
-    normalized = re.sub(r"^(작업내용|작업|내용)\s*[:：]?\s*", "", normalized)
+    normalized = ITEM_TITLE_PREFIX_RE.sub("", normalized)
     return normalized[:120]
 
 
 def _title_key(text: str) -> str:
-    return re.sub(r"[^0-9a-z가-힣]+", "", _clean_item_title(text).lower())
+    return TITLE_KEY_STRIP_RE.sub("", _clean_item_title(text).lower())
 
 
 def _title_action_keyword(text: str) -> str:
@@ -660,13 +679,12 @@ def _title_action_keyword(text: str) -> str:
 
 
 def _title_tokens(text: str) -> set[str]:
-    stop_words = set(WORK_REPORT_ACTION_KEYWORDS) | {"작업", "민원", "사항", "업체", "요청", "접수", "완료", "예정"}
     tokens = {
         _collapse(token).lower()
-        for token in re.findall(r"\d+동|\d+호|[가-힣a-zA-Z]{2,}", _clean_item_title(text))
+        for token in TITLE_TOKEN_RE.findall(_clean_item_title(text))
         if _collapse(token)
     }
-    return {token for token in tokens if token not in stop_words}
+    return tokens - WORK_REPORT_TITLE_STOP_TOKENS
 
 
 def _titles_match(left: str, right: str) -> bool:
@@ -690,10 +708,10 @@ def _titles_match(left: str, right: str) -> bool:
 
 
 def _tagged_value(tagged: Dict[str, str], *labels: str) -> str:
-    normalized_labels = [re.sub(r"[\s:]+", "", label) for label in labels if _collapse(label)]
+    # Keys were already stripped by _extract_tagged_pairs; only the labels need it.
+    normalized_labels = [TAGGED_KEY_STRIP_RE.sub("", label) for label in labels if _collapse(label)]
     for key, value in tagged.items():
-        normalized_key = re.sub(r"[\s:]+", "", key)
-        if any(label in normalized_key for label in normalized_labels):
+        if any(label in key for label in normalized_labels):
             return _collapse(value)
     return ""
 
@@ -711,7 +729,7 @@ def _message_kind(text: str) -> str:
         return "photo_notice"
     if "파일을 보냈" in normalized or normalized.startswith("파일 ") or normalized.startswith("파일:"):
         return "file_notice"
-    if any(ext in lower for ext in WORK_REPORT_FILE_EXTENSIONS):
+    if WORK_REPORT_FILE_EXTENSION_RE.search(lower):
         return "file_notice"
     if any(keyword in normalized for keyword in ("견적서", "작업내역서", "세금계산서", "확인서")):
         return "file_notice"
@@ -747,15 +765,10 @@ def _parse_kakao_events(text: str) -> List[Dict[str, Any]]:
             date_value = _safe_date_value(message_match.group("y"), message_match.group("m"), message_match.group("d"))
             current_date = date_value or current_date
         else:
-            bracket_match = KAKAO_BRACKET_MESSAGE_RE.match(raw)
-            short_match = KAKAO_SHORT_MESSAGE_RE.match(raw)
-            if bracket_match:
-                sender = _collapse(bracket_match.group("sender"))
-                body = _collapse(bracket_match.group("body"))
-                date_value = current_date
-            elif short_match:
-                sender = _collapse(short_match.group("sender"))
-                body = _collapse(short_match.group("body"))
+            line_match = KAKAO_BRACKET_MESSAGE_RE.match(raw) or KAKAO_SHORT_MESSAGE_RE.match(raw)
+            if line_match:
+                sender = _collapse(line_match.group("sender"))
+                body = _collapse(line_match.group("body"))
                 date_value = current_date
         if not date_value:
             date_value, _ = _extract_date(body)
@@ -944,7 +957,7 @@ def _stage_label(stage: str) -> str:
 
 def _entry_time_fields(filename: str) -> Dict[str, int | str]:
     stem = _collapse(Path(str(filename or "")).stem)
-    match = re.search(r"(?P<date>\d{8})_(?P<hour>\d{2})(?P<minute>\d{2})(?P<second>\d{2})", stem)
+    match = IMAGE_FILENAME_STAMP_RE.search(stem)
     if not match:
         return {"date": "", "minute_of_day": -1, "second_of_day": -1}
     raw_date = match.group("date")
@@ -1416,6 +1429,16 @@ def _load_work_report_feedback_profile(tenant_id: str) -> Dict[str, Any]:
     }
 
 
+def _weighted_token_hits(tokens: set[str], weights: Dict[str, Any]) -> List[Tuple[str, float]]:
+    hits: List[Tuple[str, float]] = []
+    for token in tokens:
+        weight = float(weights.get(token) or 0.0)
+        if weight > 0.0:
+            hits.append((token, weight))
+    hits.sort(key=lambda hit: (-hit[1], hit[0]))
+    return hits
+
+
 def _tenant_feedback_bonus(item: Dict[str, Any], feedback_profile: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     profile = dict(feedback_profile or {})
     if int(profile.get("rows_used") or 0) <= 0:
@@ -1425,9 +1448,11 @@ def _tenant_feedback_bonus(item: Dict[str, Any], feedback_profile: Optional[Dict
         return {"bonus": 0, "positive_tokens": [], "negative_tokens": []}
     positive_map = dict(profile.get("positive_tokens") or {})
     negative_map = dict(profile.get("negative_tokens") or {})
-    positive_hits = sorted((token for token in item_tokens if float(positive_map.get(token) or 0.0) > 0.0), key=lambda token: (-float(positive_map.get(token) or 0.0), token))
-    negative_hits = sorted((token for token in item_tokens if float(negative_map.get(token) or 0.0) > 0.0), key=lambda token: (-float(negative_map.get(token) or 0.0), token))
-    raw_score = sum(float(positive_map.get(token) or 0.0) for token in positive_hits[:4]) - sum(float(negative_map.get(token) or 0.0) for token in negative_hits[:4])
+    positive_weighted = _weighted_token_hits(item_tokens, positive_map)
+    negative_weighted = _weighted_token_hits(item_tokens, negative_map)
+    positive_hits = [token for token, _ in positive_weighted]
+    negative_hits = [token for token, _ in negative_weighted]
+    raw_score = sum(weight for _, weight in positive_weighted[:4]) - sum(weight for _, weight in negative_weighted[:4])
     if raw_score >= 6.0:
         bonus = 4
     elif raw_score >= 3.0:
@@ -1715,7 +1740,11 @@ def _cluster_ranked_item_candidates(
     *,
     feedback_profile: Optional[Dict[str, Any]] = None,
 ) -> List[Tuple[int, int, str, str, List[str]]]:
-    nearby = _cluster_nearby_events(cluster, work_events)[:4]
+    nearby_events = []
+    for _, event in _cluster_nearby_events(cluster, work_events)[:4]:
+        event_text = _collapse(event.get("text") or "")
+        if event_text:
+            nearby_events.append((event_text, _title_tokens(event_text), set(_tokenize(event_text))))
     ranked: List[Tuple[int, int, str, str, List[str]]] = []
     for item in list(items or []):
         item_index = int(item.get("index") or 0)
@@ -1724,19 +1753,19 @@ def _cluster_ranked_item_candidates(
         title = _collapse(item.get("title") or "")
         location = _collapse(item.get("location_name") or "")
         keywords = _item_hint_keywords(item, limit=5)
+        title_tokens = _title_tokens(title)
+        location_tokens = set(_tokenize(location))
+        keyword_tokens = set(keywords)
         score = sum(_match_score(item, row, feedback_profile=feedback_profile) for row in list(cluster or []))
-        for _, event in nearby:
-            event_text = _collapse(event.get("text") or "")
-            if not event_text:
-                continue
+        for event_text, event_title_tokens, event_tokens in nearby_events:
             if _titles_match(title, event_text):
                 score += 8
             else:
-                score += min(4, len(_title_tokens(title) & _title_tokens(event_text)) * 2)
+                score += min(4, len(title_tokens & event_title_tokens) * 2)
             if location:
-                score += min(4, len(set(_tokenize(location)) & set(_tokenize(event_text))) * 2)
+                score += min(4, len(location_tokens & event_tokens) * 2)
             if keywords:
-                score += min(3, len(set(keywords) & set(_tokenize(event_text))))
+                score += min(3, len(keyword_tokens & event_tokens))
         if score > 0:
             ranked.append((score, item_index, title, location, keywords))
     ranked.sort(key=lambda row: (-row[0], row[1]))
@@ -2255,35 +2284,7 @@ def _openai_image_url(entry: Dict[str, Any]) -> str:
     return f"data:{mime};base64,{base64.b64encode(payload).decode('ascii')}"
 
 
-def _openai_work_report(
-    *,
-    text: str,
-    image_inputs: List[Dict[str, Any]],
-    reference_image_inputs: List[Dict[str, Any]] | None,
-    attachment_inputs: List[Dict[str, Any]],
-    sample_title: str,
-    sample_lines: Sequence[str],
-    feedback_profile: Optional[Dict[str, Any]] = None,
-) -> Dict[str, Any] | None:
-    client, model = _openai_client(default_model="gpt-5.4", env_name="WORK_REPORT_OPENAI_MODEL")
-    if not client:
-        return None
-    timeout_sec = _float_env("WORK_REPORT_OPENAI_TIMEOUT_SEC", DEFAULT_WORK_REPORT_OPENAI_TIMEOUT_SEC)
-    client = client.with_options(timeout=timeout_sec, max_retries=0)
-    reasoning_effort = _str_env("WORK_REPORT_OPENAI_REASONING_EFFORT", "medium" if model.startswith("gpt-5") else "")
-    candidate_lines: List[str] = []
-    for position, event in enumerate(_parse_kakao_events(text), start=1):
-        candidate_text = _collapse(event.get("text") or "")
-        if not _looks_like_work_item(candidate_text):
-            continue
-        candidate_lines.append(
-            f"- #{position} / {event.get('date_label') or event.get('date') or '-'} / {event.get('sender') or '-'} / {candidate_text}"
-        )
-        if len(candidate_lines) >= 80:
-            break
-    text_excerpt = _openai_text_excerpt(text)
-    few_shot_lines = _feedback_few_shot_lines(feedback_profile, limit=4)
-    prompt = """
+WORK_REPORT_OPENAI_PROMPT = """
 너는 아파트 관리사무소 시설팀의 주요업무보고서를 만드는 도우미다.
 입력으로 카카오톡 단체방 대화, 현장 사진, 첨부파일 목록, 샘플 보고서 개요가 들어온다.
 
@@ -2350,6 +2351,37 @@ def _openai_work_report(
 - 잘못된 매칭보다 보수적인 매칭이 낫다. 확신이 낮으면 unmatched로 남기고 analysis_notice에 적는다.
 - 최근 사람 검토 예시가 주어지면 같은 단지에서 실제로 수정·확정된 사례로 보고 참고하되, 현재 입력 근거가 더 분명하면 현재 입력을 우선한다.
 """.strip()
+
+
+def _openai_work_report(
+    *,
+    text: str,
+    image_inputs: List[Dict[str, Any]],
+    reference_image_inputs: List[Dict[str, Any]] | None,
+    attachment_inputs: List[Dict[str, Any]],
+    sample_title: str,
+    sample_lines: Sequence[str],
+    feedback_profile: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any] | None:
+    client, model = _openai_client(default_model="gpt-5.4", env_name="WORK_REPORT_OPENAI_MODEL")
+    if not client:
+        return None
+    timeout_sec = _float_env("WORK_REPORT_OPENAI_TIMEOUT_SEC", DEFAULT_WORK_REPORT_OPENAI_TIMEOUT_SEC)
+    client = client.with_options(timeout=timeout_sec, max_retries=0)
+    reasoning_effort = _str_env("WORK_REPORT_OPENAI_REASONING_EFFORT", "medium" if model.startswith("gpt-5") else "")
+    candidate_lines: List[str] = []
+    for position, event in enumerate(_parse_kakao_events(text), start=1):
+        candidate_text = _collapse(event.get("text") or "")
+        if not _looks_like_work_item(candidate_text):
+            continue
+        candidate_lines.append(
+            f"- #{position} / {event.get('date_label') or event.get('date') or '-'} / {event.get('sender') or '-'} / {candidate_text}"
+        )
+        if len(candidate_lines) >= 80:
+            break
+    text_excerpt = _openai_text_excerpt(text)
+    few_shot_lines = _feedback_few_shot_lines(feedback_profile, limit=4)
+    prompt = WORK_REPORT_OPENAI_PROMPT
     content: List[Dict[str, Any]] = [{"type": "input_text", "text": prompt}]
     if sample_title or sample_lines:
         sample_excerpt = "\n".join(_collapse(line) for line in list(sample_lines)[:20] if _collapse(line))
@@ -2549,6 +2581,34 @@ def _openai_work_report(
     }
 
 
+WORK_REPORT_OPENAI_IMAGE_MATCH_PROMPT = """
+너는 이미 추출된 시설팀 작업 항목에 현장 사진 군집을 매칭하는 도우미다.
+작업 항목 목록은 이미 확정되었다. 새 작업 항목을 만들지 말고, 각 사진 군집(Cn)을 가장 알맞은 작업 항목(Tn) 하나에만 매칭하거나 unmatched로 남겨라.
+반드시 JSON으로만 답한다.
+
+출력 형식:
+{
+  "cluster_matches": [
+    {"cluster_index": 1, "item_index": 2, "confidence": "high"}
+  ],
+  "unmatched_cluster_indexes": [3],
+  "analysis_notice": ""
+}
+
+규칙:
+- cluster_index와 item_index는 제공된 번호만 사용한다.
+- 하나의 군집은 하나의 작업 항목에만 매칭한다.
+- 확신이 낮으면 unmatched_cluster_indexes로 남긴다.
+- 실제 이미지 내용, 파일명의 촬영시각, 같은 시각대 연속 촬영 여부, 근접 대화 후보를 함께 본다.
+- 군집 설명에 우선후보 Tn이 있으면 먼저 검토하되, 실제 시각 정보가 명백히 다르면 따르지 않아도 된다.
+- 비슷한 작업명이 여러 개면 동/위치/사물 종류가 더 구체적으로 맞는 항목을 우선한다.
+- title이 비슷해도 배경, 창호, 조명 종류, 자전거/습득물/키패드처럼 보이는 핵심 물체가 다르면 다른 작업으로 본다.
+- 군집 안 여러 장이 같은 장소의 연속 상태를 보여주면 한 항목 안에서 before/during/after 흐름으로 이어질 수 있는 작업을 우선한다.
+- 매칭이 약한데 억지로 붙이지 말고 unmatched로 둔다.
+- 최근 사람 검토 예시가 주어지면 같은 단지에서 실제로 수정·확정된 사례로 보고 참고하되, 현재 군집 근거가 더 분명하면 현재 근거를 우선한다.
+""".strip()
+
+
 def _openai_match_image_chunks(
     *,
     text: str,
@@ -2593,43 +2653,12 @@ def _openai_match_image_chunks(
     if len(items) >= 80:
         max_item_context = 12
 
-    prompt = """
-너는 이미 추출된 시설팀 작업 항목에 현장 사진 군집을 매칭하는 도우미다.
-작업 항목 목록은 이미 확정되었다. 새 작업 항목을 만들지 말고, 각 사진 군집(Cn)을 가장 알맞은 작업 항목(Tn) 하나에만 매칭하거나 unmatched로 남겨라.
-반드시 JSON으로만 답한다.
-
-출력 형식:
-{
-  "cluster_matches": [
-    {"cluster_index": 1, "item_index": 2, "confidence": "high"}
-  ],
-  "unmatched_cluster_indexes": [3],
-  "analysis_notice": ""
-}
-
-규칙:
-- cluster_index와 item_index는 제공된 번호만 사용한다.
-- 하나의 군집은 하나의 작업 항목에만 매칭한다.
-- 확신이 낮으면 unmatched_cluster_indexes로 남긴다.
-- 실제 이미지 내용, 파일명의 촬영시각, 같은 시각대 연속 촬영 여부, 근접 대화 후보를 함께 본다.
-- 군집 설명에 우선후보 Tn이 있으면 먼저 검토하되, 실제 시각 정보가 명백히 다르면 따르지 않아도 된다.
-- 비슷한 작업명이 여러 개면 동/위치/사물 종류가 더 구체적으로 맞는 항목을 우선한다.
-- title이 비슷해도 배경, 창호, 조명 종류, 자전거/습득물/키패드처럼 보이는 핵심 물체가 다르면 다른 작업으로 본다.
-- 군집 안 여러 장이 같은 장소의 연속 상태를 보여주면 한 항목 안에서 before/during/after 흐름으로 이어질 수 있는 작업을 우선한다.
-- 매칭이 약한데 억지로 붙이지 말고 unmatched로 둔다.
-- 최근 사람 검토 예시가 주어지면 같은 단지에서 실제로 수정·확정된 사례로 보고 참고하되, 현재 군집 근거가 더 분명하면 현재 근거를 우선한다.
-""".strip()
+    prompt = WORK_REPORT_OPENAI_IMAGE_MATCH_PROMPT
 
     cluster_batches = _chunk_rows(clusters, max_clusters)
     total_batches = max(1, len(cluster_batches))
 
-    for batch_number, batch_clusters in enumerate(cluster_batches, start=1):
-        _report_progress(
-            progress_callback,
-            current_step=3,
-            summary=f"이미지 군집 {batch_number}/{total_batches}개를 매칭하고 있습니다.",
-            hint="대량 이미지는 군집 단위로 나눠 작업 항목과 연결합니다.",
-        )
+    def _match_batch(batch_clusters: List[List[Dict[str, Any]]]) -> Tuple[Dict[str, Any] | None, Dict[str, str]]:
         content: List[Dict[str, Any]] = [{"type": "input_text", "text": prompt}]
         batch_items = _batch_candidate_items(
             batch_clusters,
@@ -2693,63 +2722,84 @@ def _openai_match_image_chunks(
             timeout_sec=timeout_sec,
             reasoning_effort=reasoning_effort,
         )
-
-        matched_local_indexes: set[int] = set()
-        unmatched_local_indexes: set[int] = set()
         if isinstance(raw_data, dict):
-            for row in raw_data.get("cluster_matches") or []:
-                if not isinstance(row, dict):
-                    continue
-                local_index = int(row.get("cluster_index") or 0)
-                item_index = int(row.get("item_index") or 0)
-                if local_index <= 0 or local_index > len(batch_clusters) or local_index in matched_local_indexes:
-                    continue
-                if item_index not in assigned_rows:
-                    continue
-                cluster = batch_clusters[local_index - 1]
-                for cluster_row in cluster:
-                    assigned_rows[item_index].append(dict(cluster_row))
-                matched_local_indexes.add(local_index)
-            unmatched_local_indexes = {
-                int(value)
-                for value in raw_data.get("unmatched_cluster_indexes") or []
-                if str(value).isdigit() and 0 < int(value) <= len(batch_clusters)
-            }
-            notice = _collapse(raw_data.get("analysis_notice") or "")
-            if notice:
-                _append_unique_note(analysis_notes, notice)
-        else:
-            snapshot = _consume_openai_error_snapshot()
-            if snapshot.get("notice"):
-                _append_unique_note(analysis_notes, snapshot["notice"])
-            if any(snapshot.values()):
-                openai_failures.append(
-                    {
-                        "stage": f"image_batch_{batch_number}",
-                        "reason": _collapse(snapshot.get("reason") or ""),
-                        "notice": _collapse(snapshot.get("notice") or ""),
-                        "details": _collapse(snapshot.get("details") or ""),
-                    }
-                )
-            _append_unique_note(analysis_notes, f"이미지 배치 {batch_number}건은 AI 응답이 불안정해 보수적으로 재배치했습니다.")
-
-        pending_local_indexes = set(range(1, len(batch_clusters) + 1)) - matched_local_indexes - unmatched_local_indexes
-        if pending_local_indexes:
-            for local_index in sorted(pending_local_indexes):
-                cluster = batch_clusters[local_index - 1]
-                fallback_item_index = _best_item_index_for_cluster(items, cluster, feedback_profile=feedback_profile)
-                if fallback_item_index and fallback_item_index in assigned_rows:
+            return raw_data, {}
+        return None, _consume_openai_error_snapshot()
+
+    concurrency = min(total_batches, _int_env("WORK_REPORT_OPENAI_IMAGE_MATCH_CONCURRENCY", WORK_REPORT_OPENAI_IMAGE_MATCH_CONCURRENCY, minimum=1))
+    # Cluster batches are independent requests; run them side by side and fold the answers back in batch order.
+    executor = ThreadPoolExecutor(max_workers=concurrency) if concurrency > 1 else None
+    try:
+        pending_batches = [
+            executor.submit(copy_context().run, _match_batch, batch_clusters) if executor else None
+            for batch_clusters in cluster_batches
+        ]
+        for batch_number, (batch_clusters, pending) in enumerate(zip(cluster_batches, pending_batches), start=1):
+            _report_progress(
+                progress_callback,
+                current_step=3,
+                summary=f"이미지 군집 {batch_number}/{total_batches}개를 매칭하고 있습니다.",
+                hint="대량 이미지는 군집 단위로 나눠 작업 항목과 연결합니다.",
+            )
+            raw_data, snapshot = pending.result() if pending else _match_batch(batch_clusters)
+            matched_local_indexes: set[int] = set()
+            unmatched_local_indexes: set[int] = set()
+            if isinstance(raw_data, dict):
+                for row in raw_data.get("cluster_matches") or []:
+                    if not isinstance(row, dict):
+                        continue
+                    local_index = int(row.get("cluster_index") or 0)
+                    item_index = int(row.get("item_index") or 0)
+                    if local_index <= 0 or local_index > len(batch_clusters) or local_index in matched_local_indexes:
+                        continue
+                    if item_index not in assigned_rows:
+                        continue
+                    cluster = batch_clusters[local_index - 1]
                     for cluster_row in cluster:
-                        assigned_rows[fallback_item_index].append(dict(cluster_row))
-                else:
-                    unmatched_local_indexes.add(local_index)
-            if raw_data is None:
-                _append_unique_note(analysis_notes, f"이미지 배치 {batch_number}의 남은 군집은 파일명/문맥 점수로만 보수 매칭했습니다.")
-        for local_index in unmatched_local_indexes:
-            for cluster_row in batch_clusters[local_index - 1]:
-                image_index = int(cluster_row.get("index") or 0)
-                if image_index > 0:
-                    unmatched_image_indexes.add(image_index)
+                        assigned_rows[item_index].append(dict(cluster_row))
+                    matched_local_indexes.add(local_index)
+                unmatched_local_indexes = {
+                    int(value)
+                    for value in raw_data.get("unmatched_cluster_indexes") or []
+                    if str(value).isdigit() and 0 < int(value) <= len(batch_clusters)
+                }
+                notice = _collapse(raw_data.get("analysis_notice") or "")
+                if notice:
+                    _append_unique_note(analysis_notes, notice)
+            else:
+                if snapshot.get("notice"):
+                    _append_unique_note(analysis_notes, snapshot["notice"])
+                if any(snapshot.values()):
+                    openai_failures.append(
+                        {
+                            "stage": f"image_batch_{batch_number}",
+                            "reason": _collapse(snapshot.get("reason") or ""),
+                            "notice": _collapse(snapshot.get("notice") or ""),
+                            "details": _collapse(snapshot.get("details") or ""),
+                        }
+                    )
+                _append_unique_note(analysis_notes, f"이미지 배치 {batch_number}건은 AI 응답이 불안정해 보수적으로 재배치했습니다.")
+
+            pending_local_indexes = set(range(1, len(batch_clusters) + 1)) - matched_local_indexes - unmatched_local_indexes
+            if pending_local_indexes:
+                for local_index in sorted(pending_local_indexes):
+                    cluster = batch_clusters[local_index - 1]
+                    fallback_item_index = _best_item_index_for_cluster(items, cluster, feedback_profile=feedback_profile)
+                    if fallback_item_index and fallback_item_index in assigned_rows:
+                        for cluster_row in cluster:
+                            assigned_rows[fallback_item_index].append(dict(cluster_row))
+                    else:
+                        unmatched_local_indexes.add(local_index)
+                if raw_data is None:
+                    _append_unique_note(analysis_notes, f"이미지 배치 {batch_number}의 남은 군집은 파일명/문맥 점수로만 보수 매칭했습니다.")
+            for local_index in unmatched_local_indexes:
+                for cluster_row in batch_clusters[local_index - 1]:
+                    image_index = int(cluster_row.get("index") or 0)
+                    if image_index > 0:
+                        unmatched_image_indexes.add(image_index)
+    finally:
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     assigned_indexes = {
         int(row.get("index") or 0)
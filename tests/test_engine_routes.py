@@ -1855,6 +1855,13 @@ def test_complaint_filters_and_admin_only_delete(app_client) -> None:
     assert filtered_items[0]["status"] == "접수"
     assert filtered_items[0]["building"] == "101"
 
+    searched = client.get("/api/complaints?tenant_id=ys_thesharp&query=주차 문제")
+    assert searched.status_code == 200
+    assert [item["id"] for item in searched.json()["items"]] == [second_id]
+    short_searched = client.get("/api/complaints?tenant_id=ys_thesharp&query=누수")
+    assert short_searched.status_code == 200
+    assert [item["id"] for item in short_searched.json()["items"]] == [first_id]
+
     created_user = client.post(
         "/api/users",
         json={
@@ -2390,6 +2397,93 @@ def test_facility_asset_list_supports_keyword_search_and_filters(app_client) ->
     assert [item["asset_code"] for item in by_qr.json()["items"]] == ["ELV-A-25"]
 
 
+def test_facility_asset_images_support_upload_primary_switch_and_delete(app_client) -> None:
+    client = app_client
+    _bootstrap_admin_and_tenant(client)
+
+    asset = client.post(
+        "/api/facility/assets",
+        json={
+            "tenant_id": "ys_thesharp",
+            "asset_code": "ELV-A-25",
+            "asset_name": "상가A동 25호기 승강기",
+            "category": "승강기",
+        },
+    )
+    assert asset.status_code == 200
+    asset_id = int(asset.json()["item"]["id"])
+
+    first = client.post(
+        f"/api/facility/assets/{asset_id}/images?tenant_id=ys_thesharp",
+        files={"file": ("front.png", io.BytesIO(b"fake-image-1"), "image/png")},
+    )
+    assert first.status_code == 200
+    second = client.post(
+        f"/api/facility/assets/{asset_id}/images?tenant_id=ys_thesharp",
+        files={"file": ("side.jpg", io.BytesIO(b"fake-image-22"), "image/jpeg")},
+    )
+    assert second.status_code == 200
+    item = second.json()["item"]
+    assert len(item["images"]) == 2
+    first_image, second_image = item["images"]
+    assert first_image["is_primary"] == 1
+    assert second_image["is_primary"] == 0
+    assert item["image_url"] == first_image["image_url"]
+
+    switched = client.patch(
+        f"/api/facility/assets/{asset_id}/images/{second_image['id']}/primary?tenant_id=ys_thesharp"
+    )
+    assert switched.status_code == 200
+    item = switched.json()["item"]
+    assert [image["id"] for image in item["images"]] == [second_image["id"], first_image["id"]]
+    assert [image["sort_order"] for image in item["images"]] == [0, 1]
+    assert item["image_url"] == second_image["image_url"]
+    assert item["image_mime_type"] == "image/jpeg"
+    assert item["image_size_bytes"] == len(b"fake-image-22")
+
+    deleted = client.delete(f"/api/facility/assets/{asset_id}/images/{second_image['id']}?tenant_id=ys_thesharp")
+    assert deleted.status_code == 200
+    item = deleted.json()["item"]
+    assert [image["id"] for image in item["images"]] == [first_image["id"]]
+    assert item["images"][0]["is_primary"] == 1
+    assert item["image_url"] == first_image["image_url"]
+    assert item["image_mime_type"] == "image/png"
+
+
+def test_upload_downloads_use_x_accel_redirect_when_prefix_is_set(app_client, tmp_path, monkeypatch) -> None:
+    client = app_client
+    _bootstrap_admin_and_tenant(client)
+    core = sys.modules["app.routes.core"]
+    monkeypatch.setattr(core, "X_ACCEL_REDIRECT_PREFIX", "/_protected")
+
+    asset = client.post(
+        "/api/facility/assets",
+        json={"tenant_id": "ys_thesharp", "asset_code": "ELV-A-25", "asset_name": "상가A동 25호기 승강기", "category": "승강기"},
+    )
+    assert asset.status_code == 200
+    asset_id = int(asset.json()["item"]["id"])
+    uploaded = client.post(
+        f"/api/facility/assets/{asset_id}/images?tenant_id=ys_thesharp",
+        files={"file": ("front.png", io.BytesIO(b"fake-image-1"), "image/png")},
+    )
+    assert uploaded.status_code == 200
+    image_url = uploaded.json()["item"]["image_url"]
+    filename = image_url.rsplit("/", 1)[-1]
+
+    redirected = client.get(image_url)
+    assert redirected.status_code == 200
+    assert redirected.headers["x-accel-redirect"] == f"/_protected/facility-assets/ys_thesharp/{filename}"
+    assert redirected.headers["content-type"] == "image/png"
+    assert redirected.content == b""
+
+    outside = tmp_path / "outside.txt"
+    outside.write_bytes(b"outside-uploads")
+    request = core.Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+    response = core._file_response(request, outside)
+    assert isinstance(response, core.FileResponse)
+    assert "x-accel-redirect" not in response.headers
+
+
 def test_document_numbering_config_is_tenant_configurable(app_client) -> None:
     client = app_client
     _bootstrap_admin_and_tenant(client)